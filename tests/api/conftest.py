@@ -0,0 +1,168 @@
+import threading
+import warnings
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.api import cassette as cassettes
+from src.api.api_client import APIClient
+from src.api.cleanup import CleanupRegistry
+from src.api.local_server import LocalBenefitsServer
+from src.api.namespace import DataNamespace
+from src.api.pool import EmployeePool
+from src.api.schema import get_employee_validator
+from src.configs import api_configs
+
+pytest_plugins = ["src.plugins.api_timing", "src.plugins.api_cassette"]
+
+
+def pytest_addoption(parser):
+    parser.addoption("--local-api", action="store_true", default=False,
+                     help="Run the API suite against the in-process Benefits API stand-in.")
+
+
+@pytest.fixture(scope="session")
+def local_api():
+    """
+    Starts the local Benefits API stand-in for the session.
+    Point a client at it with APIClient(base_url=local_api.base_url).
+    It is not the server --local-api points the suite at, so tests may clear
+    its store without racing the session fixtures' pool and cleanup.
+    """
+    with LocalBenefitsServer() as server:
+        yield server
+
+
+class FlakyHandler(BaseHTTPRequestHandler):
+    """Answers 503 to the first `failures` requests and 200 afterwards."""
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        self.server.calls += 1
+        status = 503 if self.server.calls <= self.server.failures else 200
+        body = b"[]"
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture(scope="function")
+def flaky_server():
+    """
+    HTTP server answering 503 to the first two requests and 200 afterwards.
+    Set `failures` on it to change how many requests fail.
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FlakyHandler)
+    server.calls = 0
+    server.failures = 2
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def api_base_url(request):
+    """
+    Base URL used by clients created without one.
+    With --local-api every APIClient() targets the local stand-in.
+    """
+    if not request.config.getoption("--local-api"):
+        yield api_configs.BASE_URL
+        return
+    with LocalBenefitsServer() as server:
+        previous = api_configs.BASE_URL
+        api_configs.BASE_URL = server.base_url
+        yield server.base_url
+        api_configs.BASE_URL = previous
+
+
+def _data_namespace(name):
+    """
+    A random namespace. Under --api-cassette a recording stores its token in
+    the cassette and a replay reuses it, so the request bodies repeat exactly
+    while concurrent recordings against the live account never share one.
+    """
+    cassette = cassettes.get_global_cassette()
+    if cassette is None:
+        return DataNamespace()
+    key = f"namespace.{name}"
+    if cassette.mode == cassettes.REPLAY:
+        if key not in cassette.meta:
+            raise cassettes.CassetteError(
+                f"No {key} token in {cassette.path}, record the cassette again.")
+        return DataNamespace(token=cassette.meta[key])
+    namespace = DataNamespace()
+    cassette.meta[key] = namespace.token
+    return namespace
+
+
+@pytest.fixture(scope="session")
+def employee_validator():
+    """Employee response validator compiled from docs/swagger.json once per session."""
+    return get_employee_validator()
+
+
+@pytest.fixture(scope="session")
+def namespace():
+    """
+    Username namespace of this worker and session.
+    Tests create employees through it so parallel workers never touch each other's data.
+    """
+    return _data_namespace("tests")
+
+
+@pytest.fixture(scope="session")
+def api_client(api_base_url):
+    """
+    Client shared by the session fixtures; its bulk worker threads are
+    stopped when the session ends.
+    """
+    with APIClient() as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+def employee_pool(api_client):
+    """
+    Employees provisioned once per session and shared by the tests.
+    Everything is deleted in one batch when the session ends.
+    """
+    pool = EmployeePool(api_client, namespace=_data_namespace("pool"))
+    yield pool
+    problems = pool.close()
+    if problems:
+        warnings.warn(pytest.PytestWarning(f"{len(problems)} pooled employees were not returned cleanly: {problems}"))
+
+
+@pytest.fixture(scope="session")
+def cleanup(api_client):
+    """
+    Deletes the employees tests register, in the background or in one batch
+    when the session ends. Records that could not be deleted are reported.
+    """
+    registry = CleanupRegistry(api_client)
+    yield registry
+    leaked = registry.close()
+    if leaked:
+        warnings.warn(pytest.PytestWarning(f"{len(leaked)} employees could not be deleted: {leaked}"))
+
+
+@pytest.fixture(scope="function")
+def pooled_employee(employee_pool):
+    """A pooled employee for tests that only read it, shared with other readers."""
+    with employee_pool.read_only() as employee:
+        yield employee
+
+
+@pytest.fixture(scope="function")
+def leased_employee(employee_pool):
+    """A pooled employee the test may update or delete, restored afterwards."""
+    with employee_pool.lease() as employee:
+        yield employee
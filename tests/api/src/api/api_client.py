@@ -1,37 +1,175 @@
+import functools
 import requests
+import threading
 import uuid
-import json
+from concurrent.futures import ThreadPoolExecutor
+from src.api import cassette as cassettes, instrumentation, serialization, throttle as throttles, transport
 from src.api.employee import Employee
+from src.api.streaming import iter_json_array
+from src.configs import api_configs
 
-URL = "https://wmxrwq14uc.execute-api.us-east-1.amazonaws.com/Prod"
+URL = api_configs.DEFAULT_URL
+DEFAULT_BULK_WORKERS = 10
+
+
+class BulkResult:
+    """
+    Ordered outcome of a bulk operation.
+
+    results[i] holds the Response for items[i], or the exception raised while
+    sending it. A failure never stops the rest of the batch.
+    """
+
+    def __init__(self, items, results):
+        self.items = items
+        self.results = results
+
+    def __iter__(self):
+        return iter(self.results)
+
+    def __len__(self):
+        return len(self.results)
+
+    def __getitem__(self, index):
+        return self.results[index]
+
+    @property
+    def responses(self):
+        """Responses in item order, None where the request raised."""
+        return [r if isinstance(r, requests.Response) else None for r in self.results]
+
+    @property
+    def failures(self):
+        """(index, item, error) for every item that raised or got a non 2xx status."""
+        return [(i, item, result) for i, (item, result) in enumerate(zip(self.items, self.results))
+                if not isinstance(result, requests.Response) or not result.ok]
+
+    @property
+    def ok(self):
+        return not self.failures
 
 
 class APIClient:
     """
     API client for Paylocity Benefits, following the Page Object Model (POM) pattern.
+
+    Pass an EmployeeCache as `cache` to serve repeated GETs from memory; writes
+    made through this client keep the cached entries up to date.
+
+    Clients share a pooled, retrying session per TransportConfig, so keep-alive
+    connections are reused across instances. Pass `session` to opt out.
+
+    Pass a RequestRecorder as `recorder` (or call instrumentation.enable()) to
+    record DNS/connect/headers/total timings and payload sizes of every call.
+
+    Pass a Cassette as `cassette` to record every call to disk, or to replay
+    recorded calls without touching the network. cassette.enable() does the
+    same for every client created without an explicit base_url, i.e. every
+    client of the configured Benefits API.
+
+    Pass an AdaptiveThrottle as `throttle` (or call throttle.enable()) to keep
+    the request rate and concurrency within what the service sustains.
+
+    Bulk calls run on worker threads kept by the client; call close() to stop them,
+    or use the client as a context manager. A bulk call with more workers than
+    the session has pooled connections moves the client to its own, larger
+    session, leaving the shared one as it is.
     """
 
-    def __init__(self, base_url=URL, api_key="VGVzdFVzZXI3ODg6TD99JzVtaUIvbl05"):
-        self.base_url = base_url
-        self.session = requests.Session()
+    def __init__(self, base_url=None, api_key="VGVzdFVzZXI3ODg6TD99JzVtaUIvbl05", cache=None,
+                 transport_config=None, session=None, recorder=None, cassette=None,
+                 throttle=None):
+        self.base_url = base_url or api_configs.BASE_URL
+        self._configured_service = base_url is None
+        self.session = session or transport.get_session(transport_config)
         self.api_key = api_key
+        self.cache = cache
+        self.recorder = recorder
+        self.cassette = cassette
+        self.throttle = throttle
+        self._executors = {}
+        self._executors_lock = threading.Lock()
+        self._unsized_session = None
+        self._resized_sessions = []
 
-    def _get_headers(self):
-        """Helper method to get standard headers, including authentication."""
-        return {
+    @property
+    def api_key(self):
+        return self._api_key
+
+    @api_key.setter
+    def api_key(self, value):
+        self._api_key = value
+        # Headers never change between calls, build them once per key
+        self._headers = {
             "Content-Type": "application/json",
-            "Authorization": f"Basic {self.api_key}"
+            "Authorization": f"Basic {value}"
         }
 
-    def get_all_employees(self):
+    def _get_headers(self):
+        """Helper method to get standard headers, including authentication."""
+        return self._headers
+
+    def _request(self, method, path, data=None, stream=False):
+        """
+        Sends a request to base_url + path, timing it when instrumentation is on.
+        With a cassette the call is recorded, or replayed instead of being sent.
+        Only calls that reach the network go through the throttle, which then
+        also retries them instead of the transport.
+        """
+        url = f"{self.base_url}{path}"
+        throttle = self.throttle if self.throttle is not None else throttles.get_global_throttle()
+        session = self.session
+
+        def send():
+            return session.request(method, url, headers=self._headers, data=data, stream=stream)
+
+        if throttle is not None:
+            # The throttle retries itself, so that it sees and paces every attempt
+            def send_unretried(send=send):
+                with transport.unretried():
+                    return send()
+
+            send = functools.partial(throttle.call, send_unretried, retry=method in transport.RETRIED_METHODS)
+
+        cassette = self.cassette
+        if cassette is None and self._configured_service:
+            cassette = cassettes.get_global_cassette()
+        if cassette is not None:
+            send = functools.partial(cassette.send, send, method, path, data, url)
+
+        recorder = self.recorder if self.recorder is not None else instrumentation.get_global_recorder()
+        if recorder is None:
+            return send()
+        return recorder.measure(send, method, path, len(data) if data else 0, stream)
+
+    def get_all_employees(self, use_cache=True):
         """
         Gets all employees from the API.
         GET /api/Employees
+        Set use_cache=False to read straight from the server.
         """
-        url = f"{self.base_url}/api/Employees"
-        response = self.session.get(url, headers=self._get_headers())
+        if self.cache is not None and use_cache:
+            cached = self.cache.get_list()
+            if cached is not None:
+                return cached
+        response = self._request("GET", "/api/Employees")
+        if self.cache is not None and response.status_code == 200:
+            self.cache.put_list(response)
         return response
 
+    def iter_employees(self, as_objects=False, chunk_size=64 * 1024):
+        """
+        Streams all employees from the API, one at a time.
+        GET /api/Employees
+        The body is parsed incrementally, so memory stays flat for any roster
+        size. Yields raw dicts, or Employee objects when as_objects is set.
+        Raises requests.HTTPError on a non 2xx response.
+        """
+        with self._request("GET", "/api/Employees", stream=True) as response:
+            response.raise_for_status()
+            for item in iter_json_array(response.iter_content(chunk_size=chunk_size)):
+                yield Employee.from_dict(item) if as_objects else item
+
     def create_employee(self, employee, only_set_required=False):
         """
         Creates a new employee.
@@ -39,28 +177,30 @@ class APIClient:
         """
         if not isinstance(employee, Employee):
             raise TypeError("Input must be an instance of the Employee class.")
-        url = f"{self.base_url}/api/Employees"
-        headers = self._get_headers()
-        if only_set_required:
-            payload = json.dumps(employee.required_fields_to_dict())
-        else:
-            payload = json.dumps(employee.to_dict())
-        response = self.session.post(url, headers=headers, data=payload)
+        payload = serialization.encode_employee(employee, only_required=only_set_required)
+        response = self._request("POST", "/api/Employees", data=payload)
+        self._refresh_cache(response)
         return response
 
-    def get_employee_by_id(self, employee_id):
+    def get_employee_by_id(self, employee_id, use_cache=True):
         """
         Gets a single employee by their ID.
         GET /api/Employees/{id}
+        Set use_cache=False to read straight from the server.
         """
         if not isinstance(employee_id, str):
             raise TypeError("Employee ID must be a string.")
+        if self.cache is not None and use_cache:
+            cached = self.cache.get_employee(employee_id)
+            if cached is not None:
+                return cached
         # try:
         #     uuid.UUID(employee_id, version=4)
         # except ValueError:
         #     raise ValueError("Employee ID must be a valid UUID.")
-        url = f"{self.base_url}/api/Employees/{employee_id}"
-        response = self.session.get(url, headers=self._get_headers())
+        response = self._request("GET", f"/api/Employees/{employee_id}")
+        if self.cache is not None and response.status_code == 200:
+            self.cache.put_employee(employee_id, response)
         return response
 
     def update_employee(self, employee):
@@ -70,10 +210,11 @@ class APIClient:
         """
         if not isinstance(employee, Employee):
             raise TypeError("Input must be an instance of the Employee class.")
-        url = f"{self.base_url}/api/Employees"
-        headers = self._get_headers()
-        payload = json.dumps(employee.to_dict())
-        response = self.session.put(url, headers=headers, data=payload)
+        payload = serialization.encode_employee(employee)
+        response = self._request("PUT", "/api/Employees", data=payload)
+        if self.cache is not None and employee.id:
+            self.cache.invalidate_employee(employee.id)
+        self._refresh_cache(response)
         return response
 
     def delete_employee_by_id(self, employee_id):
@@ -87,6 +228,98 @@ class APIClient:
             uuid.UUID(employee_id, version=4)
         except ValueError:
             raise ValueError("Employee ID must be a valid UUID.")
-        url = f"{self.base_url}/api/Employees/{employee_id}"
-        response = self.session.delete(url, headers=self._get_headers())
+        response = self._request("DELETE", f"/api/Employees/{employee_id}")
+        if self.cache is not None:
+            self.cache.invalidate_employee(employee_id)
+            self.cache.invalidate_list()
         return response
+
+    def connection_stats(self):
+        """Returns request, opened and reused connection counts for this client's session."""
+        return transport.session_stats(self.session)
+
+    def _refresh_cache(self, response):
+        """Drops the list snapshot and caches the employee returned by a write."""
+        if self.cache is None:
+            return
+        self.cache.invalidate_list()
+        if response.status_code == 200:
+            try:
+                employee_id = response.json().get("id")
+            except (ValueError, AttributeError):
+                return
+            if employee_id:
+                self.cache.put_employee(employee_id, response)
+
+    def _executor(self, max_workers):
+        """The client's bulk executor of max_workers threads, created on first use."""
+        with self._executors_lock:
+            executor = self._executors.get(max_workers)
+            if executor is None:
+                # One pooled connection per worker, or the extra workers open
+                # connections the pool then discards
+                if transport.pool_maxsize(self.session) < max_workers:
+                    if self._unsized_session is None:
+                        self._unsized_session = self.session
+                    self.session = transport.resized_session(self.session, max_workers)
+                    self._resized_sessions.append(self.session)
+                executor = self._executors[max_workers] = ThreadPoolExecutor(
+                    max_workers=max_workers, thread_name_prefix="api-bulk")
+            return executor
+
+    def _fan_out(self, operation, items, max_workers):
+        def call(item):
+            try:
+                return operation(item)
+            except Exception as e:
+                return e
+
+        items = list(items)
+        if not items:
+            return BulkResult(items, [])
+        results = list(self._executor(max_workers).map(call, items))
+        return BulkResult(items, results)
+
+    def close(self):
+        """
+        Stops the bulk worker threads and closes the sessions resized for them.
+        The client goes back to the session it was built with, which stays open
+        for other clients.
+        """
+        with self._executors_lock:
+            executors, self._executors = list(self._executors.values()), {}
+            resized, self._resized_sessions = self._resized_sessions, []
+            if self._unsized_session is not None:
+                self.session, self._unsized_session = self._unsized_session, None
+        for executor in executors:
+            executor.shutdown(wait=True)
+        for session in resized:
+            session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def create_employees(self, employees, only_set_required=False, max_workers=DEFAULT_BULK_WORKERS):
+        """
+        Creates many employees concurrently.
+        POST /api/Employees for every item, results returned in input order.
+        """
+        return self._fan_out(lambda employee: self.create_employee(employee, only_set_required),
+                             employees, max_workers)
+
+    def update_employees(self, employees, max_workers=DEFAULT_BULK_WORKERS):
+        """
+        Updates many employees concurrently.
+        PUT /api/Employees for every item, results returned in input order.
+        """
+        return self._fan_out(self.update_employee, employees, max_workers)
+
+    def delete_employees(self, employee_ids, max_workers=DEFAULT_BULK_WORKERS):
+        """
+        Deletes many employees concurrently.
+        DELETE /api/Employees/{id} for every id, results returned in input order.
+        """
+        return self._fan_out(self.delete_employee_by_id, employee_ids, max_workers)
@@ -0,0 +1,110 @@
+import asyncio
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from src.api.api_client import APIClient
+from src.api.transport import TransportConfig
+
+DEFAULT_MAX_CONCURRENCY = 10
+
+
+class AsyncAPIClient:
+    """
+    Asyncio flavour of APIClient for Paylocity Benefits.
+
+    Every endpoint method is a coroutine returning the same requests.Response
+    the blocking client returns. Calls run on worker threads over a single
+    pooled session; at most `max_concurrency` requests are in flight at once.
+    The worker threads belong to the client, call close() (or leave the
+    `async with` block) to stop them.
+    """
+
+    def __init__(self, base_url=None, api_key="VGVzdFVzZXI3ODg6TD99JzVtaUIvbl05",
+                 max_concurrency=DEFAULT_MAX_CONCURRENCY, transport_config=None):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be greater than zero.")
+        self.max_concurrency = max_concurrency
+        # Keep at least one pooled connection per concurrent request
+        transport_config = transport_config or TransportConfig()
+        if transport_config.pool_maxsize < max_concurrency:
+            transport_config = transport_config._replace(pool_maxsize=max_concurrency)
+        self._client = APIClient(base_url=base_url, api_key=api_key,
+                                 transport_config=transport_config)
+        # Own threads: the loop's default executor would cap concurrency at min(32, cpus + 4)
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="async-api")
+        # One semaphore per event loop, a semaphore is bound to the loop it first waits on
+        self._semaphores = weakref.WeakKeyDictionary()
+
+    @property
+    def base_url(self):
+        return self._client.base_url
+
+    @property
+    def session(self) -> requests.Session:
+        return self._client.session
+
+    def _semaphore(self, loop):
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+        return semaphore
+
+    async def _run(self, method, *args):
+        loop = asyncio.get_running_loop()
+        async with self._semaphore(loop):
+            return await loop.run_in_executor(self._executor, method, *args)
+
+    async def get_all_employees(self):
+        """
+        Gets all employees from the API.
+        GET /api/Employees
+        """
+        return await self._run(self._client.get_all_employees)
+
+    async def create_employee(self, employee, only_set_required=False):
+        """
+        Creates a new employee.
+        POST /api/Employees
+        """
+        return await self._run(self._client.create_employee, employee, only_set_required)
+
+    async def get_employee_by_id(self, employee_id):
+        """
+        Gets a single employee by their ID.
+        GET /api/Employees/{id}
+        """
+        return await self._run(self._client.get_employee_by_id, employee_id)
+
+    async def update_employee(self, employee):
+        """
+        Updates an existing employee.
+        PUT /api/Employees
+        """
+        return await self._run(self._client.update_employee, employee)
+
+    async def delete_employee_by_id(self, employee_id):
+        """
+        Deletes a single employee by their ID.
+        DELETE /api/Employees/{id}
+        """
+        return await self._run(self._client.delete_employee_by_id, employee_id)
+
+    async def gather(self, *coroutines, return_exceptions=False):
+        """
+        Runs several client coroutines concurrently, bounded by max_concurrency.
+        Results are returned in the order the coroutines were given.
+        """
+        return await asyncio.gather(*coroutines, return_exceptions=return_exceptions)
+
+    def close(self):
+        """Stops the worker threads once the calls in flight are done."""
+        # The pooled session is shared with other clients and stays open
+        self._executor.shutdown(wait=True)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
@@ -0,0 +1,83 @@
+import threading
+import time
+import uuid
+from collections import OrderedDict
+
+_LIST_KEY = object()
+
+
+def _employee_key(employee_id):
+    # The API accepts both dashed and hex uuids, cache them under one key
+    try:
+        return str(uuid.UUID(employee_id))
+    except (TypeError, ValueError, AttributeError):
+        return employee_id
+
+
+class EmployeeCache:
+    """
+    Read-through cache for APIClient GET responses.
+
+    Holds one entry per employee id plus a snapshot of the full employee list.
+    Entries expire after `ttl` seconds (None keeps them until evicted) and the
+    least recently used ones are evicted once `maxsize` entries are stored.
+    """
+
+    def __init__(self, ttl=None, maxsize=1024, clock=time.monotonic):
+        if maxsize < 1:
+            raise ValueError("maxsize must be greater than zero.")
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._clock = clock
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                response, expires_at = entry
+                if expires_at is None or expires_at > self._clock():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return response
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def _put(self, key, response):
+        expires_at = None if self.ttl is None else self._clock() + self.ttl
+        with self._lock:
+            self._entries[key] = (response, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def get_employee(self, employee_id):
+        return self._get(_employee_key(employee_id))
+
+    def put_employee(self, employee_id, response):
+        self._put(_employee_key(employee_id), response)
+
+    def get_list(self):
+        return self._get(_LIST_KEY)
+
+    def put_list(self, response):
+        self._put(_LIST_KEY, response)
+
+    def invalidate_employee(self, employee_id):
+        with self._lock:
+            self._entries.pop(_employee_key(employee_id), None)
+
+    def invalidate_list(self):
+        with self._lock:
+            self._entries.pop(_LIST_KEY, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
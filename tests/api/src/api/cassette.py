@@ -0,0 +1,188 @@
+"""
+Record/replay of APIClient traffic.
+
+In record mode every request sent through APIClient._request is stored with
+its response; save() writes them to a gzip compressed JSON lines cassette,
+one interaction per line:
+
+    [method, path, request_body, status, reason, content_type, response_body]
+
+A JSON object line holds the cassette's `meta` dict, values the recorded run
+chose at random (e.g. namespace tokens) that a replay has to reuse.
+
+In replay mode the cassette is loaded into a dict keyed by the configured
+matchers, so every lookup is a single hash probe and no network is used.
+Identical requests are answered in the order they were recorded; once a
+key's responses are used up the last one keeps being served.
+
+Only deterministic requests can be replayed: a request whose path or body
+differs from the recorded run (random ids or usernames) raises CassetteError.
+"""
+import gzip
+import os
+import threading
+from collections import deque
+
+import requests
+
+from src.api import serialization
+
+RECORD = "record"
+REPLAY = "replay"
+MODES = (RECORD, REPLAY)
+
+# Request parts a replayed request must match, in key order
+MATCHERS = {
+    "method": lambda method, path, body: method.upper(),
+    "path": lambda method, path, body: path,
+    "body": lambda method, path, body: body or b"",
+}
+DEFAULT_MATCH_ON = ("method", "path", "body")
+
+
+class CassetteError(Exception):
+    """Raised when a replayed request has no recorded interaction."""
+
+
+def _to_bytes(data):
+    if data is None:
+        return None
+    return data.encode("utf-8") if isinstance(data, str) else bytes(data)
+
+
+def _build_response(status, reason, content_type, body, url):
+    response = requests.Response()
+    response.status_code = status
+    response.reason = reason
+    if content_type:
+        response.headers["Content-Type"] = content_type
+    response.encoding = "utf-8"
+    response.url = url
+    # Marking the content as consumed lets iter_content() serve it without a raw stream
+    response._content = body
+    response._content_consumed = True
+    return response
+
+
+class Cassette:
+    """
+    Request/response pairs of APIClient calls, recorded to or replayed from `path`.
+
+    Usage:
+        cassette = Cassette("employees.jsonl.gz", mode=RECORD)
+        APIClient(cassette=cassette).get_all_employees()
+        cassette.save()
+
+        client = APIClient(cassette=Cassette("employees.jsonl.gz"))
+    """
+
+    def __init__(self, path, mode=REPLAY, match_on=DEFAULT_MATCH_ON):
+        if mode not in MODES:
+            raise ValueError(f"mode must be one of {MODES}.")
+        unknown = set(match_on) - set(MATCHERS)
+        if unknown:
+            raise ValueError(f"Unknown matchers: {sorted(unknown)}.")
+        self.path = path
+        self.mode = mode
+        self.match_on = tuple(match_on)
+        self._matchers = [MATCHERS[name] for name in self.match_on]
+        self._interactions = []
+        self._index = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.meta = {}
+        if mode == REPLAY:
+            self.load()
+
+    def __len__(self):
+        return len(self._interactions)
+
+    def _key(self, method, path, body):
+        return tuple(matcher(method, path, body) for matcher in self._matchers)
+
+    def _add(self, interaction):
+        method, path, body = interaction[:3]
+        self._interactions.append(interaction)
+        self._index.setdefault(self._key(method, path, body), deque()).append(interaction)
+
+    def load(self):
+        """Reads the cassette file and indexes its interactions."""
+        self._interactions = []
+        self._index = {}
+        self.meta = {}
+        with gzip.open(self.path, "rb") as stream:
+            for line in stream:
+                if not line.strip():
+                    continue
+                entry = serialization.loads(line)
+                if isinstance(entry, dict):
+                    self.meta.update(entry)
+                    continue
+                method, path, body, status, reason, content_type, text = entry
+                self._add((method, path, _to_bytes(body), status, reason, content_type,
+                           text.encode("utf-8")))
+        return self
+
+    def save(self):
+        """Writes the recorded interactions to the cassette file."""
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._lock:
+            interactions = list(self._interactions)
+        # mtime=0 keeps the file identical for identical recordings
+        with open(self.path, "wb") as raw, gzip.GzipFile(fileobj=raw, mode="wb", mtime=0) as stream:
+            if self.meta:
+                stream.write(serialization.dumps(self.meta) + b"\n")
+            for method, path, body, status, reason, content_type, content in interactions:
+                line = [method, path, body.decode("utf-8") if body is not None else None, status,
+                        reason, content_type, content.decode("utf-8", "replace")]
+                stream.write(serialization.dumps(line) + b"\n")
+
+    def record(self, method, path, data, response):
+        """Stores a live response. Streamed responses are read in full first."""
+        interaction = (method.upper(), path, _to_bytes(data), response.status_code, response.reason,
+                       response.headers.get("Content-Type"), response.content)
+        with self._lock:
+            self._add(interaction)
+        return response
+
+    def play(self, method, path, data, url):
+        """Returns a new Response for the recorded interaction matching the request."""
+        key = self._key(method, path, _to_bytes(data))
+        with self._lock:
+            queue = self._index.get(key)
+            if not queue:
+                raise CassetteError(f"No recorded interaction for {method} {path} in {self.path}.")
+            interaction = queue.popleft() if len(queue) > 1 else queue[0]
+            self.hits += 1
+        status, reason, content_type, content = interaction[3:]
+        return _build_response(status, reason, content_type, content, url)
+
+    def send(self, send, method, path, data, url):
+        """Replays the request, or sends it with `send` and records the response."""
+        if self.mode == REPLAY:
+            return self.play(method, path, data, url)
+        return self.record(method, path, data, send())
+
+
+_global_cassette = None
+
+
+def enable(cassette):
+    """
+    Routes every APIClient of the configured service (created without a
+    base_url) that has no cassette of its own through `cassette`.
+    """
+    global _global_cassette
+    _global_cassette = cassette
+    return cassette
+
+
+def disable():
+    global _global_cassette
+    _global_cassette = None
+
+
+def get_global_cassette():
+    return _global_cassette
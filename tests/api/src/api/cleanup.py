@@ -0,0 +1,92 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+
+# Statuses proving an employee no longer exists; 404 makes deletes idempotent
+DELETED_STATUSES = (200, 204, 404)
+DEFAULT_CLEANUP_WORKERS = 4
+
+
+def _is_deleted(result):
+    return getattr(result, "status_code", None) in DELETED_STATUSES
+
+
+class CleanupRegistry:
+    """
+    Session-wide queue of employees to delete, kept off the tests' critical path.
+
+    Fixtures register() every id they create as soon as it exists, so a test
+    that fails half way still has its records removed. release() deletes an
+    id in the background once the fixture is done with it; whatever is left
+    is deleted in one concurrent batch by close(). Every delete is retried up
+    to `retries` times and a 404 counts as deleted, so retrying is safe.
+    close() returns the ids that could not be deleted, also kept in `leaked`.
+
+    Usage:
+        employee_id = client.create_employee(employee).json()["id"]
+        registry.register(employee_id)
+        ...
+        registry.release(employee_id)
+    """
+
+    def __init__(self, client, max_workers=DEFAULT_CLEANUP_WORKERS, retries=3, backoff=0.2):
+        self.client = client
+        self.max_workers = max_workers
+        self.retries = retries
+        self.backoff = backoff
+        self.leaked = []
+        self._pending = set()
+        self._lock = threading.Lock()
+        self._futures = []
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="cleanup")
+
+    def __len__(self):
+        return len(self._pending)
+
+    def register(self, employee_id):
+        """Tracks an id for deletion at close()."""
+        if employee_id:
+            with self._lock:
+                self._pending.add(employee_id)
+        return employee_id
+
+    def register_response(self, response):
+        """Tracks the id of the employee a successful create returned, if any."""
+        if response.status_code == 200:
+            return self.register(response.json().get("id"))
+        return None
+
+    def release(self, employee_id):
+        """Deletes a registered id in the background, now that it is no longer used."""
+        with self._lock:
+            if employee_id not in self._pending:
+                return
+            self._futures.append(self._executor.submit(self._delete, [employee_id]))
+
+    def _delete(self, ids):
+        """Deletes ids, retrying the failures; returns the ids still not deleted."""
+        for attempt in range(self.retries + 1):
+            if attempt:
+                time.sleep(self.backoff * 2 ** (attempt - 1))
+            result = self.client.delete_employees(ids, max_workers=self.max_workers)
+            deleted = {employee_id for employee_id, outcome in zip(ids, result) if _is_deleted(outcome)}
+            with self._lock:
+                self._pending -= deleted
+            ids = [employee_id for employee_id in ids if employee_id not in deleted]
+            if not ids:
+                break
+        return ids
+
+    def close(self):
+        """Waits for background deletes, deletes everything left in one batch and reports leaks."""
+        with self._lock:
+            futures, self._futures = self._futures, []
+        wait(futures)
+        self._executor.shutdown(wait=True)
+        with self._lock:
+            remaining = sorted(self._pending)
+        if remaining:
+            self._delete(remaining)
+        with self._lock:
+            self.leaked = sorted(self._pending)
+        return self.leaked
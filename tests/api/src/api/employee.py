@@ -1,3 +1,6 @@
+from src.api import serialization
+
+
 class Employee:
     """
     A class to represent an Employee, based on the OpenAPI schema.
@@ -10,25 +13,20 @@ class Employee:
     NUM_PAYCHECKS_PER_YEAR = 26
 
     @classmethod
-    def calculate_benefit_cost_per_check(cls, no_dependants):
+    def _exact_benefit_cost_per_check(cls, no_dependants):
         total_annual_benefit_cost = cls.ANNUAL_EMPLOYEE_BENEFIT_COST + \
             (no_dependants * cls.ANNUAL_DEPENDENT_COST)
+        return total_annual_benefit_cost / cls.NUM_PAYCHECKS_PER_YEAR
 
-        # Calculate the benefit cost per paycheck
-        benefit_cost_per_check = total_annual_benefit_cost / cls.NUM_PAYCHECKS_PER_YEAR
-
-        return round(benefit_cost_per_check, 2)
+    @classmethod
+    def calculate_benefit_cost_per_check(cls, no_dependants):
+        # See src.api.payroll.PayrollEngine to price many employees at once
+        return round(cls._exact_benefit_cost_per_check(no_dependants), 2)
 
     @classmethod
     def calculate_net_pay_per_check(cls, no_dependants):
-        total_annual_benefit_cost = cls.ANNUAL_EMPLOYEE_BENEFIT_COST + \
-            (no_dependants * cls.ANNUAL_DEPENDENT_COST)
-
-        # Calculate the benefit cost per paycheck
-        benefit_cost_per_check = total_annual_benefit_cost / cls.NUM_PAYCHECKS_PER_YEAR
-
-        # Calculate the net pay per paycheck
-        net_pay_per_check = cls.GROSS_PAY_PER_CHECK - benefit_cost_per_check
+        net_pay_per_check = cls.GROSS_PAY_PER_CHECK - \
+            cls._exact_benefit_cost_per_check(no_dependants)
         return round(net_pay_per_check, 2)
 
     def __init__(self, username, firstName, lastName, dependants=0, expiration=None, salary=0.0, id=None):
@@ -46,6 +44,13 @@ class Employee:
         # "benefitsCost": 38.46154,
         # "net": 1961.5385
 
+    @classmethod
+    def from_dict(cls, data):
+        """Builds an Employee from an API response item, read only fields are dropped."""
+        return cls(data["username"], data["firstName"], data["lastName"],
+                   dependants=data.get("dependants", 0), expiration=data.get("expiration"),
+                   salary=data.get("salary", 0.0), id=data.get("id"))
+
     def required_fields_to_dict(self):
         return {
             "username": self.username,
@@ -53,6 +58,10 @@ class Employee:
             "lastName": self.lastName
         }
 
+    def to_json(self, only_required=False):
+        """Encodes the Employee to compact JSON bytes for a request body."""
+        return serialization.encode_employee(self, only_required)
+
     def to_dict(self):
         """Converts the Employee object to a dictionary for JSON serialization."""
         if self.id:
@@ -0,0 +1,148 @@
+"""
+Lazy, seeded generator of Employee payloads.
+
+Every employee is derived from (seed, index) alone, so a roster of any size
+is produced one item at a time in constant memory, the same seed always
+yields the same roster, and any single index can be rebuilt on its own.
+Sharding hands index i to shard i % shard_count, so workers generating the
+same seed never produce the same employee twice.
+
+Valid employees stay within the swagger Employee constraints: names of 0-50
+characters, 0-32 dependants, optional expiration and id. With invalid_rate
+set, that share of the employees carries exactly one defect from DEFECTS.
+
+Usage:
+    generator = EmployeeGenerator(seed=7, shard_index=0, shard_count=4, invalid_rate=0.1)
+    for generated in generator.generate(1_000_000):
+        client.create_employee(generated.employee)
+"""
+import itertools
+import random
+import uuid
+from collections import namedtuple
+from datetime import datetime, timedelta, timezone
+
+from src.api.employee import Employee
+from src.api.schema import MAX_DEPENDANTS, MAX_NAME_LENGTH, MAX_USERNAME_LENGTH, MIN_DEPENDANTS
+
+FIRST_NAMES = ("Ana", "Bruno", "Carla", "Diego", "Elena", "Farid", "Grace", "Hiro", "Irene", "Jamal",
+               "Kenji", "Laura", "Mateo", "Nadia", "Omar", "Priya", "Quinn", "Rosa", "Sven", "Tomas")
+LAST_NAMES = ("Alvarez", "Brown", "Chen", "Dubois", "Evans", "Fischer", "Garcia", "Hughes", "Ito",
+              "Jensen", "Kowalski", "Lopez", "Mendoza", "Nakamura", "Okafor", "Patel", "Rossi",
+              "Smith", "Tanaka", "Walker")
+
+# Expirations are spread over ten years from a fixed date, so a seed's roster never changes
+EXPIRATION_BASE = datetime(2035, 1, 1, tzinfo=timezone.utc)
+EXPIRATION_SPAN_DAYS = 3650
+
+# One defect per invalid employee, each breaking a single swagger constraint
+DEFECTS = ("username_too_long", "first_name_too_long", "last_name_too_long", "first_name_missing",
+           "dependants_below_minimum", "dependants_above_maximum", "expiration_not_date_time",
+           "id_not_uuid")
+
+GeneratedEmployee = namedtuple("GeneratedEmployee", ["index", "employee", "defect"])
+GeneratedEmployee.__doc__ = """
+One generated employee; defect is None for valid ones, else one of DEFECTS.
+"""
+
+
+class EmployeeGenerator:
+    """
+    Reproducible stream of valid and deliberately invalid employees.
+
+    Args:
+        seed: roster seed, the same seed gives the same employees.
+        shard_index, shard_count: this worker's share of the index space.
+        invalid_rate: share of employees (0-1) generated with one defect.
+        expiration_rate, id_rate: share of valid employees with an
+            expiration date, and with a client chosen id.
+        edge_rate: share of valid employees using boundary values
+            (empty or 50 character names, 0 or 32 dependants).
+        namespace: DataNamespace prefixed to every username.
+    """
+
+    def __init__(self, seed=0, shard_index=0, shard_count=1, invalid_rate=0.0, expiration_rate=0.3,
+                 id_rate=0.0, edge_rate=0.05, namespace=None):
+        if shard_count < 1 or not 0 <= shard_index < shard_count:
+            raise ValueError("shard_index must be in range(shard_count).")
+        for name, rate in (("invalid_rate", invalid_rate), ("expiration_rate", expiration_rate),
+                           ("id_rate", id_rate), ("edge_rate", edge_rate)):
+            if not 0 <= rate <= 1:
+                raise ValueError(f"{name} must be between 0 and 1.")
+        self.seed = seed
+        self.shard_index = shard_index
+        self.shard_count = shard_count
+        self.invalid_rate = invalid_rate
+        self.expiration_rate = expiration_rate
+        self.id_rate = id_rate
+        self.edge_rate = edge_rate
+        self.prefix = namespace.prefix if namespace is not None else ""
+
+    def indexes(self, count=None):
+        """Indexes of this shard, endless when count is None."""
+        start = itertools.count(self.shard_index, self.shard_count)
+        return start if count is None else itertools.islice(start, count)
+
+    def generate(self, count=None):
+        """Yields GeneratedEmployee items of this shard, endless when count is None."""
+        for index in self.indexes(count):
+            yield self.at(index)
+
+    def employees(self, count=None):
+        """Yields only the Employee objects."""
+        for generated in self.generate(count):
+            yield generated.employee
+
+    def at(self, index):
+        """Rebuilds the employee of any index, in any shard."""
+        # Seeding per index keeps items independent of each other and of the shard layout
+        rng = random.Random((self.seed << 64) | index)
+        defect = rng.choice(DEFECTS) if rng.random() < self.invalid_rate else None
+        edge = defect is None and rng.random() < self.edge_rate
+        first_name = self._name(rng, FIRST_NAMES, edge)
+        last_name = self._name(rng, LAST_NAMES, edge)
+        dependants = (rng.choice((MIN_DEPENDANTS, MAX_DEPENDANTS)) if edge
+                      else min(int(rng.expovariate(0.6)), MAX_DEPENDANTS))
+        expiration = None
+        if rng.random() < self.expiration_rate:
+            expires = EXPIRATION_BASE + timedelta(days=rng.randrange(EXPIRATION_SPAN_DAYS))
+            expiration = expires.strftime("%Y-%m-%dT%H:%M:%S.000Z")
+        employee_id = None
+        if rng.random() < self.id_rate:
+            employee_id = str(uuid.UUID(int=rng.getrandbits(128), version=4))
+        employee = Employee(self._username(first_name, last_name, index), first_name, last_name,
+                            dependants, expiration, id=employee_id)
+        if defect is not None:
+            _apply_defect(employee, defect, rng)
+        return GeneratedEmployee(index, employee, defect)
+
+    def _name(self, rng, names, edge):
+        if edge:
+            return rng.choice(("", (rng.choice(names) * MAX_NAME_LENGTH)[:MAX_NAME_LENGTH]))
+        return rng.choice(names)
+
+    def _username(self, first_name, last_name, index):
+        # The index suffix keeps usernames unique across shards; the name part is cut to fit
+        suffix = str(index)
+        room = MAX_USERNAME_LENGTH - len(self.prefix) - len(suffix)
+        return self.prefix + f"{first_name[:1]}{last_name}".lower()[:max(room, 0)] + suffix
+
+
+def _apply_defect(employee, defect, rng):
+    too_long = "x" * (MAX_NAME_LENGTH + 1 + rng.randrange(10))
+    if defect == "username_too_long":
+        employee.username = (employee.username + too_long)[:MAX_USERNAME_LENGTH + 1]
+    elif defect == "first_name_too_long":
+        employee.firstName = too_long
+    elif defect == "last_name_too_long":
+        employee.lastName = too_long
+    elif defect == "first_name_missing":
+        employee.firstName = None
+    elif defect == "dependants_below_minimum":
+        employee.dependants = MIN_DEPENDANTS - 1 - rng.randrange(5)
+    elif defect == "dependants_above_maximum":
+        employee.dependants = MAX_DEPENDANTS + 1 + rng.randrange(5)
+    elif defect == "expiration_not_date_time":
+        employee.expiration = "not a date"
+    elif defect == "id_not_uuid":
+        employee.id = "not-a-uuid"
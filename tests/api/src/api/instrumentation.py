@@ -0,0 +1,160 @@
+import math
+import re
+import threading
+import time
+from collections import namedtuple
+
+RequestTiming = namedtuple("RequestTiming", [
+    "method",
+    "endpoint",        # templated path, e.g. /api/Employees/{id}
+    "status",          # None when the request raised
+    "dns_ms",          # 0 when a pooled connection was reused
+    "connect_ms",      # TCP connect plus TLS handshake, 0 on reuse
+    "headers_ms",      # send started until response headers were parsed, connection setup included
+    "total_ms",        # whole call including the body download
+    "request_bytes",
+    "response_bytes",
+    "thread_id",       # threading.get_ident() of the thread that made the call
+])
+
+# Upper bounds, in milliseconds, of the latency histogram buckets
+HISTOGRAM_BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, float("inf"))
+
+_ID_SEGMENT = re.compile(r"^(/api/Employees)/[^/]+$")
+_local = threading.local()
+
+
+def endpoint_template(path):
+    """Replaces the employee id segment of a path with {id}."""
+    path = path.split("?", 1)[0]
+    return _ID_SEGMENT.sub(r"\1/{id}", path)
+
+
+class _ConnectionTimes:
+    """Connection phase durations of the request running on this thread."""
+
+    def __init__(self):
+        self.dns = 0.0
+        self.connect = 0.0
+
+
+def current_connection_times():
+    """
+    Returns the connection timing slot of the instrumented request running on
+    this thread, or None. The transport fills it in when it opens a connection.
+    """
+    return getattr(_local, "times", None)
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return None
+    rank = max(math.ceil(pct / 100.0 * len(sorted_values)), 1)
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+class RequestRecorder:
+    """
+    Collects a RequestTiming for every call made by an instrumented APIClient
+    and aggregates them per endpoint.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.records = []
+
+    def __len__(self):
+        return len(self.records)
+
+    def clear(self):
+        with self._lock:
+            self.records = []
+
+    def add(self, timing):
+        with self._lock:
+            self.records.append(timing)
+
+    def measure(self, send, method, path, request_bytes=0, stream=False):
+        """Calls send() and records how long it took. Exceptions are recorded and re-raised."""
+        times = _local.times = _ConnectionTimes()
+        started = time.perf_counter()
+        response = None
+        try:
+            response = send()
+            return response
+        finally:
+            total = (time.perf_counter() - started) * 1000
+            _local.times = None
+            if response is not None:
+                # Streamed bodies are not downloaded yet, fall back to Content-Length
+                if stream:
+                    response_bytes = int(response.headers.get("Content-Length") or 0)
+                else:
+                    response_bytes = len(response.content or b"")
+                status = response.status_code
+                headers = response.elapsed.total_seconds() * 1000
+            else:
+                response_bytes, status, headers = 0, None, total
+            self.add(RequestTiming(method, endpoint_template(path), status,
+                                   round(times.dns * 1000, 3), round(times.connect * 1000, 3),
+                                   round(headers, 3), round(total, 3), request_bytes, response_bytes,
+                                   threading.get_ident()))
+
+    def histograms(self, records=None):
+        """Per endpoint bucket counts of total_ms, keyed by 'METHOD /path'."""
+        histograms = {}
+        for record in self.records if records is None else records:
+            key = f"{record.method} {record.endpoint}"
+            counts = histograms.setdefault(key, [0] * len(HISTOGRAM_BUCKETS_MS))
+            for index, bound in enumerate(HISTOGRAM_BUCKETS_MS):
+                if record.total_ms <= bound:
+                    counts[index] += 1
+                    break
+        return histograms
+
+    def summary(self, records=None):
+        """
+        Per endpoint aggregate rows: count, errors, mean/p50/p90/p99/max of
+        total_ms, mean headers_ms and connect_ms, and bytes sent and received.
+        """
+        grouped = {}
+        for record in self.records if records is None else records:
+            grouped.setdefault(f"{record.method} {record.endpoint}", []).append(record)
+        rows = {}
+        for key, group in sorted(grouped.items()):
+            totals = sorted(r.total_ms for r in group)
+            count = len(group)
+            rows[key] = {
+                "count": count,
+                "errors": sum(1 for r in group if r.status is None or r.status >= 400),
+                "mean_ms": round(sum(totals) / count, 3),
+                "p50_ms": percentile(totals, 50),
+                "p90_ms": percentile(totals, 90),
+                "p99_ms": percentile(totals, 99),
+                "max_ms": totals[-1],
+                "headers_mean_ms": round(sum(r.headers_ms for r in group) / count, 3),
+                "connect_mean_ms": round(sum(r.dns_ms + r.connect_ms for r in group) / count, 3),
+                "request_bytes": sum(r.request_bytes for r in group),
+                "response_bytes": sum(r.response_bytes for r in group),
+            }
+        return rows
+
+
+_global_recorder = None
+
+
+def enable(recorder=None):
+    """Instruments every APIClient in the process that has no recorder of its own."""
+    global _global_recorder
+    _global_recorder = recorder or RequestRecorder()
+    return _global_recorder
+
+
+def disable():
+    global _global_recorder
+    _global_recorder = None
+
+
+def get_global_recorder():
+    return _global_recorder
@@ -0,0 +1,258 @@
+import base64
+import binascii
+import re
+import threading
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from src.api import serialization
+from src.api.employee import Employee
+from src.api.schema import UUID_PATTERN, get_employee_validator
+
+EMPLOYEES_PATH = "/api/Employees"
+EMPLOYEE_BY_ID_PATH = re.compile(r"^/api/Employees/([^/]+)$")
+
+# Property order used by the real service when serializing an Employee
+RESPONSE_FIELDS = ("partitionKey", "sortKey", "username", "id", "firstName", "lastName",
+                   "dependants", "expiration", "salary", "gross", "benefitsCost", "net")
+
+
+def _is_uuid(value):
+    return isinstance(value, str) and UUID_PATTERN.match(value) is not None
+
+
+class EmployeeStore:
+    """
+    Thread safe in-memory storage for the stand-in server.
+    Employees are partitioned by the account taken from the Basic auth header.
+    """
+
+    def __init__(self, validator):
+        self.validator = validator
+        self._partitions = {}
+        self._lock = threading.Lock()
+
+    def validate(self, payload):
+        """Returns a list of error messages for a request body, empty when valid."""
+        return [f"'{error.path}' {error.message}." if error.path else f"Body {error.message}."
+                for error in self.validator.validate(payload)]
+
+    @staticmethod
+    def _computed(partition, employee_id, payload):
+        dependants = payload.get("dependants") or 0
+        benefits_cost = (Employee.ANNUAL_EMPLOYEE_BENEFIT_COST +
+                         dependants * Employee.ANNUAL_DEPENDENT_COST) / Employee.NUM_PAYCHECKS_PER_YEAR
+        record = {
+            "partitionKey": partition,
+            "sortKey": employee_id,
+            "username": payload["username"],
+            "id": employee_id,
+            "firstName": payload["firstName"],
+            "lastName": payload["lastName"],
+            "dependants": dependants,
+            "expiration": payload.get("expiration"),
+            # Salary is server owned, the client value is ignored
+            "salary": Employee.GROSS_PAY_PER_CHECK * Employee.NUM_PAYCHECKS_PER_YEAR,
+            "gross": Employee.GROSS_PAY_PER_CHECK,
+            "benefitsCost": benefits_cost,
+            "net": Employee.GROSS_PAY_PER_CHECK - benefits_cost,
+        }
+        return {field: record[field] for field in RESPONSE_FIELDS}
+
+    def list(self, partition):
+        with self._lock:
+            return list(self._partitions.get(partition, {}).values())
+
+    def get(self, partition, employee_id):
+        with self._lock:
+            return self._partitions.get(partition, {}).get(str(uuid.UUID(employee_id)))
+
+    def create(self, partition, payload):
+        """Returns the stored record, or None when the id is already taken."""
+        employee_id = str(uuid.UUID(payload["id"])) if payload.get("id") else str(uuid.uuid4())
+        with self._lock:
+            employees = self._partitions.setdefault(partition, {})
+            if employee_id in employees:
+                return None
+            record = self._computed(partition, employee_id, payload)
+            employees[employee_id] = record
+            return record
+
+    def update(self, partition, payload):
+        """Returns the updated record, or None when the employee does not exist."""
+        employee_id = str(uuid.UUID(payload["id"]))
+        with self._lock:
+            employees = self._partitions.get(partition, {})
+            if employee_id not in employees:
+                return None
+            record = self._computed(partition, employee_id, payload)
+            employees[employee_id] = record
+            return record
+
+    def delete(self, partition, employee_id):
+        with self._lock:
+            return self._partitions.get(partition, {}).pop(str(uuid.UUID(employee_id)), None)
+
+    def clear(self):
+        with self._lock:
+            self._partitions.clear()
+
+
+class _EmployeesHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server_version = "LocalBenefits/1.0"
+    disable_nagle_algorithm = True
+
+    @property
+    def store(self) -> EmployeeStore:
+        return self.server.store
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status, body=None):
+        data = b"" if body is None else serialization.dumps(body)
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _send_error(self, status, *messages):
+        self._send(status, {"status": status, "errors": list(messages)})
+
+    def _partition(self):
+        """Returns the account name from the Basic auth header, or None."""
+        scheme, _, token = self.headers.get("Authorization", "").partition(" ")
+        if scheme != "Basic" or not token:
+            return None
+        try:
+            user, _, _ = base64.b64decode(token, validate=True).decode("utf-8").partition(":")
+        except (binascii.Error, UnicodeDecodeError):
+            return None
+        return user or None
+
+    def _read_json(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length) if length else b""
+        return serialization.loads(raw) if raw else None
+
+    def _dispatch(self, method):
+        partition = self._partition()
+        if partition is None:
+            return self._send_error(401, "Unauthorized.")
+        path = self.path.split("?", 1)[0].rstrip("/")
+        if path == EMPLOYEES_PATH:
+            handler = {"GET": self._get_all, "POST": self._create, "PUT": self._update}.get(method)
+            return handler(partition) if handler else self._send_error(405, "Method not allowed.")
+        match = EMPLOYEE_BY_ID_PATH.match(path)
+        if match:
+            handler = {"GET": self._get_by_id, "DELETE": self._delete}.get(method)
+            if handler is None:
+                return self._send_error(405, "Method not allowed.")
+            if not _is_uuid(match.group(1)):
+                return self._send_error(400, "Employee id must be a uuid.")
+            return handler(partition, match.group(1))
+        return self._send_error(404, "Not found.")
+
+    def _read_employee(self):
+        try:
+            payload = self._read_json()
+        except ValueError:
+            self._send_error(400, "Request body is not valid JSON.")
+            return None
+        errors = self.store.validate(payload)
+        if errors:
+            self._send_error(400, *errors)
+            return None
+        return payload
+
+    def _get_all(self, partition):
+        self._send(200, self.store.list(partition))
+
+    def _create(self, partition):
+        payload = self._read_employee()
+        if payload is None:
+            return
+        record = self.store.create(partition, payload)
+        if record is None:
+            return self._send_error(409, "Employee already exists.")
+        self._send(200, record)
+
+    def _update(self, partition):
+        payload = self._read_employee()
+        if payload is None:
+            return
+        record = self.store.update(partition, payload) if payload.get("id") else None
+        if record is None:
+            return self._send_error(404, "Employee not found.")
+        self._send(200, record)
+
+    def _get_by_id(self, partition, employee_id):
+        record = self.store.get(partition, employee_id)
+        if record is None:
+            return self._send_error(404, "Employee not found.")
+        self._send(200, record)
+
+    def _delete(self, partition, employee_id):
+        if self.store.delete(partition, employee_id) is None:
+            return self._send_error(404, "Employee not found.")
+        self._send(200)
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def do_PUT(self):
+        self._dispatch("PUT")
+
+    def do_DELETE(self):
+        self._dispatch("DELETE")
+
+
+class LocalBenefitsServer:
+    """
+    In-process stand-in for the Paylocity Benefits API described in docs/swagger.json.
+
+    Serves the five Employees operations over HTTP on localhost, validates request
+    bodies against the swagger Employee schema and fills in the server computed
+    salary, gross, benefitsCost and net fields.
+
+    Usage:
+        with LocalBenefitsServer() as server:
+            client = APIClient(base_url=server.base_url)
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, swagger_path=None):
+        self.store = EmployeeStore(get_employee_validator("request", swagger_path))
+        self._httpd = ThreadingHTTPServer((host, port), _EmployeesHandler)
+        self._httpd.daemon_threads = True
+        self._httpd.store = self.store
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._httpd.serve_forever, name="local-benefits-api", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        if self._thread is not None:
+            self._httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
@@ -0,0 +1,48 @@
+import os
+import uuid
+
+from src.api.employee import Employee
+from src.api.schema import MAX_USERNAME_LENGTH
+
+
+class DataNamespace:
+    """
+    Username prefix that isolates the test data of one pytest worker and session.
+
+    Every employee a worker creates gets a username starting with the prefix,
+    so cleanup and list assertions can be restricted to the worker's own
+    records and several workers can share one account safely.
+
+    The prefix is "<worker>-<token>_", where worker comes from
+    PYTEST_XDIST_WORKER ("main" when not running under xdist) and token is
+    random per session.
+    """
+
+    def __init__(self, worker_id=None, token=None):
+        self.worker_id = worker_id or os.environ.get("PYTEST_XDIST_WORKER", "main")
+        self.token = token or uuid.uuid4().hex[:6]
+        self.prefix = f"{self.worker_id}-{self.token}_"
+
+    def username(self, name):
+        """Returns name tagged with the namespace, cut to the schema limit."""
+        return (self.prefix + name)[:MAX_USERNAME_LENGTH]
+
+    def make_id(self, name):
+        """
+        Employee id (32 hex digits) derived from name and the prefix: unique
+        per session, yet repeatable when the token is fixed.
+        """
+        return uuid.uuid5(uuid.NAMESPACE_OID, self.prefix + name).hex
+
+    def employee(self, username, firstName, lastName, **kwargs):
+        """Builds an Employee whose username belongs to this namespace."""
+        return Employee(self.username(username), firstName, lastName, **kwargs)
+
+    def owns(self, employee):
+        """True for an employee dict or Employee created in this namespace."""
+        username = employee.get("username") if isinstance(employee, dict) else employee.username
+        return isinstance(username, str) and username.startswith(self.prefix)
+
+    def filter(self, employees):
+        """Keeps only the employees created in this namespace."""
+        return [employee for employee in employees if self.owns(employee)]
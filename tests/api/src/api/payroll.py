@@ -0,0 +1,133 @@
+import numbers
+from collections import namedtuple
+
+from src.api.employee import Employee
+from src.api.schema import MAX_DEPENDANTS, MIN_DEPENDANTS
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None
+
+PayrollResult = namedtuple("PayrollResult", [
+    "benefit_cost_per_check",
+    "net_pay_per_check",
+    "annual_benefit_cost",
+    "annual_net_pay",
+])
+PayrollResult.__doc__ = """
+Per employee payroll figures, in input order, rounded to cents.
+Fields are numpy arrays when numpy is installed and lists otherwise.
+"""
+
+
+class PayrollEngine:
+    """
+    Batch counterpart of Employee.calculate_benefit_cost_per_check and
+    Employee.calculate_net_pay_per_check.
+
+    Every figure that only depends on the number of dependants is precomputed
+    into lookup tables for the 0-32 range allowed by the schema, so a roster is
+    priced with one table lookup per column instead of per employee arithmetic.
+    """
+
+    def __init__(self):
+        checks = Employee.NUM_PAYCHECKS_PER_YEAR
+        counts = range(MIN_DEPENDANTS, MAX_DEPENDANTS + 1)
+        annual = [Employee.ANNUAL_EMPLOYEE_BENEFIT_COST + d * Employee.ANNUAL_DEPENDENT_COST
+                  for d in counts]
+        self.annual_gross = Employee.GROSS_PAY_PER_CHECK * checks
+        # Unrounded per check cost, needed when the gross pay varies by employee
+        self._benefit_exact = tuple(cost / checks for cost in annual)
+        self._annual_benefit = tuple(round(cost, 2) for cost in annual)
+        self._benefit_per_check = tuple(round(cost, 2) for cost in self._benefit_exact)
+        self._net_per_check = tuple(round(Employee.GROSS_PAY_PER_CHECK - cost, 2)
+                                    for cost in self._benefit_exact)
+        self._annual_net = tuple(round(self.annual_gross - cost, 2) for cost in annual)
+        if np is not None:
+            self._tables = {name: np.array(getattr(self, name)) for name in (
+                "_benefit_exact", "_annual_benefit", "_benefit_per_check",
+                "_net_per_check", "_annual_net")}
+
+    @staticmethod
+    def _type_error():
+        return TypeError("Dependants must be integers.")
+
+    @staticmethod
+    def _check_range(low, high):
+        if low < MIN_DEPENDANTS or high > MAX_DEPENDANTS:
+            raise ValueError(
+                f"Dependants must be between {MIN_DEPENDANTS} and {MAX_DEPENDANTS}.")
+
+    def calculate(self, dependants, salaries=None):
+        """
+        Prices a batch of employees.
+
+        Args:
+            dependants: sequence of dependant counts, one per employee.
+            salaries: optional sequence of annual salaries; when omitted every
+                employee earns Employee.GROSS_PAY_PER_CHECK per check.
+        """
+        if np is not None:
+            return self._calculate_numpy(dependants, salaries)
+        return self._calculate_python(dependants, salaries)
+
+    def calculate_roster(self, roster, use_salary=False):
+        """
+        Prices a roster of Employee objects or employee dicts as returned by the API.
+        Salaries are only taken from the roster when use_salary is set.
+        """
+        dependants = []
+        salaries = [] if use_salary else None
+        for employee in roster:
+            if isinstance(employee, dict):
+                dependants.append(employee.get("dependants") or 0)
+                if use_salary:
+                    salaries.append(employee.get("salary") or self.annual_gross)
+            else:
+                dependants.append(employee.dependants or 0)
+                if use_salary:
+                    salaries.append(employee.salary or self.annual_gross)
+        return self.calculate(dependants, salaries)
+
+    def _calculate_numpy(self, dependants, salaries):
+        counts = np.asarray(dependants)
+        if counts.size and counts.dtype.kind not in "iu":
+            # An intp cast would truncate 2.5 or parse "2", the Python path rejects both
+            raise self._type_error()
+        counts = counts.astype(np.intp)
+        if counts.size:
+            self._check_range(counts.min(), counts.max())
+        tables = self._tables
+        annual_benefit = tables["_annual_benefit"][counts]
+        benefit_per_check = tables["_benefit_per_check"][counts]
+        if salaries is None:
+            return PayrollResult(benefit_per_check, tables["_net_per_check"][counts],
+                                 annual_benefit, tables["_annual_net"][counts])
+        salaries = np.asarray(salaries, dtype=np.float64)
+        if salaries.shape != counts.shape:
+            raise ValueError("dependants and salaries must have the same length.")
+        gross_per_check = salaries / Employee.NUM_PAYCHECKS_PER_YEAR
+        net_per_check = np.round(gross_per_check - tables["_benefit_exact"][counts], 2)
+        annual_net = np.round(salaries - annual_benefit, 2)
+        return PayrollResult(benefit_per_check, net_per_check, annual_benefit, annual_net)
+
+    def _calculate_python(self, dependants, salaries):
+        counts = list(dependants)
+        if not all(isinstance(d, numbers.Integral) and not isinstance(d, bool) for d in counts):
+            raise self._type_error()
+        if counts:
+            self._check_range(min(counts), max(counts))
+        annual_benefit = [self._annual_benefit[d] for d in counts]
+        benefit_per_check = [self._benefit_per_check[d] for d in counts]
+        if salaries is None:
+            return PayrollResult(benefit_per_check, [self._net_per_check[d] for d in counts],
+                                 annual_benefit, [self._annual_net[d] for d in counts])
+        salaries = list(salaries)
+        if len(salaries) != len(counts):
+            raise ValueError("dependants and salaries must have the same length.")
+        checks = Employee.NUM_PAYCHECKS_PER_YEAR
+        exact = self._benefit_exact
+        net_per_check = [round(s / checks - exact[d], 2) for d, s in zip(counts, salaries)]
+        annual_net = [round(s - a, 2) for a, s in zip(annual_benefit, salaries)]
+        return PayrollResult(benefit_per_check, net_per_check, annual_benefit, annual_net)
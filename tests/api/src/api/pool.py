@@ -0,0 +1,215 @@
+import itertools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+import requests
+
+from src.api.employee import Employee
+from src.api.namespace import DataNamespace
+
+DEFAULT_POOL_SIZE = 4
+
+_CLEAN, _SHARED, _LEASED, _RESETTING = "clean", "shared", "leased", "resetting"
+
+
+class PoolError(Exception):
+    """Raised when the pool cannot provision or hand out an employee."""
+
+
+class _Slot:
+    __slots__ = ("template", "original", "record", "state", "readers")
+
+    def __init__(self, template, record):
+        self.template = template
+        # The record as created, what a reset puts back
+        self.original = record
+        self.record = record
+        self.state = _CLEAN
+        self.readers = 0
+
+
+class EmployeePool:
+    """
+    Pre-provisioned employees shared by the tests of one session.
+
+    The pool creates `size` employees in one bulk call the first time it is
+    used. read_only() shares an instance between any number of readers and
+    keeps it out of lease() until the last reader is done; lease() gives a
+    test exclusive use of one instance it may modify or delete. When a lease
+    ends the instance is restored in the background, by a PUT with the values
+    it was created with or, if it is gone, by creating a replacement. An
+    instance that cannot be restored is dropped and reported by the
+    PoolError raised once no instance is left. close() deletes everything
+    in one batch and returns every instance that was not handed back clean.
+
+    Usage:
+        with pool.read_only() as employee:
+            client.get_employee_by_id(employee["id"])
+        with pool.lease() as employee:
+            client.delete_employee_by_id(employee["id"])
+    """
+
+    def __init__(self, client, namespace=None, size=DEFAULT_POOL_SIZE, timeout=30):
+        if size < 1:
+            raise ValueError("size must be greater than zero.")
+        self.client = client
+        # A namespace of its own, so a worker's clean_env never deletes pooled records
+        self.namespace = namespace or DataNamespace()
+        self.size = size
+        self.timeout = timeout
+        self._slots = []
+        self._condition = threading.Condition()
+        self._next = itertools.count()
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="employee-pool")
+        self._provisioned = False
+        self._closed = False
+        # (employee id, reason) of the instances dropped because a reset failed
+        self.failed_resets = []
+        # (employee id, reason) of everything close() found wrong
+        self.problems = []
+
+    def _template(self, index):
+        return self.namespace.employee(f"pooled{index}", "Pooled", f"Employee{index}")
+
+    def _provision(self):
+        templates = [self._template(index) for index in range(self.size)]
+        result = self.client.create_employees(templates)
+        slots = [_Slot(template, response.json()) for template, response in zip(templates, result)
+                 if not isinstance(response, Exception) and response.status_code == 200]
+        if len(slots) != len(templates):
+            self.client.delete_employees([slot.record["id"] for slot in slots])
+            raise PoolError(f"Could only provision {len(slots)} of {len(templates)} employees.")
+        self._slots = slots
+        self._provisioned = True
+
+    def _acquire(self, states):
+        """Picks a slot in one of `states`, preferring the earlier states, round robin."""
+        with self._condition:
+            if self._closed:
+                raise PoolError("The pool is closed.")
+            if not self._provisioned:
+                self._provision()
+            slot = None
+
+            def find_slot():
+                nonlocal slot
+                if not self._slots:
+                    return True
+                start = next(self._next)
+                for state in states:
+                    for offset in range(len(self._slots)):
+                        candidate = self._slots[(start + offset) % len(self._slots)]
+                        if candidate.state == state:
+                            slot = candidate
+                            return True
+                return False
+
+            if not self._condition.wait_for(find_slot, timeout=self.timeout) or slot is None:
+                raise PoolError(self._exhausted_message())
+            return slot
+
+    def _exhausted_message(self):
+        message = f"No pooled employee available after {self.timeout}s."
+        if not self._slots:
+            message = "The pool has no employees left."
+        if self.failed_resets:
+            dropped = ", ".join(f"{employee_id} ({reason})" for employee_id, reason in self.failed_resets)
+            message += f" {len(self.failed_resets)} were dropped after failed resets: {dropped}."
+        return message
+
+    @contextmanager
+    def read_only(self):
+        """
+        Shares a pooled employee with other readers; callers must not modify it
+        on the server. lease() does not hand it out until every reader is done.
+        """
+        with self._condition:
+            # Join the readers of a shared slot first, so clean slots stay leasable
+            slot = self._acquire((_SHARED, _CLEAN))
+            slot.state = _SHARED
+            slot.readers += 1
+            record = dict(slot.record)
+        try:
+            yield record
+        finally:
+            with self._condition:
+                slot.readers -= 1
+                if slot.readers == 0:
+                    slot.state = _CLEAN
+                    self._condition.notify_all()
+
+    @contextmanager
+    def lease(self):
+        """Gives exclusive use of a pooled employee; it is restored in the background afterwards."""
+        with self._condition:
+            slot = self._acquire((_CLEAN,))
+            slot.state = _LEASED
+        try:
+            yield dict(slot.record)
+        finally:
+            with self._condition:
+                # Once closed, close() has deleted and reported it already
+                closed = self._closed
+                if not closed:
+                    slot.state = _RESETTING
+            if not closed:
+                self._executor.submit(self._reset, slot)
+
+    def _reset(self, slot):
+        original = slot.original
+        employee_id = original["id"]
+        restored = Employee(original["username"], original["firstName"], original["lastName"],
+                            original.get("dependants", 0), original.get("expiration"),
+                            original.get("salary"), id=employee_id)
+        reason = None
+        try:
+            response = self.client.update_employee(restored)
+            if response.status_code != 200:
+                # Deleted or broken by the test, replace it with a fresh copy
+                self.client.delete_employee_by_id(employee_id)
+                response = self.client.create_employee(slot.template)
+            if response.status_code == 200:
+                record = response.json()
+            else:
+                record, reason = None, f"status {response.status_code}"
+        except Exception as e:
+            record, reason = None, repr(e)
+        with self._condition:
+            if record is not None:
+                if record["id"] != employee_id:
+                    slot.original = record
+                slot.record = record
+                slot.state = _CLEAN
+            else:
+                self._slots.remove(slot)
+                self.failed_resets.append((employee_id, reason))
+            self._condition.notify_all()
+
+    def close(self):
+        """
+        Waits for pending resets, then deletes every pooled employee in one batch,
+        dropped ones included. Returns, and keeps in `problems`, (employee id,
+        reason) for every instance dropped after a failed reset, still leased or
+        read when the pool closed, or that could not be deleted.
+        """
+        with self._condition:
+            self._closed = True
+            unreturned = [(slot.record["id"], f"still {slot.state} at close") for slot in self._slots
+                          if slot.state in (_LEASED, _SHARED)]
+        self._executor.shutdown(wait=True)
+        with self._condition:
+            problems = list(self.failed_resets) + unreturned
+            dropped = {employee_id for employee_id, _ in self.failed_resets}
+            # Dropped instances may still exist on the server, try them too
+            ids = [slot.record["id"] for slot in self._slots] + sorted(dropped)
+            self._slots = []
+        if ids:
+            result = self.client.delete_employees(ids)
+            for _, employee_id, error in result.failures:
+                # A dropped instance is usually gone already
+                if employee_id not in dropped:
+                    reason = f"status {error.status_code}" if isinstance(error, requests.Response) else repr(error)
+                    problems.append((employee_id, f"delete failed: {reason}"))
+        self.problems = problems
+        return problems
@@ -0,0 +1,144 @@
+import functools
+import json
+import re
+from collections import namedtuple
+
+from src.configs import api_configs
+
+ValidationError = namedtuple("ValidationError", ["path", "message"])
+
+UUID_PATTERN = re.compile(
+    r"^(?:[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}"
+    r"|[0-9a-fA-F]{32})$")
+DATE_TIME_PATTERN = re.compile(
+    r"^\d{4}-(0[1-9]|1[0-2])-(0[1-9]|[12]\d|3[01])[Tt ]([01]\d|2[0-3]):[0-5]\d:([0-5]\d|60)"
+    r"(\.\d+)?([Zz]|[+-]([01]\d|2[0-3]):?[0-5]\d)?$")
+INT32_RANGE = (-2 ** 31, 2 ** 31 - 1)
+
+# Bounds of the Employee properties in docs/swagger.json
+MAX_USERNAME_LENGTH = 50
+MAX_NAME_LENGTH = 50
+MIN_DEPENDANTS = 0
+MAX_DEPENDANTS = 32
+
+
+def _compile_property(name, spec):
+    """Builds a function returning an error message for an invalid value, or None."""
+    kind = spec.get("type")
+    nullable = spec.get("nullable", False)
+    fmt = spec.get("format")
+    min_length, max_length = spec.get("minLength"), spec.get("maxLength")
+    minimum, maximum = spec.get("minimum"), spec.get("maximum")
+    if kind == "integer" and fmt == "int32":
+        minimum = INT32_RANGE[0] if minimum is None else minimum
+        maximum = INT32_RANGE[1] if maximum is None else maximum
+    pattern = {"uuid": UUID_PATTERN, "date-time": DATE_TIME_PATTERN}.get(fmt) if kind == "string" else None
+
+    def check(value):
+        if value is None:
+            return None if nullable else "must not be null"
+        value_type = type(value)
+        if kind == "string":
+            if value_type is not str:
+                return "must be a string"
+            if min_length is not None and len(value) < min_length:
+                return f"must be at least {min_length} characters long"
+            if max_length is not None and len(value) > max_length:
+                return f"must be at most {max_length} characters long"
+            if pattern is not None and not pattern.match(value):
+                return f"must be a valid {fmt}"
+            return None
+        if kind == "integer":
+            if value_type is not int:
+                return "must be an integer"
+        elif kind == "number":
+            if value_type is not int and value_type is not float:
+                return "must be a number"
+        elif kind == "boolean":
+            return None if value_type is bool else "must be a boolean"
+        else:
+            return None
+        if minimum is not None and value < minimum:
+            return f"must be greater than or equal to {minimum}"
+        if maximum is not None and value > maximum:
+            return f"must be less than or equal to {maximum}"
+        return None
+
+    return check
+
+
+class SchemaValidator:
+    """
+    Validator compiled from an OpenAPI object schema.
+
+    The schema is turned into one check function per property up front, so
+    validating an object is a dict walk with no schema lookups.
+
+    Args:
+        schema: an OpenAPI "type: object" schema.
+        direction: "response" validates documents returned by the API;
+            "request" ignores readOnly properties, which clients may not set.
+    """
+
+    def __init__(self, schema, direction="response"):
+        if direction not in ("request", "response"):
+            raise ValueError("direction must be 'request' or 'response'.")
+        properties = schema.get("properties", {})
+        if direction == "request":
+            self._ignored = frozenset(name for name, spec in properties.items() if spec.get("readOnly"))
+        else:
+            self._ignored = frozenset()
+        self._checks = {name: _compile_property(name, spec) for name, spec in properties.items()
+                        if name not in self._ignored}
+        self._required = frozenset(schema.get("required", ()))
+        self._closed = schema.get("additionalProperties", True) is False
+        self._known = frozenset(properties)
+
+    def validate(self, obj, path=""):
+        """Returns a list of ValidationError for one object, empty when valid."""
+        if type(obj) is not dict:
+            return [ValidationError(path, "must be an object")]
+        errors = []
+        keys = obj.keys()
+        if not self._required <= keys:
+            errors.extend(ValidationError(f"{path}.{name}" if path else name, "is required")
+                          for name in sorted(self._required - keys))
+        if self._closed and not keys <= self._known:
+            errors.extend(ValidationError(f"{path}.{name}" if path else name, "is not allowed")
+                          for name in sorted(keys - self._known))
+        checks = self._checks
+        for name, value in obj.items():
+            check = checks.get(name)
+            if check is not None:
+                message = check(value)
+                if message is not None:
+                    errors.append(ValidationError(f"{path}.{name}" if path else name, message))
+        return errors
+
+    def validate_many(self, objects):
+        """Validates a whole list in one pass; paths are prefixed with the item index."""
+        if type(objects) is not list:
+            return [ValidationError("", "must be an array")]
+        errors = []
+        validate = self.validate
+        for index, obj in enumerate(objects):
+            found = validate(obj, f"[{index}]")
+            if found:
+                errors.extend(found)
+        return errors
+
+    def is_valid(self, obj):
+        return not self.validate(obj)
+
+
+@functools.lru_cache(maxsize=None)
+def load_swagger(swagger_path=None):
+    with open(swagger_path or api_configs.SWAGGER_PATH) as f:
+        return json.load(f)
+
+
+@functools.lru_cache(maxsize=None)
+def get_employee_validator(direction="response", swagger_path=None):
+    """Returns the Employee validator, compiled once per process and direction."""
+    schema = load_swagger(swagger_path)["components"]["schemas"]["Employee"]
+    return SchemaValidator(schema, direction)
@@ -0,0 +1,31 @@
+import json
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+
+def dumps(obj):
+    """Encodes obj to compact JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def loads(data):
+    """Decodes JSON from bytes or str, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def encode_employee(employee, only_required=False):
+    """Encodes an Employee to the compact JSON bytes of its request body."""
+    return dumps(employee.required_fields_to_dict() if only_required else employee.to_dict())
+
+
+def encode_employees(employees, only_required=False):
+    """Encodes many Employees as one JSON array."""
+    return dumps([employee.required_fields_to_dict() if only_required else employee.to_dict()
+                  for employee in employees])
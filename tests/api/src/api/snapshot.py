@@ -0,0 +1,67 @@
+from collections import namedtuple
+
+SnapshotDiff = namedtuple("SnapshotDiff", ["added", "removed", "changed"])
+SnapshotDiff.__doc__ = """
+Ids added, removed and changed between two snapshots, as frozensets.
+"""
+
+
+class EmployeeSnapshot:
+    """
+    Indexed, read-only view of a GET /api/Employees response.
+
+    Employees are indexed by id, username and (firstName, lastName) when the
+    snapshot is built, so membership checks and lookups are O(1) and two
+    snapshots are diffed with set operations in one pass.
+    """
+
+    def __init__(self, employees):
+        self._by_id = {}
+        self._by_username = {}
+        self._by_name = {}
+        for employee in employees:
+            self._by_id[employee["id"]] = employee
+            self._by_username.setdefault(employee.get("username"), []).append(employee)
+            self._by_name.setdefault(
+                (employee.get("firstName"), employee.get("lastName")), []).append(employee)
+
+    @classmethod
+    def from_response(cls, response):
+        """Builds a snapshot from a get_all_employees() response."""
+        return cls(response.json())
+
+    @classmethod
+    def fetch(cls, client):
+        """Reads the current employee list through an APIClient."""
+        return cls.from_response(client.get_all_employees())
+
+    def __len__(self):
+        return len(self._by_id)
+
+    def __iter__(self):
+        return iter(self._by_id.values())
+
+    def __contains__(self, employee_id):
+        return employee_id in self._by_id
+
+    @property
+    def ids(self):
+        return self._by_id.keys()
+
+    def get(self, employee_id, default=None):
+        return self._by_id.get(employee_id, default)
+
+    def find_by_username(self, username):
+        return list(self._by_username.get(username, ()))
+
+    def find_by_name(self, first_name, last_name):
+        return list(self._by_name.get((first_name, last_name), ()))
+
+    def diff(self, newer):
+        """Compares this snapshot with a newer one."""
+        before, after = self._by_id, newer._by_id
+        added = frozenset(after.keys() - before.keys())
+        removed = frozenset(before.keys() - after.keys())
+        changed = frozenset(employee_id for employee_id in before.keys() & after.keys()
+                            if before[employee_id] != after[employee_id])
+        return SnapshotDiff(added, removed, changed)
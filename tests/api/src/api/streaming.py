@@ -0,0 +1,70 @@
+import codecs
+import json
+import re
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_NUMBER_TAIL = re.compile(r"[0-9.eE+\-]*")
+
+
+def iter_json_array(chunks):
+    """
+    Incrementally parses a top level JSON array from an iterable of byte chunks
+    and yields its elements one at a time.
+
+    Only the element being parsed is held in memory, so memory use depends on
+    the size of one element rather than the size of the whole document.
+    Raises ValueError when the document is not a well formed JSON array.
+    """
+    chunks = iter(chunks)
+    text_decoder = codecs.getincrementaldecoder("utf-8")()
+    buffer, pos, exhausted = "", 0, False
+    state = "open"
+
+    while True:
+        pos = _WHITESPACE.match(buffer, pos).end()
+        if pos == len(buffer):
+            if exhausted:
+                raise ValueError("Unexpected end of JSON array.")
+            buffer, pos, exhausted = _read_more(chunks, text_decoder, buffer, pos)
+            continue
+
+        if state == "open":
+            if buffer[pos] != "[":
+                raise ValueError("Expected a JSON array.")
+            pos += 1
+            state = "first"
+        elif state == "separator":
+            if buffer[pos] == "]":
+                return
+            if buffer[pos] != ",":
+                raise ValueError(f"Expected ',' or ']' at offset {pos}.")
+            pos += 1
+            state = "value"
+        else:
+            if state == "first" and buffer[pos] == "]":
+                return
+            try:
+                value, end = _decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                if exhausted:
+                    raise
+                buffer, pos, exhausted = _read_more(chunks, text_decoder, buffer, pos)
+                continue
+            # A number running up to the end of the buffer ("12", "1.", "2e")
+            # may continue in the next chunk, parse it again with more data
+            if not exhausted and type(value) in (int, float) and \
+                    _NUMBER_TAIL.match(buffer, end).end() == len(buffer):
+                buffer, pos, exhausted = _read_more(chunks, text_decoder, buffer, pos)
+                continue
+            yield value
+            pos = end
+            state = "separator"
+
+
+def _read_more(chunks, text_decoder, buffer, pos):
+    """Drops the consumed part of the buffer and appends the next chunk."""
+    for chunk in chunks:
+        if chunk:
+            return buffer[pos:] + text_decoder.decode(chunk), 0, False
+    return buffer[pos:] + text_decoder.decode(b"", final=True), 0, True
@@ -0,0 +1,221 @@
+"""
+Adaptive client-side rate and concurrency limiting for APIClient.
+
+AdaptiveThrottle combines a token bucket (requests per second) with a cap on
+requests in flight and tunes both AIMD style, like TCP congestion control:
+
+* every healthy response adds `rate_increase / rate` tokens/s to the rate and
+  `concurrency_increase / concurrency` to the cap, i.e. they grow linearly
+  while the service keeps up;
+* a congestion signal (a status in `congestion_statuses`, a connection error
+  or a response slower than `latency_target_ms`) multiplies both by
+  `decrease`. Only the first signal of a window counts: responses to
+  requests sent before the last decrease do not shrink the limits again.
+
+A Retry-After header on a congestion response also pauses the bucket.
+
+While a throttle is active, APIClient sends without the transport's own
+retries and lets call() retry instead: every attempt takes a token and a
+slot and reports its outcome, so retried congestion is seen by the AIMD
+and backoff happens without holding a slot.
+
+enable() shares one throttle between every APIClient in the process, so all
+clients together stay close to the service's sustainable throughput.
+"""
+import math
+import threading
+import time
+from collections import namedtuple
+
+import requests
+
+CONGESTION_STATUS_CODES = (429, 500, 502, 503, 504)
+
+ThrottleConfig = namedtuple("ThrottleConfig", [
+    "rate",                  # initial requests per second
+    "min_rate",
+    "max_rate",
+    "burst",                 # token bucket capacity
+    "concurrency",           # initial cap on requests in flight
+    "min_concurrency",
+    "max_concurrency",
+    "rate_increase",         # tokens/s added per second of healthy traffic
+    "concurrency_increase",  # in-flight slots added per window of healthy traffic
+    "decrease",              # multiplicative factor applied on congestion
+    "latency_target_ms",     # slower responses count as congestion, None disables
+    "congestion_statuses",
+    "max_retries",           # retries of a congested attempt in call(..., retry=True)
+    "backoff_factor",        # sleep before retry n is backoff_factor * 2 ** (n - 1) seconds
+], defaults=[20.0, 1.0, 1000.0, 10, 4, 1, 64, 5.0, 1.0, 0.5, None, CONGESTION_STATUS_CODES, 3, 0.1])
+ThrottleConfig.__doc__ = """
+Starting point and bounds of an AdaptiveThrottle.
+"""
+
+
+class AdaptiveThrottle:
+    """
+    Token bucket plus AIMD concurrency control shared by any number of clients.
+
+    Usage:
+        throttle = AdaptiveThrottle(ThrottleConfig(rate=50, max_concurrency=16))
+        client = APIClient(throttle=throttle)
+        throttle.metrics()
+    """
+
+    def __init__(self, config=None, clock=time.monotonic):
+        self.config = config or ThrottleConfig()
+        self.clock = clock
+        self._condition = threading.Condition()
+        self._rate = float(self.config.rate)
+        self._concurrency = float(self.config.concurrency)
+        self._tokens = float(self.config.burst)
+        self._refilled_at = clock()
+        self._paused_until = 0.0
+        self._last_decrease = float("-inf")
+        self._in_flight = 0
+        self._counters = {"requests": 0, "retries": 0, "congested": 0, "errors": 0, "increases": 0,
+                          "decreases": 0, "waited_s": 0.0}
+
+    def _refill(self, now):
+        elapsed = now - self._refilled_at
+        if elapsed > 0:
+            self._tokens = min(float(self.config.burst), self._tokens + elapsed * self._rate)
+            self._refilled_at = now
+
+    def _wait_time(self, now):
+        """Seconds until a request may start, 0 when it can start now."""
+        if now < self._paused_until:
+            return self._paused_until - now
+        if self._in_flight >= math.floor(self._concurrency):
+            # Woken up by release()
+            return None
+        if self._tokens < 1:
+            return (1 - self._tokens) / self._rate
+        return 0
+
+    def acquire(self):
+        """Blocks until a token and an in-flight slot are free. Returns the send time."""
+        with self._condition:
+            waited_from = self.clock()
+            while True:
+                now = self.clock()
+                self._refill(now)
+                wait = self._wait_time(now)
+                if wait == 0:
+                    break
+                self._condition.wait(wait)
+            self._tokens -= 1
+            self._in_flight += 1
+            self._counters["requests"] += 1
+            self._counters["waited_s"] += now - waited_from
+            return now
+
+    def release(self, sent_at, status=None, elapsed=None, retry_after=None):
+        """
+        Frees the slot taken by acquire() and adapts the limits to the outcome.
+        A status of None means the request failed without a response.
+        """
+        config = self.config
+        with self._condition:
+            self._in_flight -= 1
+            slow = (config.latency_target_ms is not None and elapsed is not None
+                    and elapsed * 1000 > config.latency_target_ms)
+            if status is None:
+                self._counters["errors"] += 1
+            if status is None or status in config.congestion_statuses or slow:
+                self._counters["congested"] += 1
+                if retry_after:
+                    self._paused_until = max(self._paused_until, self.clock() + retry_after)
+                if sent_at >= self._last_decrease:
+                    self._decrease()
+            else:
+                self._increase()
+            self._condition.notify_all()
+
+    def _increase(self):
+        config = self.config
+        self._rate = min(config.max_rate, self._rate + config.rate_increase / self._rate)
+        self._concurrency = min(float(config.max_concurrency),
+                                self._concurrency + config.concurrency_increase / self._concurrency)
+        self._counters["increases"] += 1
+
+    def _decrease(self):
+        config = self.config
+        self._rate = max(config.min_rate, self._rate * config.decrease)
+        self._concurrency = max(float(config.min_concurrency), self._concurrency * config.decrease)
+        self._last_decrease = self.clock()
+        self._counters["decreases"] += 1
+
+    def call(self, send, retry=False):
+        """
+        Runs send() within the limits and feeds its outcome back into them.
+        With retry, a congestion status or connection error is retried up to
+        max_retries times, each attempt going through the limits again; the
+        last response is returned, or the last error raised.
+        """
+        config = self.config
+        attempt = 0
+        while True:
+            sent_at = self.acquire()
+            started = time.perf_counter()
+            try:
+                response = send()
+            except requests.ConnectionError:
+                self.release(sent_at, None, time.perf_counter() - started)
+                if not retry or attempt >= config.max_retries:
+                    raise
+            except Exception:
+                self.release(sent_at, None, time.perf_counter() - started)
+                raise
+            else:
+                self.release(sent_at, response.status_code, time.perf_counter() - started,
+                             _retry_after(response))
+                if not retry or attempt >= config.max_retries or \
+                        response.status_code not in config.congestion_statuses:
+                    return response
+            attempt += 1
+            with self._condition:
+                self._counters["retries"] += 1
+            # Back off without a slot; a Retry-After pause is applied by acquire()
+            time.sleep(config.backoff_factor * 2 ** (attempt - 1))
+
+    def metrics(self):
+        """Current limits and counters, e.g. for logging or a benchmark report."""
+        with self._condition:
+            metrics = {
+                "rate": round(self._rate, 3),
+                "concurrency_limit": math.floor(self._concurrency),
+                "in_flight": self._in_flight,
+                "tokens": round(self._tokens, 3),
+            }
+            metrics.update(self._counters)
+        metrics["waited_s"] = round(metrics["waited_s"], 3)
+        return metrics
+
+
+def _retry_after(response):
+    """Retry-After of a response in seconds; HTTP dates are ignored."""
+    value = response.headers.get("Retry-After")
+    try:
+        return max(float(value), 0.0) if value else None
+    except ValueError:
+        return None
+
+
+_global_throttle = None
+
+
+def enable(throttle=None):
+    """Throttles every APIClient in the process that has no throttle of its own."""
+    global _global_throttle
+    _global_throttle = throttle or AdaptiveThrottle()
+    return _global_throttle
+
+
+def disable():
+    global _global_throttle
+    _global_throttle = None
+
+
+def get_global_throttle():
+    return _global_throttle
@@ -0,0 +1,264 @@
+import socket
+import threading
+import time
+from collections import namedtuple
+from contextlib import contextmanager
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.poolmanager import PoolManager
+from urllib3.util import connection as urllib3_connection
+from urllib3.util.connection import allowed_gai_family
+from urllib3.util.retry import Retry
+
+from src.api import instrumentation
+
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+# Idempotent methods only, a POST is never sent twice
+RETRIED_METHODS = Retry.DEFAULT_ALLOWED_METHODS
+NO_RETRIES = Retry(0, read=False)
+
+TransportConfig = namedtuple("TransportConfig", [
+    "pool_connections",  # number of per-host pools kept alive
+    "pool_maxsize",      # keep-alive connections kept per host
+    "max_retries",       # retries for connection errors and RETRY_STATUS_CODES
+    "backoff_factor",    # sleep is backoff_factor * 2 ** (retry - 1) seconds
+    "backoff_jitter",    # random extra sleep of up to this many seconds
+    "backoff_max",       # upper bound for a single backoff sleep
+    "status_forcelist",
+], defaults=[10, 10, 3, 0.3, 0.2, 10.0, RETRY_STATUS_CODES])
+TransportConfig.__doc__ = """
+Connection pool and retry settings shared by every client built from it.
+POST is never retried, only idempotent methods are.
+"""
+
+
+class ConnectionStats:
+    """Thread safe counters for requests sent and connections opened."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.opened = 0
+
+    def add_request(self):
+        with self._lock:
+            self.requests += 1
+
+    def add_connection(self):
+        with self._lock:
+            self.opened += 1
+
+    @property
+    def reused(self):
+        """Requests that went over an already open keep-alive connection."""
+        return max(self.requests - self.opened, 0)
+
+    def as_dict(self):
+        with self._lock:
+            return {"requests": self.requests, "opened": self.opened,
+                    "reused": max(self.requests - self.opened, 0)}
+
+
+class _CountingPoolManager(PoolManager):
+    def __init__(self, stats, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.stats = stats
+
+    def _new_pool(self, scheme, host, port, request_context=None):
+        pool = super()._new_pool(scheme, host, port, request_context=request_context)
+        new_conn = pool._new_conn
+        stats = self.stats
+
+        def counted_new_conn():
+            stats.add_connection()
+            return _timed_connection(new_conn())
+
+        pool._new_conn = counted_new_conn
+        return pool
+
+
+def _timed_connection(conn):
+    """
+    Reports the connect (TCP plus TLS) duration of a new connection to the
+    instrumented request running on the current thread, if any. The DNS lookup
+    done while connecting is timed by _timed_create_connection and left out.
+    """
+    connect = conn.connect
+
+    def timed_connect():
+        times = instrumentation.current_connection_times()
+        dns_before = times.dns if times is not None else 0.0
+        started = time.perf_counter()
+        try:
+            return connect()
+        finally:
+            if times is not None:
+                times.connect += time.perf_counter() - started - (times.dns - dns_before)
+
+    conn.connect = timed_connect
+    return conn
+
+
+def _timed_create_connection(address, *args, **kwargs):
+    """
+    urllib3's create_connection, but for an instrumented request it resolves the
+    host itself and times that lookup as the request's DNS duration. Every
+    address is then tried in turn, as urllib3 does, without a second lookup.
+    """
+    times = instrumentation.current_connection_times()
+    if times is None:
+        return _create_connection(address, *args, **kwargs)
+    host, port = address
+    started = time.perf_counter()
+    try:
+        addresses = socket.getaddrinfo(host.strip("[]"), port, allowed_gai_family(), socket.SOCK_STREAM)
+    finally:
+        times.dns += time.perf_counter() - started
+    error = OSError("getaddrinfo returns an empty list")
+    for *_, sockaddr in addresses:
+        try:
+            return _create_connection(sockaddr[:2], *args, **kwargs)
+        except OSError as e:
+            error = e
+    raise error
+
+
+_create_connection = urllib3_connection.create_connection
+# urllib3.connection looks the function up on this module for every new connection
+urllib3_connection.create_connection = _timed_create_connection
+
+
+_local = threading.local()
+
+
+@contextmanager
+def unretried():
+    """
+    Requests sent by this thread inside the block are not retried by a
+    CountingHTTPAdapter, for callers that retry on their own (AdaptiveThrottle).
+    They still go over the adapter's pools like every other request.
+    """
+    previous = getattr(_local, "unretried", False)
+    _local.unretried = True
+    try:
+        yield
+    finally:
+        _local.unretried = previous
+
+
+class CountingHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter that records how many connections it opens and reuses."""
+
+    def __init__(self, *args, **kwargs):
+        self.stats = ConnectionStats()
+        super().__init__(*args, **kwargs)
+
+    @property
+    def max_retries(self):
+        # HTTPAdapter.send() reads it for every request it sends
+        if getattr(_local, "unretried", False):
+            return NO_RETRIES
+        return self._max_retries
+
+    @max_retries.setter
+    def max_retries(self, value):
+        self._max_retries = value
+
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        super().init_poolmanager(connections, maxsize, block, **pool_kwargs)
+        self.poolmanager = _CountingPoolManager(
+            self.stats, num_pools=connections, maxsize=maxsize, block=block, **pool_kwargs)
+
+    def send(self, request, *args, **kwargs):
+        self.stats.add_request()
+        return super().send(request, *args, **kwargs)
+
+
+def build_retry(config):
+    return Retry(
+        total=config.max_retries,
+        backoff_factor=config.backoff_factor,
+        backoff_jitter=config.backoff_jitter,
+        backoff_max=config.backoff_max,
+        status_forcelist=config.status_forcelist,
+        allowed_methods=RETRIED_METHODS,
+        respect_retry_after_header=True,
+        # Hand the last response back to the caller instead of raising
+        raise_on_status=False,
+    )
+
+
+def create_session(config=None):
+    """Builds a new requests.Session configured with the given TransportConfig."""
+    config = config or TransportConfig()
+    session = requests.Session()
+    adapter = CountingHTTPAdapter(pool_connections=config.pool_connections,
+                                  pool_maxsize=config.pool_maxsize,
+                                  max_retries=build_retry(config))
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+_shared_sessions = {}
+_shared_lock = threading.Lock()
+
+
+def get_session(config=None):
+    """
+    Returns the process wide session for a TransportConfig.
+    Clients built with the same config share keep-alive connections.
+    """
+    config = config or TransportConfig()
+    with _shared_lock:
+        session = _shared_sessions.get(config)
+        if session is None:
+            session = _shared_sessions[config] = create_session(config)
+        return session
+
+
+def pool_maxsize(session):
+    """Smallest keep-alive pool, in connections per host, of the HTTP adapters of a session."""
+    return min((adapter._pool_maxsize for adapter in session.adapters.values()
+                if isinstance(adapter, HTTPAdapter)), default=0)
+
+
+def resized_session(session, maxsize):
+    """
+    Returns a new session with the settings of `session` and new HTTP adapters
+    of maxsize keep-alive connections per host. `session` and every client
+    sharing it keep their own pools.
+    """
+    resized = requests.Session()
+    for name in requests.Session.__attrs__:
+        if name != "adapters":
+            setattr(resized, name, getattr(session, name))
+    copies = {}
+    for prefix, adapter in session.adapters.items():
+        if isinstance(adapter, HTTPAdapter):
+            if id(adapter) not in copies:
+                copies[id(adapter)] = type(adapter)(pool_connections=adapter._pool_connections,
+                                                    pool_maxsize=maxsize, max_retries=adapter.max_retries,
+                                                    pool_block=adapter._pool_block)
+            adapter = copies[id(adapter)]
+        resized.mount(prefix, adapter)
+    return resized
+
+
+def session_stats(session):
+    """Returns request, opened and reused connection counts for a session."""
+    stats = ConnectionStats()
+    for adapter in {id(a): a for a in session.adapters.values()}.values():
+        if isinstance(adapter, CountingHTTPAdapter):
+            counts = adapter.stats.as_dict()
+            stats.requests += counts["requests"]
+            stats.opened += counts["opened"]
+    return stats.as_dict()
+
+
+def close_shared_sessions():
+    with _shared_lock:
+        for session in _shared_sessions.values():
+            session.close()
+        _shared_sessions.clear()
@@ -0,0 +1,279 @@
+"""
+Load and benchmark harness for the Benefits API Employees endpoints.
+
+Drives APIClient through a weighted CRUD mix following a ramp profile and
+reports requests/sec, error rate and latency percentiles per endpoint as JSON.
+
+Usage (from tests/api):
+    python -m src.benchmark.load --duration 30 --concurrency 8 --output bench.json
+    python -m src.benchmark.load --ramp 10:2,20:8,10:16 --mix get_all=1,get_by_id=4,create=2
+    python -m src.benchmark.load --local --duration 5
+    python -m src.benchmark.load --ramp 10:8,20:32 --adaptive
+"""
+import argparse
+import json
+import random
+import sys
+import threading
+import time
+from collections import namedtuple
+from datetime import datetime, timezone
+
+from src.api.api_client import APIClient
+from src.api.employee import Employee
+from src.api.instrumentation import percentile
+from src.api.local_server import LocalBenefitsServer
+from src.api.throttle import AdaptiveThrottle, ThrottleConfig
+from src.api.transport import TransportConfig
+
+ENDPOINTS = {
+    "get_all": "GET /api/Employees",
+    "get_by_id": "GET /api/Employees/{id}",
+    "create": "POST /api/Employees",
+    "update": "PUT /api/Employees",
+    "delete": "DELETE /api/Employees/{id}",
+}
+DEFAULT_MIX = {"get_all": 1, "get_by_id": 4, "create": 2, "update": 2, "delete": 1}
+PERCENTILES = (50, 90, 99)
+
+Stage = namedtuple("Stage", ["duration", "concurrency"])
+
+
+class _Recorder:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.latencies = {name: [] for name in ENDPOINTS}
+        self.errors = {name: 0 for name in ENDPOINTS}
+
+    def add(self, operation, seconds, failed):
+        with self._lock:
+            self.latencies[operation].append(seconds)
+            if failed:
+                self.errors[operation] += 1
+
+
+class LoadScenario:
+    """
+    One benchmark run against a Benefits API.
+
+    Args:
+        base_url: API to target, e.g. a LocalBenefitsServer base_url.
+        mix: relative weight per operation, keys from ENDPOINTS.
+        stages: list of Stage(duration seconds, concurrency) run back to back.
+        seed_employees: employees created before the run so reads have targets.
+        keep_data: leave the employees created by the run on the server.
+        throttle: AdaptiveThrottle pacing the requests; its final limits are reported.
+            Give it max_retries=0, or the failures it retries are hidden from
+            the results and only show up in its "retries" counter.
+    """
+
+    def __init__(self, base_url=None, mix=None, stages=None, seed_employees=20,
+                 keep_data=False, api_key=None, throttle=None):
+        self.mix = dict(mix or DEFAULT_MIX)
+        unknown = set(self.mix) - set(ENDPOINTS)
+        if unknown:
+            raise ValueError(f"Unknown operations in mix: {', '.join(sorted(unknown))}.")
+        self.stages = [Stage(*stage) for stage in (stages or [Stage(10, 4)])]
+        self.seed_employees = seed_employees
+        self.keep_data = keep_data
+        max_concurrency = max(stage.concurrency for stage in self.stages)
+        # No retries: the benchmark has to see every failure the service returns.
+        # A throttle sends without these and retries as its config says
+        config = TransportConfig(pool_maxsize=max_concurrency, max_retries=0)
+        kwargs = {"api_key": api_key} if api_key else {}
+        self.throttle = throttle
+        self.client = APIClient(base_url=base_url, transport_config=config, throttle=throttle, **kwargs)
+        self._ids = []
+        self._ids_lock = threading.Lock()
+        self._operations = list(self.mix)
+        self._weights = [self.mix[name] for name in self._operations]
+
+    def _pick_id(self, remove=False):
+        with self._ids_lock:
+            if not self._ids:
+                return None
+            index = random.randrange(len(self._ids))
+            if remove:
+                # Swap with the tail so removal stays O(1)
+                self._ids[index], self._ids[-1] = self._ids[-1], self._ids[index]
+                return self._ids.pop()
+            return self._ids[index]
+
+    def _remember(self, response):
+        if response.status_code == 200:
+            with self._ids_lock:
+                self._ids.append(response.json()["id"])
+
+    def _new_employee(self, employee_id=None):
+        suffix = random.randrange(10 ** 8)
+        return Employee(f"bench{suffix}", "Bench", f"User{suffix}",
+                        dependants=random.randint(0, 32), id=employee_id)
+
+    def _execute(self, operation):
+        if operation in ("get_by_id", "update", "delete"):
+            employee_id = self._pick_id(remove=operation == "delete")
+            if employee_id is None:
+                operation = "create"
+        if operation == "get_all":
+            return operation, self.client.get_all_employees()
+        if operation == "get_by_id":
+            return operation, self.client.get_employee_by_id(employee_id)
+        if operation == "update":
+            return operation, self.client.update_employee(self._new_employee(employee_id))
+        if operation == "delete":
+            return operation, self.client.delete_employee_by_id(employee_id)
+        response = self.client.create_employee(self._new_employee())
+        self._remember(response)
+        return operation, response
+
+    def _worker(self, index, recorder, schedule, stop):
+        while not stop.is_set():
+            if index >= schedule.current_concurrency():
+                time.sleep(0.01)
+                continue
+            operation = random.choices(self._operations, self._weights)[0]
+            started = time.perf_counter()
+            try:
+                operation, response = self._execute(operation)
+                failed = response.status_code >= 400
+            except Exception:
+                failed = True
+            recorder.add(operation, time.perf_counter() - started, failed)
+
+    def run(self):
+        """Runs every stage and returns the report as a dict."""
+        for response in self.client.create_employees(
+                self._new_employee() for _ in range(self.seed_employees)):
+            if not isinstance(response, Exception):
+                self._remember(response)
+
+        recorder = _Recorder()
+        schedule = _Schedule(self.stages)
+        stop = threading.Event()
+        workers = [threading.Thread(target=self._worker, args=(i, recorder, schedule, stop), daemon=True)
+                   for i in range(max(stage.concurrency for stage in self.stages))]
+        started_at = datetime.now(timezone.utc).isoformat()
+        start = time.perf_counter()
+        schedule.start()
+        for worker in workers:
+            worker.start()
+        time.sleep(sum(stage.duration for stage in self.stages))
+        stop.set()
+        for worker in workers:
+            worker.join()
+        elapsed = time.perf_counter() - start
+
+        if not self.keep_data:
+            self.client.delete_employees(list(self._ids))
+        return self._report(recorder, elapsed, started_at)
+
+    def _report(self, recorder, elapsed, started_at):
+        endpoints = {}
+        all_latencies = []
+        total_errors = 0
+        for operation, endpoint in ENDPOINTS.items():
+            latencies = sorted(recorder.latencies[operation])
+            if not latencies:
+                continue
+            all_latencies.extend(latencies)
+            total_errors += recorder.errors[operation]
+            endpoints[endpoint] = _summary(latencies, recorder.errors[operation], elapsed)
+        return {
+            "base_url": self.client.base_url,
+            "started_at": started_at,
+            "duration_s": round(elapsed, 3),
+            "mix": self.mix,
+            "stages": [stage._asdict() for stage in self.stages],
+            "total": _summary(sorted(all_latencies), total_errors, elapsed),
+            "endpoints": endpoints,
+            "throttle": self.throttle.metrics() if self.throttle is not None else None,
+        }
+
+
+def _summary(sorted_latencies, errors, elapsed):
+    count = len(sorted_latencies)
+    summary = {
+        "requests": count,
+        "errors": errors,
+        "error_rate": round(errors / count, 4) if count else 0.0,
+        "rps": round(count / elapsed, 2) if elapsed else 0.0,
+    }
+    for pct in PERCENTILES:
+        value = percentile(sorted_latencies, pct)
+        summary[f"p{pct}_ms"] = None if value is None else round(value * 1000, 3)
+    return summary
+
+
+class _Schedule:
+    """Maps elapsed time to the concurrency of the active stage."""
+
+    def __init__(self, stages):
+        self.stages = stages
+        self._start = None
+
+    def start(self):
+        self._start = time.perf_counter()
+
+    def current_concurrency(self):
+        elapsed = time.perf_counter() - self._start
+        for stage in self.stages:
+            if elapsed < stage.duration:
+                return stage.concurrency
+            elapsed -= stage.duration
+        return 0
+
+
+def _parse_mix(text):
+    mix = {}
+    for item in text.split(","):
+        name, _, weight = item.partition("=")
+        mix[name.strip()] = float(weight)
+    return mix
+
+
+def _parse_ramp(text):
+    stages = []
+    for item in text.split(","):
+        duration, _, concurrency = item.partition(":")
+        stages.append(Stage(float(duration), int(concurrency)))
+    return stages
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the Benefits API Employees endpoints.")
+    parser.add_argument("--base-url", help="API base URL, defaults to api_configs.BASE_URL.")
+    parser.add_argument("--local", action="store_true", help="Benchmark the in-process stand-in.")
+    parser.add_argument("--duration", type=float, default=10, help="Seconds for a single stage run.")
+    parser.add_argument("--concurrency", type=int, default=4, help="Workers for a single stage run.")
+    parser.add_argument("--ramp", type=_parse_ramp,
+                        help="Stages as duration:concurrency pairs, e.g. 10:2,20:8.")
+    parser.add_argument("--mix", type=_parse_mix, help="Weights, e.g. get_all=1,create=2.")
+    parser.add_argument("--seed", type=int, default=20, help="Employees created before the run.")
+    parser.add_argument("--keep-data", action="store_true", help="Do not delete created employees.")
+    parser.add_argument("--adaptive", action="store_true",
+                        help="Let an AdaptiveThrottle tune rate and concurrency during the run.")
+    parser.add_argument("--output", help="Write the JSON report to this file instead of stdout.")
+    args = parser.parse_args(argv)
+
+    stages = args.ramp or [Stage(args.duration, args.concurrency)]
+    server = LocalBenefitsServer().start() if args.local else None
+    try:
+        base_url = server.base_url if server else args.base_url
+        throttle = AdaptiveThrottle(ThrottleConfig(max_retries=0)) if args.adaptive else None
+        report = LoadScenario(base_url, args.mix, stages, args.seed, args.keep_data,
+                              throttle=throttle).run()
+    finally:
+        if server:
+            server.stop()
+
+    document = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(document)
+    else:
+        sys.stdout.write(document + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,10 @@
+import os
+
+DEFAULT_URL = "https://wmxrwq14uc.execute-api.us-east-1.amazonaws.com/Prod"
+
+# Base URL used by clients created without an explicit base_url.
+# Overridden by BENEFITS_API_URL or by the --local-api pytest option.
+BASE_URL = os.environ.get("BENEFITS_API_URL", DEFAULT_URL)
+
+SWAGGER_PATH = os.path.abspath(os.path.join(
+    os.path.dirname(__file__), "..", "..", "..", "..", "docs", "swagger.json"))
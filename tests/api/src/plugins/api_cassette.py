@@ -0,0 +1,47 @@
+"""
+Pytest plugin recording and replaying APIClient traffic.
+
+    pytest --api-cassette cassettes/api.jsonl.gz --api-cassette-mode record
+    pytest --api-cassette cassettes/api.jsonl.gz
+
+Record mode sends every call and writes the cassette when the session ends.
+Replay mode (the default) answers every call from the cassette, so the suite
+runs without a network. Under pytest-xdist each worker uses its own cassette
+("api.gw0.jsonl.gz"), so record and replay with the same -n value.
+"""
+import os
+
+from src.api import cassette as cassettes
+
+
+def pytest_addoption(parser):
+    parser.addoption("--api-cassette", default=None, metavar="PATH",
+                     help="Record APIClient calls to, or replay them from, this cassette file.")
+    parser.addoption("--api-cassette-mode", default=cassettes.REPLAY, choices=cassettes.MODES,
+                     help="Whether --api-cassette records or replays (default: replay).")
+
+
+def cassette_path(path, worker_id=None):
+    """Cassette file of one xdist worker, e.g. api.jsonl.gz -> api.gw0.jsonl.gz."""
+    if not worker_id:
+        return path
+    directory, name = os.path.split(path)
+    stem, dot, suffix = name.partition(".")
+    return os.path.join(directory, f"{stem}.{worker_id}{dot}{suffix}")
+
+
+def pytest_configure(config):
+    path = config.getoption("--api-cassette")
+    if not path:
+        return
+    path = cassette_path(path, os.environ.get("PYTEST_XDIST_WORKER"))
+    cassettes.enable(cassettes.Cassette(path, mode=config.getoption("--api-cassette-mode")))
+
+
+def pytest_unconfigure(config):
+    cassette = cassettes.get_global_cassette()
+    if not config.getoption("--api-cassette") or cassette is None:
+        return
+    if cassette.mode == cassettes.RECORD:
+        cassette.save()
+    cassettes.disable()
@@ -0,0 +1,101 @@
+"""
+Pytest plugin surfacing APIClient request timings.
+
+With --api-timings every APIClient call is recorded. Each test report gets an
+"API timings" section listing the calls made on the test's thread (shown in
+report.html next to the captured output); calls of worker threads, e.g. bulk
+calls or background cleanup, only count towards the summary. The run ends with
+a per-endpoint summary, printed to the terminal and added to the report.html
+summary.
+"""
+import html
+import threading
+
+import pytest
+
+from src.api import instrumentation
+
+_start_key = pytest.StashKey[tuple]()
+
+CALL_COLUMNS = ("method", "endpoint", "status", "dns_ms", "connect_ms", "headers_ms", "total_ms",
+                "request_bytes", "response_bytes")
+SUMMARY_COLUMNS = ("count", "errors", "mean_ms", "p50_ms", "p90_ms", "p99_ms", "max_ms",
+                   "headers_mean_ms", "connect_mean_ms", "request_bytes", "response_bytes")
+
+
+def pytest_addoption(parser):
+    parser.addoption("--api-timings", action="store_true", default=False,
+                     help="Record APIClient request timings and add them to the reports.")
+
+
+def pytest_configure(config):
+    if not config.getoption("--api-timings"):
+        return
+    recorder = instrumentation.enable()
+    config.pluginmanager.register(_TimingReporter(recorder), "api-timing-reporter")
+    if config.pluginmanager.hasplugin("html"):
+        config.pluginmanager.register(_HtmlSummary(recorder), "api-timing-html")
+
+
+def pytest_unconfigure(config):
+    if config.getoption("--api-timings"):
+        instrumentation.disable()
+
+
+def format_table(header, rows):
+    """Formats rows of cells as a plain text table."""
+    cells = [list(map(str, header))] + [[str(cell) for cell in row] for row in rows]
+    widths = [max(len(row[i]) for row in cells) for i in range(len(header))]
+    lines = ["  ".join(cell.ljust(width) for cell, width in zip(row, widths)) for row in cells]
+    lines.insert(1, "  ".join("-" * width for width in widths))
+    return "\n".join(lines)
+
+
+def _summary_rows(summary):
+    return [[endpoint] + [row[column] for column in SUMMARY_COLUMNS]
+            for endpoint, row in summary.items()]
+
+
+class _TimingReporter:
+    def __init__(self, recorder):
+        self.recorder = recorder
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_runtest_setup(self, item):
+        item.stash[_start_key] = (len(self.recorder.records), threading.get_ident())
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_makereport(self, item, call):
+        outcome = yield
+        report = outcome.get_result()
+        if call.when != "call" or _start_key not in item.stash:
+            return
+        # Calls made by the test and by its fixtures during setup; calls of
+        # background threads (cleanup, pool resets) belong to no test
+        start, thread_id = item.stash[_start_key]
+        records = [record for record in self.recorder.records[start:] if record.thread_id == thread_id]
+        if records:
+            report.sections.append(("API timings", format_table(
+                CALL_COLUMNS, [[getattr(record, column) for column in CALL_COLUMNS] for record in records])))
+
+    def pytest_terminal_summary(self, terminalreporter):
+        summary = self.recorder.summary()
+        if not summary:
+            return
+        terminalreporter.write_sep("-", "API timings per endpoint")
+        terminalreporter.write_line(
+            format_table(("endpoint",) + SUMMARY_COLUMNS, _summary_rows(summary)))
+
+
+class _HtmlSummary:
+    def __init__(self, recorder):
+        self.recorder = recorder
+
+    def pytest_html_results_summary(self, prefix, summary, postfix):
+        rows = _summary_rows(self.recorder.summary())
+        if not rows:
+            return
+        header = "".join(f"<th>{html.escape(column)}</th>" for column in ("endpoint",) + SUMMARY_COLUMNS)
+        body = "".join("<tr>" + "".join(f"<td>{html.escape(str(cell))}</td>" for cell in row) + "</tr>"
+                       for row in rows)
+        postfix.append(f"<h2>API timings per endpoint</h2><table><tr>{header}</tr>{body}</table>")
@@ -0,0 +1,82 @@
+import asyncio
+import os
+import threading
+import time
+import uuid
+
+import pytest
+import pytest_check as check
+
+from src.api.async_api_client import AsyncAPIClient
+
+
+class SlowClient:
+    """Stands in for APIClient: records how many calls overlap."""
+
+    def __init__(self, barrier=None, delay=0.0):
+        self.barrier = barrier
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.running = 0
+        self.peak = 0
+
+    def get_employee_by_id(self, employee_id):
+        with self.lock:
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+        try:
+            if self.barrier is not None:
+                # Only returns once `parties` calls are running at the same time
+                self.barrier.wait()
+            time.sleep(self.delay)
+            return employee_id
+        finally:
+            with self.lock:
+                self.running -= 1
+
+
+class TestAsyncClient:
+    """ Concurrency bounds of the asyncio client"""
+
+    def test_endpoints_shall_return_responses(self, local_api):
+        async def scenario():
+            async with AsyncAPIClient(base_url=local_api.base_url) as client:
+                return await client.gather(client.get_all_employees(), client.get_employee_by_id(str(uuid.uuid4())))
+
+        listed, missing = asyncio.run(scenario())
+        check.equal(200, listed.status_code)
+        check.equal(404, missing.status_code)
+
+    def test_concurrency_shall_exceed_the_default_executor(self):
+        # The loop's default executor has at most min(32, cpus + 4) threads
+        parties = min(32, (os.cpu_count() or 1) + 4) + 8
+        client = AsyncAPIClient(base_url="http://127.0.0.1:9", max_concurrency=parties)
+        client._client = SlowClient(barrier=threading.Barrier(parties, timeout=10))
+
+        async def scenario():
+            return await client.gather(*[client.get_employee_by_id(index) for index in range(parties)])
+
+        try:
+            check.equal(list(range(parties)), asyncio.run(scenario()))
+        finally:
+            client.close()
+        check.equal(parties, client._client.peak)
+
+    def test_semaphore_shall_bound_calls_in_flight(self):
+        client = AsyncAPIClient(base_url="http://127.0.0.1:9", max_concurrency=3)
+        client._client = SlowClient(delay=0.02)
+
+        async def scenario():
+            return await client.gather(*[client.get_employee_by_id(index) for index in range(12)])
+
+        try:
+            # A second loop gets its own semaphore
+            for _ in range(2):
+                check.equal(list(range(12)), asyncio.run(scenario()))
+        finally:
+            client.close()
+        check.equal(3, client._client.peak)
+
+    def test_max_concurrency_shall_be_positive(self):
+        with pytest.raises(ValueError):
+            AsyncAPIClient(max_concurrency=0)
@@ -0,0 +1,48 @@
+import json
+
+import pytest
+import pytest_check as check
+
+from src.benchmark.load import ENDPOINTS, LoadScenario, Stage, main, percentile
+
+
+class TestBenchmark:
+    """ Load harness reports against the local stand-in"""
+
+    def test_percentile_shall_use_nearest_rank(self):
+        values = list(range(1, 101))
+        check.equal(50, percentile(values, 50))
+        check.equal(99, percentile(values, 99))
+        check.equal(100, percentile(values, 100))
+        check.is_none(percentile([], 50))
+
+    def test_scenario_shall_report_every_endpoint(self, local_api):
+        local_api.store.clear()
+        scenario = LoadScenario(local_api.base_url, stages=[Stage(0.3, 2), Stage(0.3, 4)],
+                                seed_employees=5)
+        report = scenario.run()
+        check.equal(set(ENDPOINTS.values()), set(report["endpoints"]))
+        # A read can race a concurrent delete of the same id
+        check.less(report["total"]["error_rate"], 0.05)
+        check.greater(report["total"]["rps"], 0)
+        check.less_equal(report["total"]["p50_ms"], report["total"]["p99_ms"])
+        check.equal([], local_api.store.list("TestUser788"))
+
+    def test_unknown_operation_shall_raise(self):
+        with pytest.raises(ValueError):
+            LoadScenario("http://127.0.0.1", mix={"patch": 1})
+
+    def test_cli_shall_write_json_report(self, tmp_path):
+        output = tmp_path / "bench.json"
+        main(["--local", "--ramp", "0.3:2", "--mix", "get_all=1,create=1", "--output", str(output)])
+        report = json.loads(output.read_text())
+        check.equal({ENDPOINTS["get_all"], ENDPOINTS["create"]}, set(report["endpoints"]))
+        check.is_none(report["throttle"])
+
+    def test_adaptive_run_shall_report_throttle_limits(self, tmp_path):
+        output = tmp_path / "bench.json"
+        main(["--local", "--ramp", "0.3:4", "--adaptive", "--output", str(output)])
+        report = json.loads(output.read_text())
+        # Seeding and cleanup go through the throttle as well
+        check.greater(report["throttle"]["requests"], report["total"]["requests"])
+        check.equal(0, report["throttle"]["in_flight"])
@@ -0,0 +1,73 @@
+import threading
+import time
+
+import pytest
+import pytest_check as check
+
+from src.api.api_client import APIClient
+from src.api.employee import Employee
+from src.api.transport import TransportConfig, create_session, get_session, pool_maxsize
+
+
+class TestBulk:
+    """ Ordering, partial failures and resource reuse of the bulk calls"""
+
+    @pytest.fixture(scope="function")
+    def client(self, local_api):
+        local_api.store.clear()
+        client = APIClient(base_url=local_api.base_url, session=create_session(TransportConfig(pool_maxsize=2)))
+        yield client
+        client.close()
+
+    def test_results_shall_follow_input_order(self, client):
+        # Earlier items finish last
+        def slow_echo(item):
+            time.sleep((5 - item) * 0.01)
+            return item
+
+        result = client._fan_out(slow_echo, range(5), max_workers=5)
+        check.equal([0, 1, 2, 3, 4], result.results)
+
+        employees = [Employee(f"user{i}", f"first{i}", "last") for i in range(12)]
+        created = client.create_employees(employees, max_workers=6)
+        check.equal([f"user{i}" for i in range(12)], [r.json()["username"] for r in created])
+
+    def test_failures_shall_not_stop_the_batch(self, client):
+        items = [Employee("user0", "first", "last"), "not an employee", Employee("user2", "first", "last")]
+        created = client.create_employees(items)
+        check.equal([200, None, 200], [r.status_code if r is not None else None for r in created.responses])
+        check.equal([1], [index for index, _, _ in created.failures])
+        check.is_instance(created[1], TypeError)
+        check.is_false(created.ok)
+
+        missing = "0" * 32
+        deleted = client.delete_employees([created[0].json()["id"], missing])
+        check.equal(200, deleted[0].status_code)
+        check.equal([1], [index for index, _, _ in deleted.failures])
+
+    def test_executor_and_pool_shall_fit_max_workers(self, client):
+        threads = set()
+
+        def record_thread(item):
+            threads.add(threading.current_thread())
+            return item
+
+        client._fan_out(record_thread, range(20), max_workers=8)
+        client._fan_out(record_thread, range(20), max_workers=8)
+        check.less_equal(len(threads), 8)
+        check.is_true(client._executor(8) is client._executor(8))
+        check.equal({8}, {adapter._pool_maxsize for adapter in client.session.adapters.values()})
+
+    def test_resizing_shall_leave_the_shared_session_alone(self, local_api):
+        # A config of its own, the shared session's counts belong to other tests
+        config = TransportConfig(pool_maxsize=3, pool_connections=3)
+        shared = get_session(config)
+        with APIClient(base_url=local_api.base_url, transport_config=config) as client:
+            other = APIClient(base_url=local_api.base_url, transport_config=config)
+            client.get_all_employees()
+            client._fan_out(lambda item: client.get_all_employees(), range(8), max_workers=8)
+            check.is_false(client.session is shared)
+            check.equal(8, pool_maxsize(client.session))
+            check.equal(3, pool_maxsize(shared))
+            check.is_true(other.session is shared)
+        check.is_true(client.session is shared)
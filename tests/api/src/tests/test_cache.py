@@ -0,0 +1,56 @@
+import pytest
+import pytest_check as check
+
+from src.api.api_client import APIClient
+from src.api.cache import EmployeeCache
+from src.api.employee import Employee
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestCache:
+    """ Read-through cache behaviour of APIClient"""
+
+    @pytest.fixture(scope="function")
+    def client(self, local_api):
+        local_api.store.clear()
+        return APIClient(base_url=local_api.base_url, cache=EmployeeCache())
+
+    def test_repeated_reads_shall_be_served_from_cache(self, client):
+        first = client.get_all_employees()
+        check.is_true(first is client.get_all_employees())
+        check.equal(1, client.cache.hits)
+        check.is_false(first is client.get_all_employees(use_cache=False))
+
+    def test_writes_shall_invalidate_list_snapshot(self, client):
+        check.equal([], client.get_all_employees().json())
+        created = client.create_employee(Employee("uname", "first", "last")).json()
+        check.equal([created["id"]], [e["id"] for e in client.get_all_employees().json()])
+        client.delete_employee_by_id(created["id"])
+        check.equal([], client.get_all_employees().json())
+
+    def test_writes_shall_patch_employee_entries(self, client):
+        created = client.create_employee(Employee("uname", "first", "last")).json()
+        check.equal("first", client.get_employee_by_id(created["id"]).json()["firstName"])
+        client.update_employee(Employee("uname", "second", "last", id=created["id"]))
+        check.equal("second", client.get_employee_by_id(created["id"]).json()["firstName"])
+        client.delete_employee_by_id(created["id"])
+        check.equal(404, client.get_employee_by_id(created["id"]).status_code)
+
+    def test_entries_shall_expire_and_be_evicted(self):
+        clock = FakeClock()
+        cache = EmployeeCache(ttl=5, maxsize=2, clock=clock)
+        cache.put_employee("a", 1)
+        cache.put_employee("b", 2)
+        cache.get_employee("a")
+        cache.put_employee("c", 3)
+        check.is_none(cache.get_employee("b"))
+        check.equal(1, cache.get_employee("a"))
+        clock.now = 6
+        check.is_none(cache.get_employee("a"))
@@ -0,0 +1,69 @@
+import pytest
+import pytest_check as check
+
+from src.api.api_client import APIClient
+from src.api.cassette import RECORD, Cassette, CassetteError
+from src.api.employee import Employee
+from src.plugins.api_cassette import cassette_path
+
+# Nothing listens on the discard port, any request that reaches the network fails
+OFFLINE_URL = "http://127.0.0.1:9"
+
+
+class TestCassette:
+    """ Recording and replaying APIClient traffic"""
+
+    @pytest.fixture(scope="function")
+    def recorded(self, local_api, tmp_path):
+        """Records a create, two list reads and a streamed read against the stand-in."""
+        local_api.store.clear()
+        cassette = Cassette(str(tmp_path / "api.jsonl.gz"), mode=RECORD)
+        client = APIClient(base_url=local_api.base_url, cassette=cassette)
+        before = client.get_all_employees().json()
+        created = client.create_employee(Employee("uname", "first", "last", 2)).json()
+        after = client.get_all_employees().json()
+        streamed = list(client.iter_employees())
+        cassette.save()
+        return cassette.path, before, created, after, streamed
+
+    def test_replay_shall_not_use_the_network(self, recorded):
+        path, before, created, after, streamed = recorded
+        cassette = Cassette(path)
+        client = APIClient(base_url=OFFLINE_URL, cassette=cassette)
+        check.equal(4, len(cassette))
+        # Identical requests get their responses in recorded order
+        check.equal(before, client.get_all_employees().json())
+        response = client.create_employee(Employee("uname", "first", "last", 2))
+        check.equal(200, response.status_code)
+        check.equal(created, response.json())
+        check.equal(after, client.get_all_employees().json())
+        check.equal(streamed, list(client.iter_employees()))
+        # The last recorded response keeps being served
+        check.equal(after, client.get_all_employees().json())
+        check.equal(5, cassette.hits)
+
+    def test_unrecorded_request_shall_raise(self, recorded):
+        client = APIClient(base_url=OFFLINE_URL, cassette=Cassette(recorded[0]))
+        with pytest.raises(CassetteError):
+            client.create_employee(Employee("other", "first", "last", 2))
+        with pytest.raises(CassetteError):
+            client.get_employee_by_id(recorded[2]["id"])
+
+    def test_matchers_shall_be_configurable(self, recorded):
+        cassette = Cassette(recorded[0], match_on=("method", "path"))
+        client = APIClient(base_url=OFFLINE_URL, cassette=cassette)
+        response = client.create_employee(Employee("other", "first", "last", 2))
+        check.equal(recorded[2], response.json())
+        with pytest.raises(ValueError):
+            Cassette(recorded[0], match_on=("headers",))
+
+    def test_meta_shall_round_trip(self, tmp_path):
+        cassette = Cassette(str(tmp_path / "meta.jsonl.gz"), mode=RECORD)
+        cassette.meta["namespace.tests"] = "a1b2c3"
+        cassette.save()
+        check.equal({"namespace.tests": "a1b2c3"}, Cassette(cassette.path).meta)
+        check.equal(0, len(Cassette(cassette.path)))
+
+    def test_workers_shall_get_their_own_cassette(self):
+        check.equal("c/api.jsonl.gz", cassette_path("c/api.jsonl.gz"))
+        check.equal("c/api.gw1.jsonl.gz", cassette_path("c/api.jsonl.gz", "gw1"))
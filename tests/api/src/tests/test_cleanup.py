@@ -0,0 +1,51 @@
+import pytest
+import pytest_check as check
+
+from src.api.api_client import APIClient
+from src.api.cleanup import CleanupRegistry
+from src.api.employee import Employee
+from src.api.transport import TransportConfig
+
+
+class TestCleanup:
+    """ Deferred, concurrent deletion of the employees tests create"""
+
+    @pytest.fixture(scope="function")
+    def client(self, local_api):
+        local_api.store.clear()
+        return APIClient(base_url=local_api.base_url)
+
+    def create(self, client, count):
+        employees = [Employee(f"user{i}", "first", "last") for i in range(count)]
+        return [response.json()["id"] for response in client.create_employees(employees)]
+
+    def test_close_shall_delete_everything_registered(self, client):
+        registry = CleanupRegistry(client)
+        ids = [registry.register(employee_id) for employee_id in self.create(client, 5)]
+        registry.release(ids[0])
+        registry.release(ids[1])
+        check.equal([], registry.close())
+        check.equal([], client.get_all_employees().json())
+
+    def test_already_deleted_ids_shall_count_as_deleted(self, client):
+        registry = CleanupRegistry(client)
+        employee_id = registry.register(self.create(client, 1)[0])
+        client.delete_employee_by_id(employee_id)
+        registry.release(employee_id)
+        check.equal([], registry.close())
+        check.equal(0, len(registry))
+
+    def test_failed_responses_shall_not_be_registered(self, client):
+        registry = CleanupRegistry(client)
+        response = client.update_employee(Employee("missing", "first", "last"))
+        check.is_none(registry.register_response(response))
+        check.equal(0, len(registry))
+
+    def test_undeletable_ids_shall_be_reported_as_leaked(self, client):
+        employee_id = self.create(client, 1)[0]
+        # Nothing listens on the discard port, so every delete attempt fails
+        offline = APIClient(base_url="http://127.0.0.1:9", transport_config=TransportConfig(max_retries=0))
+        registry = CleanupRegistry(offline, retries=2, backoff=0)
+        registry.register(employee_id)
+        check.equal([employee_id], registry.close())
+        check.equal([employee_id], registry.leaked)
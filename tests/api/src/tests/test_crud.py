@@ -1,73 +1,60 @@
-import pytest
 import pytest_check as check
 
 from src.api.api_client import APIClient
-from src.api.employee import Employee
+from src.api.snapshot import EmployeeSnapshot
 
 
 class TestCrud:
     """ Test CRUD with valid inputs and validate status code and action completion"""
 
-    @pytest.fixture(scope="function")
-    def created_employee(self):
-        client = APIClient()
-        post_employee = Employee("test_username", "myfirstname", "lname")
-
-        response = client.create_employee(post_employee)
-        json_response = response.json()
-
-        yield response.json()
-
-        client.delete_employee_by_id(json_response["id"])
-
     """ CRUD operations tests"""
 
-    def test_post_employees_shall_return_successful_rc(self):
+    def test_post_employees_shall_return_successful_rc(self, employee_validator, namespace, cleanup):
         client = APIClient()
-        post_employee = Employee("test_username", "myfirstname", "lname")
+        post_employee = namespace.employee("test_username", "myfirstname", "lname")
         response = client.create_employee(post_employee)
+        cleanup.register_response(response)
         check.equal(200, response.status_code)
         employee_response = response.json()
-        check.is_true(all(field in employee_response.items()
-                      for field in post_employee.to_dict().items()))
+        check.equal([], employee_validator.validate(employee_response))
+        check.is_true(employee_response.items() >= post_employee.to_dict().items())
 
-    def test_get_employees_valid_employee(self, created_employee):
+    def test_get_employees_valid_employee(self, pooled_employee, employee_validator):
         client = APIClient()
         response = client.get_all_employees()
         check.equal(200, response.status_code)
         employees_list = response.json()
         check.is_instance(employees_list, list,
                           "Expected response to be a list")
-        assert any(emp.get("id") ==
-                   created_employee["id"] for emp in employees_list)
+        check.equal([], employee_validator.validate_many(employees_list))
+        assert pooled_employee["id"] in EmployeeSnapshot(employees_list)
 
-    def test_put_employees_existing_employee_id(self, created_employee):
-        existing_id = created_employee["id"]
-        updated_emp = Employee("UpdatedUsername", "UpdatedFirstname", "UpdatedLastName",
-                               3, expiration="2015-06-22T04:40:35.641Z", salary=75000.0, id=existing_id)
+    def test_put_employees_existing_employee_id(self, leased_employee, employee_validator, namespace):
+        existing_id = leased_employee["id"]
+        updated_emp = namespace.employee("UpdatedUsername", "UpdatedFirstname", "UpdatedLastName",
+                                         dependants=3, expiration="2015-06-22T04:40:35.641Z",
+                                         salary=75000.0, id=existing_id)
 
         client = APIClient()
         response = client.update_employee(updated_emp)
         check.equal(200, response.status_code)
         json_response = response.json()
-        check.is_true(all(field in json_response.items()
-                      for field in updated_emp.to_dict().items()))
+        check.equal([], employee_validator.validate(json_response))
+        check.is_true(json_response.items() >= updated_emp.to_dict().items())
 
-    def test_delete_employee_shall_return_successful_rc(self, created_employee):
-        existing_id = created_employee["id"]
+    def test_delete_employee_shall_return_successful_rc(self, leased_employee):
+        existing_id = leased_employee["id"]
         client = APIClient()
         response = client.delete_employee_by_id(existing_id)
         check.equal(200, response.status_code)
-        all_elements = client.get_all_employees()
-        all_elements_response = all_elements.json()
-        assert all(emp.get("id") !=
-                   created_employee["id"] for emp in all_elements_response)
+        snapshot = EmployeeSnapshot.from_response(client.get_all_employees())
+        assert existing_id not in snapshot
 
-    def test_getbyid_existing_employee(self, created_employee):
-        existing_id = created_employee["id"]
+    def test_getbyid_existing_employee(self, pooled_employee, employee_validator):
+        existing_id = pooled_employee["id"]
         client = APIClient()
         response = client.get_employee_by_id(existing_id)
         check.equal(200, response.status_code)
         json_response = response.json()
-        check.is_true(all(field in json_response.items()
-                      for field in json_response.items()))
+        check.equal([], employee_validator.validate(json_response))
+        check.equal(existing_id, json_response["id"])
@@ -1,5 +1,3 @@
-import uuid
-
 import pytest
 import pytest_check as check
 from src.api.api_client import APIClient
@@ -9,50 +7,50 @@ from src.api.employee import Employee
 class TestDataValidation:
 
     @pytest.fixture(scope="function")
-    def clean_env(self):
-        client = APIClient()
-        response = client.get_all_employees()
-        employee_list = response.json()
-        for employee in employee_list:
-            client.delete_employee_by_id(employee["id"])
+    def clean_env(self, namespace, api_client):
+        """ Removes the employees created by this worker, other workers' data is left alone"""
+        response = api_client.get_all_employees()
+        employee_list = namespace.filter(response.json())
+        api_client.delete_employees(employee["id"] for employee in employee_list)
 
     @pytest.fixture(scope="function")
-    def created_employee(self):
+    def created_employee(self, namespace, cleanup):
         client = APIClient()
-        post_employee = Employee("test_username", "myfirstname", "lname")
+        post_employee = namespace.employee("test_username", "myfirstname", "lname")
 
         response = client.create_employee(post_employee)
         json_response = response.json()
+        cleanup.register(json_response["id"])
 
-        yield response.json()
+        yield json_response
 
-        client.delete_employee_by_id(json_response["id"])
+        cleanup.release(json_response["id"])
 
     """ GET employee"""
 
-    def test_get_from_empty_list(self, clean_env):
+    def test_get_from_empty_list(self, clean_env, namespace):
         client = APIClient()
         response = client.get_all_employees()
         check.equal(200, response.status_code)
-        assert ([] == response.json())
+        assert ([] == namespace.filter(response.json()))
 
     """ GET employee/{ID} """
 
-    def test_getbyid_empty_list(self, clean_env):
+    def test_getbyid_empty_list(self, clean_env, namespace):
         client = APIClient()
-        response = client.get_employee_by_id(uuid.uuid4().hex)
+        response = client.get_employee_by_id(namespace.make_id("missing"))
         check.equal(404, response.status_code)
 
-    def test_getbyid_not_existing_employee_non_empty_list(self, created_employee):
+    def test_getbyid_not_existing_employee_non_empty_list(self, pooled_employee, namespace):
         client = APIClient()
-        response = client.get_employee_by_id(uuid.uuid4().hex)
+        response = client.get_employee_by_id(namespace.make_id("missing"))
         check.equal(404, response.status_code)
 
-    def test_getbyid_invalid_ids(self, created_employee):
+    def test_getbyid_invalid_ids(self, pooled_employee, namespace):
         client = APIClient()
-        invalid_format = uuid.uuid4().hex[::-1]
+        invalid_format = namespace.make_id("invalid")[::-1]
         invalid_format_and_length = "123"
-        long_id = uuid.uuid4().hex + uuid.uuid4().hex
+        long_id = namespace.make_id("long") * 2
 
         response = client.get_employee_by_id(invalid_format)
         check.equal(400, response.status_code)
@@ -65,8 +63,8 @@ class TestDataValidation:
 
     """ POST employee """
 
-    def test_post_required_data_only(self, clean_env, created_employee):
-        post_employee = Employee(
+    def test_post_required_data_only(self, clean_env, created_employee, namespace):
+        post_employee = namespace.employee(
             "DupUserName", "DupFirst", "Duplname", id=created_employee["id"])
         client = APIClient()
         response = client.create_employee(post_employee)
@@ -74,19 +72,21 @@ class TestDataValidation:
         print(response.content)
         check.equal(409, response.status_code)
 
-    def test_post_custom_salary_shall_not_change_salary(self, clean_env):
-        post_employee = Employee("UserName", "First", "lname", salary=555.0)
+    def test_post_custom_salary_shall_not_change_salary(self, clean_env, namespace, cleanup):
+        post_employee = namespace.employee("UserName", "First", "lname", salary=555.0)
         client = APIClient()
         response = client.create_employee(post_employee)
+        cleanup.register_response(response)
         json_response = response.json()
         print(json_response)
         check.equal(Employee.GROSS_PAY_PER_CHECK *
                     Employee.NUM_PAYCHECKS_PER_YEAR, json_response["salary"])
 
-    def test_post_get_nullable_elements(self, clean_env):
-        employee = Employee("UserName", "First", "lname", expiration=None)
+    def test_post_get_nullable_elements(self, clean_env, namespace, cleanup):
+        employee = namespace.employee("UserName", "First", "lname", expiration=None)
         client = APIClient()
         response = client.create_employee(employee)
+        cleanup.register_response(response)
         json_response = response.json()
 
         nullable_fields = ["expiration", "partitionKey"]
@@ -94,43 +94,45 @@ class TestDataValidation:
         print(getter_response)
         assert (all(field in nullable_fields for field in getter_response.keys()))
 
-    def test_create_with_user_defined_id(self):
-        defined_id = uuid.uuid4().hex
+    def test_create_with_user_defined_id(self, namespace, cleanup):
+        defined_id = namespace.make_id("defined")
         client = APIClient()
-        employee = Employee("uname", "first", "last", id=defined_id)
+        employee = namespace.employee("uname", "first", "last", id=defined_id)
         response = client.create_employee(employee)
+        cleanup.register_response(response)
         posted_id = response.json()
         check.equal(404, response.status_code)
         assert (posted_id.get("id", None) == defined_id)
 
-    def test_post_expired_employee_shall_not_be_available(self):
+    def test_post_expired_employee_shall_not_be_available(self, namespace, cleanup):
         client = APIClient()
-        expired_employee = Employee(
+        expired_employee = namespace.employee(
             "uname", "first", "last", expiration="2015-06-22T04:40:35.641Z")
         response = client.create_employee(expired_employee)
+        cleanup.register_response(response)
         json_response = response.json()
         check.equal(404, response.status_code)
         print(json_response)
 
     """ UPDATE employee """
 
-    def test_update_unexisting_employee_non_empty_list(self, clean_env):
-        post_employee = Employee("DupUserName", "DupFirst", "Duplname")
+    def test_update_unexisting_employee_non_empty_list(self, clean_env, namespace):
+        post_employee = namespace.employee("DupUserName", "DupFirst", "Duplname")
         client = APIClient()
         response = client.update_employee(post_employee)
         print(response.content)
         check.equal(404, response.status_code)
 
-    def test_update_unexisting_employee_empty_list(self):
-        not_existing_employee = Employee("DupUserName", "DupFirst", "Duplname")
+    def test_update_unexisting_employee_empty_list(self, namespace):
+        not_existing_employee = namespace.employee("DupUserName", "DupFirst", "Duplname")
         client = APIClient()
         response = client.update_employee(not_existing_employee)
         check.equal(404, response.status_code)
 
-    def test_update_update_salary(self, created_employee):
+    def test_update_update_salary(self, leased_employee, namespace):
         """ User shall not be able to update salary """
-        existing_id = created_employee["id"]
-        updated_emp = Employee("UpdatedUsername", "UpdatedFirstname",
+        existing_id = leased_employee["id"]
+        updated_emp = namespace.employee("UpdatedUsername", "UpdatedFirstname",
                                "UpdatedLastName", salary=75000.0, id=existing_id)
         client = APIClient()
         response = client.update_employee(updated_emp)
@@ -0,0 +1,71 @@
+import itertools
+import tracemalloc
+
+import pytest
+import pytest_check as check
+
+from src.api.api_client import APIClient
+from src.api.generator import DEFECTS, EmployeeGenerator
+from src.api.namespace import DataNamespace
+from src.api.schema import get_employee_validator
+
+
+def payloads(generator, count):
+    return [generated.employee.to_json() for generated in generator.generate(count)]
+
+
+class TestGenerator:
+    """ Seeded, lazy employee payload generation"""
+
+    def test_same_seed_shall_give_same_roster(self):
+        check.equal(payloads(EmployeeGenerator(seed=3), 50), payloads(EmployeeGenerator(seed=3), 50))
+        check.not_equal(payloads(EmployeeGenerator(seed=3), 50), payloads(EmployeeGenerator(seed=4), 50))
+        generator = EmployeeGenerator(seed=3)
+        check.equal(payloads(generator, 50)[17], generator.at(17).employee.to_json())
+
+    def test_valid_employees_shall_match_the_schema(self):
+        validator = get_employee_validator(direction="request")
+        generator = EmployeeGenerator(seed=1, id_rate=0.5, edge_rate=0.3, namespace=DataNamespace("gw0"))
+        for generated in generator.generate(2000):
+            check.is_none(generated.defect)
+            assert validator.validate(generated.employee.to_dict()) == [], generated
+
+    def test_invalid_employees_shall_break_one_constraint(self):
+        validator = get_employee_validator(direction="request")
+        found = set()
+        for generated in EmployeeGenerator(seed=2, invalid_rate=1.0).generate(500):
+            found.add(generated.defect)
+            check.equal(1, len(validator.validate(generated.employee.to_dict())), generated.defect)
+        check.equal(set(DEFECTS), found)
+
+    def test_server_shall_accept_only_valid_employees(self, local_api):
+        local_api.store.clear()
+        client = APIClient(base_url=local_api.base_url)
+        generated = list(EmployeeGenerator(seed=6, invalid_rate=0.5).generate(40))
+        result = client.create_employees(g.employee for g in generated)
+        for item, response in zip(generated, result):
+            check.equal(400 if item.defect else 200, response.status_code, item.defect)
+        local_api.store.clear()
+
+    def test_shards_shall_not_overlap(self):
+        shards = [EmployeeGenerator(seed=5, shard_index=i, shard_count=3) for i in range(3)]
+        usernames = [e.username for shard in shards for e in shard.employees(1000)]
+        check.equal(3000, len(set(usernames)))
+        whole = {e.username for e in EmployeeGenerator(seed=5).employees(3000)}
+        check.equal(whole, set(usernames))
+        with pytest.raises(ValueError):
+            EmployeeGenerator(shard_index=3, shard_count=3)
+
+    def test_memory_shall_stay_constant(self):
+        generator = EmployeeGenerator(seed=9, invalid_rate=0.2).generate()
+        tracemalloc.start()
+        try:
+            for _ in itertools.islice(generator, 1000):
+                pass
+            warm, _ = tracemalloc.get_traced_memory()
+            for _ in itertools.islice(generator, 50000):
+                pass
+            current, _ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        check.less(current - warm, 64 * 1024)
@@ -0,0 +1,86 @@
+import socket
+import threading
+
+import pytest
+import pytest_check as check
+
+from src.api import instrumentation
+from src.api.api_client import APIClient
+from src.api.employee import Employee
+from src.api.instrumentation import HISTOGRAM_BUCKETS_MS, RequestRecorder, endpoint_template
+from src.api.transport import create_session
+
+
+class TestInstrumentation:
+    """ Per request timings recorded by APIClient"""
+
+    @pytest.fixture(scope="function")
+    def recorder(self):
+        return RequestRecorder()
+
+    @pytest.fixture(scope="function")
+    def client(self, local_api, recorder):
+        local_api.store.clear()
+        # A private session so the first call has to open a connection
+        return APIClient(base_url=local_api.base_url, session=create_session(), recorder=recorder)
+
+    @pytest.mark.parametrize("path, expected", [
+        ("/api/Employees", "/api/Employees"),
+        ("/api/Employees/0f8fad5b-d9cb-469f-a165-70867728950e", "/api/Employees/{id}"),
+        ("/api/Employees/123?x=1", "/api/Employees/{id}"),
+    ])
+    def test_endpoint_template(self, path, expected):
+        check.equal(expected, endpoint_template(path))
+
+    def test_every_call_shall_be_recorded(self, client, recorder):
+        created = client.create_employee(Employee("uname", "first", "last")).json()
+        client.get_employee_by_id(created["id"])
+        client.delete_employee_by_id(created["id"])
+        list(client.iter_employees())
+        check.equal([("POST", "/api/Employees", 200), ("GET", "/api/Employees/{id}", 200),
+                     ("DELETE", "/api/Employees/{id}", 200), ("GET", "/api/Employees", 200)],
+                    [(r.method, r.endpoint, r.status) for r in recorder.records])
+        first = recorder.records[0]
+        check.greater(first.connect_ms, 0)
+        check.greater(first.request_bytes, 0)
+        check.greater(first.response_bytes, 0)
+        check.greater_equal(first.total_ms, first.headers_ms)
+        check.equal(0, recorder.records[1].connect_ms)
+
+    def test_dns_shall_be_resolved_once_per_connection(self, local_api, recorder, monkeypatch):
+        lookups = []
+        getaddrinfo = socket.getaddrinfo
+
+        def counted_getaddrinfo(host, *args, **kwargs):
+            lookups.append(host)
+            return getaddrinfo(host, *args, **kwargs)
+
+        monkeypatch.setattr(socket, "getaddrinfo", counted_getaddrinfo)
+        client = APIClient(base_url=local_api.base_url.replace("127.0.0.1", "localhost"), session=create_session(),
+                           recorder=recorder)
+        client.get_all_employees()
+        client.get_all_employees()
+        check.equal(["localhost"], [host for host in lookups if host == "localhost"])
+        check.greater(recorder.records[0].dns_ms, 0)
+        check.equal(0, recorder.records[1].dns_ms)
+        check.equal(threading.get_ident(), recorder.records[0].thread_id)
+
+    def test_summary_and_histograms_shall_group_by_endpoint(self, client, recorder):
+        for _ in range(3):
+            client.get_all_employees()
+        client.get_employee_by_id("0f8fad5b-d9cb-469f-a165-70867728950e")
+        summary = recorder.summary()
+        check.equal(3, summary["GET /api/Employees"]["count"])
+        check.equal(1, summary["GET /api/Employees/{id}"]["errors"])
+        histograms = recorder.histograms()
+        check.equal(len(HISTOGRAM_BUCKETS_MS), len(histograms["GET /api/Employees"]))
+        check.equal(3, sum(histograms["GET /api/Employees"]))
+
+    def test_global_recorder_shall_instrument_plain_clients(self, local_api):
+        recorder = instrumentation.enable()
+        try:
+            APIClient(base_url=local_api.base_url).get_all_employees()
+        finally:
+            instrumentation.disable()
+        APIClient(base_url=local_api.base_url).get_all_employees()
+        check.equal(1, len(recorder))
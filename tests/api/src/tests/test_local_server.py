@@ -0,0 +1,74 @@
+import asyncio
+import uuid
+
+import pytest
+import pytest_check as check
+
+from src.api.api_client import APIClient
+from src.api.async_api_client import AsyncAPIClient
+from src.api.employee import Employee
+
+
+class TestLocalServer:
+    """ Exercise the clients against the in-process Benefits API stand-in"""
+
+    @pytest.fixture(scope="function")
+    def client(self, local_api):
+        local_api.store.clear()
+        return APIClient(base_url=local_api.base_url)
+
+    def test_post_shall_compute_server_fields(self, client):
+        response = client.create_employee(Employee("uname", "first", "last", dependants=2))
+        check.equal(200, response.status_code)
+        json_response = response.json()
+        check.equal("TestUser788", json_response["partitionKey"])
+        check.equal(json_response["id"], json_response["sortKey"])
+        check.equal(Employee.GROSS_PAY_PER_CHECK, json_response["gross"])
+        check.equal(Employee.calculate_benefit_cost_per_check(2),
+                    round(json_response["benefitsCost"], 2))
+        check.equal(Employee.calculate_net_pay_per_check(2), round(json_response["net"], 2))
+
+    def test_crud_round_trip(self, client):
+        created = client.create_employee(Employee("uname", "first", "last")).json()
+        check.equal(200, client.get_employee_by_id(created["id"]).status_code)
+        updated = Employee("uname", "newfirst", "last", 1, id=created["id"])
+        check.equal("newfirst", client.update_employee(updated).json()["firstName"])
+        check.equal(200, client.delete_employee_by_id(created["id"]).status_code)
+        check.equal(404, client.get_employee_by_id(created["id"]).status_code)
+        check.equal([], client.get_all_employees().json())
+
+    @pytest.mark.parametrize("employee", [
+        Employee("a" * 51, "first", "last"),
+        Employee("uname", "first", "last", dependants=33),
+        Employee("uname", "first", "last", expiration="not a date"),
+    ])
+    def test_invalid_payload_shall_return_bad_request(self, client, employee):
+        check.equal(400, client.create_employee(employee).status_code)
+
+    def test_missing_credentials_shall_return_unauthorized(self, client):
+        response = client.session.get(f"{client.base_url}/api/Employees")
+        check.equal(401, response.status_code)
+
+    def test_bulk_operations_keep_order_and_collect_failures(self, client):
+        employees = [Employee(f"user{i}", "first", "last") for i in range(20)]
+        created = client.create_employees(employees)
+        check.is_true(created.ok)
+        check.equal([e.username for e in employees],
+                    [r.json()["username"] for r in created])
+        ids = [r.json()["id"] for r in created] + [str(uuid.uuid4()), "not-an-id"]
+        deleted = client.delete_employees(ids)
+        check.equal([20, 21], [index for index, _, _ in deleted.failures])
+        check.is_instance(deleted[21], ValueError)
+        check.equal([], client.get_all_employees().json())
+
+    def test_async_client_runs_requests_concurrently(self, local_api, client):
+        async def scenario():
+            async with AsyncAPIClient(base_url=local_api.base_url, max_concurrency=5) as async_client:
+                responses = await async_client.gather(
+                    *(async_client.create_employee(Employee(f"user{i}", "first", "last"))
+                      for i in range(25)))
+                return responses, await async_client.get_all_employees()
+
+        responses, all_employees = asyncio.run(scenario())
+        check.is_true(all(r.status_code == 200 for r in responses))
+        check.equal(25, len(all_employees.json()))
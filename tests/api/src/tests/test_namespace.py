@@ -0,0 +1,34 @@
+import pytest_check as check
+
+from src.api.api_client import APIClient
+from src.api.namespace import DataNamespace
+from src.api.schema import MAX_USERNAME_LENGTH
+
+
+class TestNamespace:
+    """ Worker data isolation through username namespaces"""
+
+    def test_prefix_shall_include_worker_and_token(self, monkeypatch):
+        monkeypatch.setenv("PYTEST_XDIST_WORKER", "gw3")
+        namespace = DataNamespace(token="abc123")
+        check.equal("gw3-abc123_", namespace.prefix)
+        check.equal("gw3-abc123_user", namespace.username("user"))
+        check.equal(MAX_USERNAME_LENGTH, len(namespace.username("u" * 60)))
+
+    def test_filter_shall_keep_only_own_records(self, local_api):
+        local_api.store.clear()
+        client = APIClient(base_url=local_api.base_url)
+        mine, other = DataNamespace("gw0"), DataNamespace("gw1")
+        client.create_employees([mine.employee("a", "first", "last"),
+                                 other.employee("b", "first", "last"),
+                                 mine.employee("c", "first", "last")])
+        owned = mine.filter(client.get_all_employees().json())
+        check.equal(["a", "c"], sorted(e["username"][len(mine.prefix):] for e in owned))
+        check.is_true(other.owns(other.employee("b", "first", "last")))
+
+    def test_ids_shall_repeat_only_for_fixed_tokens(self):
+        fixed, same, random = DataNamespace("gw0", "rec"), DataNamespace("gw0", "rec"), DataNamespace("gw0")
+        check.equal(fixed.make_id("missing"), same.make_id("missing"))
+        check.not_equal(fixed.make_id("missing"), random.make_id("missing"))
+        check.not_equal(fixed.make_id("missing"), fixed.make_id("other"))
+        check.equal(32, len(fixed.make_id("missing")))
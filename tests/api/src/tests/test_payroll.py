@@ -0,0 +1,51 @@
+import pytest
+import pytest_check as check
+
+from src.api import payroll
+from src.api.employee import Employee
+from src.api.payroll import PayrollEngine
+from src.api.schema import MAX_DEPENDANTS
+
+
+class TestPayroll:
+    """ Batch payroll engine matches the scalar Employee calculations"""
+
+    @pytest.fixture(scope="function", params=["numpy", "python"])
+    def engine(self, request, monkeypatch):
+        if request.param == "numpy" and payroll.np is None:
+            pytest.skip("numpy is not installed")
+        if request.param == "python":
+            monkeypatch.setattr(payroll, "np", None)
+        return PayrollEngine()
+
+    def test_per_check_values_shall_match_scalar_methods(self, engine):
+        dependants = list(range(MAX_DEPENDANTS + 1)) * 3
+        result = engine.calculate(dependants)
+        check.equal([Employee.calculate_benefit_cost_per_check(d) for d in dependants],
+                    list(result.benefit_cost_per_check))
+        check.equal([Employee.calculate_net_pay_per_check(d) for d in dependants],
+                    list(result.net_pay_per_check))
+        check.equal([round(Employee.calculate_net_pay_per_check(d) * 26, 0) for d in dependants],
+                    [round(v, 0) for v in result.annual_net_pay])
+
+    def test_salaries_shall_drive_gross_pay(self, engine):
+        result = engine.calculate([0, 2], salaries=[52000.0, 26000.0])
+        check.equal([1961.54, 923.08], list(result.net_pay_per_check))
+        check.equal([1000.0, 2000.0], list(result.annual_benefit_cost))
+        check.equal([51000.0, 24000.0], list(result.annual_net_pay))
+
+    def test_roster_shall_accept_objects_and_api_dicts(self, engine):
+        roster = [Employee("u", "f", "l", dependants=3), {"dependants": 1, "salary": 52000.0}]
+        result = engine.calculate_roster(roster)
+        check.equal([Employee.calculate_net_pay_per_check(3), Employee.calculate_net_pay_per_check(1)],
+                    list(result.net_pay_per_check))
+
+    @pytest.mark.parametrize("dependants", [[-1], [MAX_DEPENDANTS + 1]])
+    def test_out_of_range_dependants_shall_raise(self, engine, dependants):
+        with pytest.raises(ValueError):
+            engine.calculate(dependants)
+
+    @pytest.mark.parametrize("dependants", [[1, 2.5], [2.0], ["2"]])
+    def test_non_integer_dependants_shall_raise(self, engine, dependants):
+        with pytest.raises(TypeError):
+            engine.calculate(dependants)
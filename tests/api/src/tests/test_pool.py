@@ -0,0 +1,89 @@
+import pytest
+import pytest_check as check
+
+from src.api.api_client import APIClient
+from src.api.employee import Employee
+from src.api.pool import EmployeePool, PoolError
+
+
+class TestPool:
+    """ Session employee pool hands out, restores and cleans up employees"""
+
+    @pytest.fixture(scope="function")
+    def client(self, local_api):
+        local_api.store.clear()
+        return APIClient(base_url=local_api.base_url)
+
+    @pytest.fixture(scope="function")
+    def pool(self, client):
+        pool = EmployeePool(client, size=2, timeout=1)
+        yield pool
+        pool.close()
+
+    def test_pool_shall_provision_lazily_in_bulk(self, client, pool):
+        check.equal([], client.get_all_employees().json())
+        with pool.read_only() as first:
+            check.equal(2, len(client.get_all_employees().json()))
+            check.is_true(pool.namespace.owns(first))
+
+    def test_lease_shall_be_exclusive(self, pool):
+        with pool.lease() as first, pool.lease() as second:
+            check.not_equal(first["id"], second["id"])
+            with pytest.raises(PoolError):
+                with pool.read_only():
+                    pass
+
+    def test_shared_employee_shall_not_be_leased(self, pool):
+        with pool.read_only() as first, pool.read_only() as second:
+            # Readers share one slot, leaving the other one leasable
+            check.equal(first["id"], second["id"])
+            with pool.lease() as leased:
+                check.not_equal(first["id"], leased["id"])
+                with pytest.raises(PoolError):
+                    with pool.lease():
+                        pass
+        with pool.lease() as first, pool.lease() as second:
+            check.not_equal(first["id"], second["id"])
+
+    def test_updated_employee_shall_be_restored(self, client, pool):
+        with pool.lease() as employee:
+            client.update_employee(Employee("changed", "changed", "changed", 5, id=employee["id"]))
+        # Leasing every slot waits for the background reset to finish
+        with pool.lease() as first, pool.lease() as second:
+            check.is_in(employee["id"], (first["id"], second["id"]))
+        restored = client.get_employee_by_id(employee["id"]).json()
+        check.equal("Pooled", restored["firstName"])
+        check.equal(employee["salary"], restored["salary"])
+
+    def test_deleted_employee_shall_be_replaced(self, client, pool):
+        with pool.lease() as employee:
+            client.delete_employee_by_id(employee["id"])
+        with pool.lease() as first, pool.lease() as second:
+            check.is_not_in(employee["id"], (first["id"], second["id"]))
+        check.equal(2, len(client.get_all_employees().json()))
+
+    def test_failed_reset_shall_be_reported(self, client, monkeypatch):
+        pool = EmployeePool(client, size=1, timeout=1)
+        with pool.lease() as employee:
+            monkeypatch.setattr(client, "update_employee", lambda employee: 1 / 0)
+        with pytest.raises(PoolError, match=f"dropped after failed resets: {employee['id']}"):
+            with pool.lease():
+                pass
+        check.equal([(employee["id"], "ZeroDivisionError('division by zero')")], pool.failed_resets)
+        monkeypatch.undo()
+        check.equal(pool.failed_resets, pool.close())
+
+    def test_close_shall_delete_everything(self, client, pool):
+        with pool.read_only():
+            pass
+        check.equal([], pool.close())
+        check.equal([], client.get_all_employees().json())
+        with pytest.raises(PoolError):
+            with pool.read_only():
+                pass
+
+    def test_close_shall_report_unreturned_leases(self, client, pool):
+        with pool.lease() as employee:
+            check.equal([(employee["id"], "still leased at close")], pool.close())
+        check.equal([], client.get_all_employees().json())
+        check.equal([(employee["id"], "still leased at close")], pool.problems)
@@ -0,0 +1,75 @@
+import pytest
+import pytest_check as check
+
+from src.api import schema
+from src.api.schema import ValidationError, get_employee_validator
+
+
+def valid_employee(**overrides):
+    employee = {
+        "partitionKey": "TestUser788",
+        "sortKey": "007e6bcc-443e-4716-8709-4067b8edfb1d",
+        "username": "uname",
+        "id": "007e6bcc-443e-4716-8709-4067b8edfb1d",
+        "firstName": "first",
+        "lastName": "last",
+        "dependants": 0,
+        "expiration": None,
+        "salary": 52000,
+        "gross": 2000,
+        "benefitsCost": 38.46154,
+        "net": 1961.5385,
+    }
+    employee.update(overrides)
+    return employee
+
+
+class TestSchema:
+    """ Employee validator compiled from docs/swagger.json"""
+
+    def test_bounds_shall_match_the_swagger_schema(self):
+        properties = schema.load_swagger()["components"]["schemas"]["Employee"]["properties"]
+        check.equal(schema.MAX_USERNAME_LENGTH, properties["username"]["maxLength"])
+        check.equal(schema.MAX_NAME_LENGTH, properties["firstName"]["maxLength"])
+        check.equal(schema.MAX_NAME_LENGTH, properties["lastName"]["maxLength"])
+        check.equal(schema.MIN_DEPENDANTS, properties["dependants"]["minimum"])
+        check.equal(schema.MAX_DEPENDANTS, properties["dependants"]["maximum"])
+
+    def test_validator_shall_be_compiled_once(self):
+        check.is_true(get_employee_validator() is get_employee_validator())
+
+    def test_valid_employee_shall_pass(self, employee_validator):
+        check.equal([], employee_validator.validate(valid_employee()))
+        check.equal([], employee_validator.validate(valid_employee(
+            expiration="2015-06-22T04:40:35.641Z", id="007e6bcc443e471687094067b8edfb1d")))
+
+    @pytest.mark.parametrize("overrides, path, message", [
+        ({"username": "a" * 51}, "username", "must be at most 50 characters long"),
+        ({"firstName": 1}, "firstName", "must be a string"),
+        ({"dependants": 33}, "dependants", "must be less than or equal to 32"),
+        ({"dependants": -1}, "dependants", "must be greater than or equal to 0"),
+        ({"dependants": True}, "dependants", "must be an integer"),
+        ({"id": "123"}, "id", "must be a valid uuid"),
+        ({"expiration": "yesterday"}, "expiration", "must be a valid date-time"),
+        ({"sortKey": None}, "sortKey", "must not be null"),
+        ({"salary": "52000"}, "salary", "must be a number"),
+        ({"extra": 1}, "extra", "is not allowed"),
+    ])
+    def test_invalid_field_shall_be_reported(self, employee_validator, overrides, path, message):
+        check.equal([ValidationError(path, message)],
+                    employee_validator.validate(valid_employee(**overrides)))
+
+    def test_missing_required_fields_shall_be_reported(self, employee_validator):
+        errors = employee_validator.validate({"username": "uname"})
+        check.equal(["firstName", "lastName"], [error.path for error in errors])
+
+    def test_list_mode_shall_prefix_item_index(self, employee_validator):
+        employees = [valid_employee() for _ in range(1000)]
+        employees[500] = valid_employee(dependants=40)
+        check.equal([ValidationError("[500].dependants", "must be less than or equal to 32")],
+                    employee_validator.validate_many(employees))
+        check.equal([ValidationError("", "must be an array")], employee_validator.validate_many({}))
+
+    def test_request_direction_shall_ignore_read_only_fields(self):
+        validator = get_employee_validator("request")
+        check.equal([], validator.validate(valid_employee(sortKey=None, gross="x")))
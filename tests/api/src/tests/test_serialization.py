@@ -0,0 +1,41 @@
+import json
+
+import pytest
+import pytest_check as check
+
+from src.api import serialization
+from src.api.api_client import APIClient
+from src.api.employee import Employee
+
+
+class TestSerialization:
+    """ Fast request serialization produces the same documents as to_dict"""
+
+    @pytest.mark.parametrize("employee", [
+        Employee("test_username", "myfirstname", "lname"),
+        Employee("Ünïcode \"quoted\"", "first\nline", "back\\slash", 32,
+                 expiration="2015-06-22T04:40:35.641Z", salary=75000.5,
+                 id="0f8fad5b-d9cb-469f-a165-70867728950e"),
+        Employee("uname", "first", "last", dependants="3", salary=0),
+    ])
+    def test_encoded_employee_shall_match_to_dict(self, employee):
+        check.equal(employee.to_dict(), json.loads(employee.to_json()))
+        check.equal(serialization.dumps(employee.to_dict()), employee.to_json())
+        check.equal(employee.required_fields_to_dict(),
+                    json.loads(employee.to_json(only_required=True)))
+
+    def test_batch_encoder_shall_keep_order(self):
+        employees = [Employee(f"user{i}", "first", "last", i) for i in range(5)]
+        check.equal([e.to_dict() for e in employees],
+                    json.loads(serialization.encode_employees(employees)))
+        check.equal([], json.loads(serialization.encode_employees([])))
+
+    def test_backend_shall_round_trip(self):
+        document = {"id": "abc", "values": [1, 2.5, None, True]}
+        check.equal(document, serialization.loads(serialization.dumps(document)))
+
+    def test_headers_shall_be_built_once_per_key(self):
+        client = APIClient(base_url="http://127.0.0.1")
+        check.is_true(client._get_headers() is client._get_headers())
+        client.api_key = "other"
+        check.equal("Basic other", client._get_headers()["Authorization"])
@@ -0,0 +1,41 @@
+import pytest_check as check
+
+from src.api.api_client import APIClient
+from src.api.employee import Employee
+from src.api.snapshot import EmployeeSnapshot
+
+
+def employee(employee_id, username="uname", first="first", last="last", dependants=0):
+    return {"id": employee_id, "username": username, "firstName": first,
+            "lastName": last, "dependants": dependants}
+
+
+class TestSnapshot:
+    """ Indexed employee snapshots and diffs"""
+
+    def test_lookups_shall_use_indexes(self):
+        snapshot = EmployeeSnapshot([employee("1"), employee("2", "other"), employee("3", first="x")])
+        check.equal(3, len(snapshot))
+        check.is_in("2", snapshot)
+        check.is_not_in("4", snapshot)
+        check.equal(["1", "3"], [e["id"] for e in snapshot.find_by_username("uname")])
+        check.equal(["1", "2"], [e["id"] for e in snapshot.find_by_name("first", "last")])
+        check.equal([], snapshot.find_by_username("missing"))
+        check.is_none(snapshot.get("4"))
+
+    def test_diff_shall_report_added_removed_and_changed(self):
+        before = EmployeeSnapshot([employee("1"), employee("2"), employee("3")])
+        after = EmployeeSnapshot([employee("2"), employee("3", dependants=2), employee("4")])
+        diff = before.diff(after)
+        check.equal(frozenset({"4"}), diff.added)
+        check.equal(frozenset({"1"}), diff.removed)
+        check.equal(frozenset({"3"}), diff.changed)
+
+    def test_fetch_shall_track_server_changes(self, local_api):
+        local_api.store.clear()
+        client = APIClient(base_url=local_api.base_url)
+        before = EmployeeSnapshot.fetch(client)
+        created = client.create_employee(Employee("uname", "first", "last")).json()
+        after = EmployeeSnapshot.fetch(client)
+        check.equal(frozenset({created["id"]}), before.diff(after).added)
+        check.equal(created, after.get(created["id"]))
@@ -0,0 +1,47 @@
+import json
+
+import pytest
+import pytest_check as check
+import requests
+
+from src.api.api_client import APIClient
+from src.api.employee import Employee
+from src.api.streaming import iter_json_array
+
+
+def split(data, size):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+class TestStreaming:
+    """ Incremental parsing of the employee list"""
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 7, 1024])
+    def test_parser_shall_yield_every_element(self, chunk_size):
+        document = [{"id": "a", "firstName": "Ünï", "net": 1961.5385}, 12345, "x,]", [], None, -0.5]
+        data = json.dumps(document, indent=2).encode("utf-8")
+        check.equal(document, list(iter_json_array(split(data, chunk_size))))
+
+    @pytest.mark.parametrize("data", [b"[]", b"  [ ]  ", b"[\n]"])
+    def test_parser_shall_handle_empty_arrays(self, data):
+        check.equal([], list(iter_json_array(split(data, 1))))
+
+    @pytest.mark.parametrize("data", [b"{}", b"[1,", b"[1 2]", b'[{"a": 1'])
+    def test_parser_shall_reject_malformed_arrays(self, data):
+        with pytest.raises(ValueError):
+            list(iter_json_array(split(data, 2)))
+
+    def test_client_shall_stream_employees(self, local_api):
+        local_api.store.clear()
+        client = APIClient(base_url=local_api.base_url)
+        client.create_employees(Employee(f"user{i}", "first", "last", i % 33) for i in range(50))
+        streamed = list(client.iter_employees(chunk_size=100))
+        check.equal(client.get_all_employees().json(), streamed)
+        employees = list(client.iter_employees(as_objects=True))
+        check.is_true(all(isinstance(e, Employee) for e in employees))
+        check.equal(sorted(e["id"] for e in streamed), sorted(e.id for e in employees))
+
+    def test_client_shall_raise_on_error_status(self, local_api):
+        client = APIClient(base_url=local_api.base_url, api_key="")
+        with pytest.raises(requests.HTTPError):
+            list(client.iter_employees())
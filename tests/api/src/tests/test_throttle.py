@@ -0,0 +1,132 @@
+import logging
+import threading
+import time
+
+import pytest
+import pytest_check as check
+import requests
+
+from src.api import throttle as throttles
+from src.api.api_client import APIClient
+from src.api.throttle import AdaptiveThrottle, ThrottleConfig
+from src.api.transport import TransportConfig, create_session
+
+
+def response(status, retry_after=None):
+    result = requests.Response()
+    result.status_code = status
+    if retry_after is not None:
+        result.headers["Retry-After"] = str(retry_after)
+    return result
+
+
+class TestThrottle:
+    """ Adaptive rate and concurrency limiting"""
+
+    def test_healthy_responses_shall_raise_limits(self):
+        throttle = AdaptiveThrottle(ThrottleConfig(rate=10, concurrency=2, burst=100))
+        for _ in range(20):
+            throttle.call(lambda: response(200))
+        metrics = throttle.metrics()
+        check.greater(metrics["rate"], 10)
+        check.greater(metrics["concurrency_limit"], 2)
+        check.equal(20, metrics["increases"])
+        check.equal(0, metrics["in_flight"])
+
+    def test_congestion_shall_decrease_once_per_window(self):
+        throttle = AdaptiveThrottle(ThrottleConfig(rate=40, concurrency=8, burst=100))
+        sent = [throttle.acquire() for _ in range(3)]
+        for sent_at in sent:
+            throttle.release(sent_at, 503)
+        metrics = throttle.metrics()
+        check.equal(1, metrics["decreases"])
+        check.equal(3, metrics["congested"])
+        check.equal(20, metrics["rate"])
+        check.equal(4, metrics["concurrency_limit"])
+
+    def test_errors_and_slow_responses_shall_count_as_congestion(self):
+        throttle = AdaptiveThrottle(ThrottleConfig(latency_target_ms=1, burst=100))
+        throttle.call(lambda: time.sleep(0.01) or response(200))
+
+        def unreachable():
+            raise requests.ConnectionError()
+
+        with pytest.raises(requests.ConnectionError):
+            throttle.call(unreachable)
+        metrics = throttle.metrics()
+        check.equal(2, metrics["congested"])
+        check.equal(1, metrics["errors"])
+        check.equal(0, metrics["increases"])
+
+    def test_concurrency_limit_shall_block_extra_requests(self):
+        throttle = AdaptiveThrottle(ThrottleConfig(concurrency=1, burst=100))
+        first = throttle.acquire()
+        acquired = threading.Event()
+        waiter = threading.Thread(target=lambda: throttle.acquire() and acquired.set())
+        waiter.start()
+        check.is_false(acquired.wait(0.1))
+        throttle.release(first, 200)
+        check.is_true(acquired.wait(1))
+        waiter.join()
+
+    def test_token_bucket_shall_pace_requests(self):
+        throttle = AdaptiveThrottle(ThrottleConfig(rate=20, burst=1, rate_increase=0))
+        started = time.perf_counter()
+        for _ in range(4):
+            throttle.call(lambda: response(200))
+        # One token up front, three more at 20 per second
+        check.greater_equal(time.perf_counter() - started, 0.14)
+
+    def test_retry_after_shall_pause_requests(self):
+        throttle = AdaptiveThrottle(ThrottleConfig(burst=100))
+        throttle.call(lambda: response(429, retry_after=0.2))
+        started = time.perf_counter()
+        throttle.call(lambda: response(200))
+        check.greater_equal(time.perf_counter() - started, 0.15)
+
+    def test_retries_shall_go_through_the_throttle(self):
+        throttle = AdaptiveThrottle(ThrottleConfig(burst=100, backoff_factor=0))
+        statuses = iter([503, 503, 200])
+        check.equal(200, throttle.call(lambda: response(next(statuses)), retry=True).status_code)
+        metrics = throttle.metrics()
+        check.equal(3, metrics["requests"])
+        check.equal(2, metrics["retries"])
+        check.equal(2, metrics["congested"])
+        # The retry was sent after the first decrease, so it starts a new window
+        check.equal(2, metrics["decreases"])
+        # Not retried without retry=True, e.g. for a POST
+        check.equal(503, throttle.call(lambda: response(503)).status_code)
+        check.equal(4, throttle.metrics()["requests"])
+
+    def test_throttled_client_shall_not_retry_in_the_transport(self, flaky_server):
+        throttle = AdaptiveThrottle(ThrottleConfig(burst=100, backoff_factor=0))
+        client = APIClient(base_url=f"http://127.0.0.1:{flaky_server.server_port}", throttle=throttle,
+                           session=create_session())
+        check.equal(200, client.get_all_employees().status_code)
+        # Two 503 and the 200 each went through the throttle
+        check.equal(3, flaky_server.calls)
+        check.equal(3, throttle.metrics()["requests"])
+        check.equal(2, throttle.metrics()["congested"])
+        check.equal(3, client.connection_stats()["requests"])
+
+    def test_throttled_bulk_calls_shall_use_the_resized_pool(self, local_api, caplog):
+        throttle = AdaptiveThrottle(ThrottleConfig(rate=1000, burst=100, concurrency=8))
+        client = APIClient(base_url=local_api.base_url, throttle=throttle,
+                           session=create_session(TransportConfig(pool_maxsize=2)))
+        with client, caplog.at_level(logging.WARNING, logger="urllib3.connectionpool"):
+            result = client._fan_out(lambda item: client.get_all_employees(), range(40), max_workers=8)
+            stats = client.connection_stats()
+        check.is_true(result.ok)
+        check.equal(40, stats["requests"])
+        check.less_equal(stats["opened"], 8)
+        # The pool would discard the connections it has no room for
+        check.equal([], [r.getMessage() for r in caplog.records if "pool is full" in r.getMessage()])
+
+    def test_global_throttle_shall_cover_every_client(self, local_api):
+        throttle = throttles.enable(AdaptiveThrottle(ThrottleConfig(burst=100)))
+        try:
+            APIClient(base_url=local_api.base_url).get_all_employees()
+            APIClient(base_url=local_api.base_url).get_all_employees()
+        finally:
+            throttles.disable()
+        check.equal(2, throttle.metrics()["requests"])
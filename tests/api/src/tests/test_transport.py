@@ -0,0 +1,37 @@
+import pytest
+import pytest_check as check
+
+from src.api.api_client import APIClient
+from src.api.transport import TransportConfig, create_session, session_stats
+
+
+class TestTransport:
+    """ Connection reuse and retry policy of the shared transport"""
+
+    def test_clients_shall_share_keep_alive_connections(self, local_api):
+        config = TransportConfig(pool_maxsize=2)
+        first = APIClient(base_url=local_api.base_url, transport_config=config)
+        second = APIClient(base_url=local_api.base_url, transport_config=config)
+        check.is_true(first.session is second.session)
+        for _ in range(5):
+            first.get_all_employees()
+            second.get_all_employees()
+        stats = first.connection_stats()
+        check.equal(10, stats["requests"])
+        check.equal(1, stats["opened"])
+        check.equal(9, stats["reused"])
+
+    def test_transient_errors_shall_be_retried(self, flaky_server):
+        config = TransportConfig(max_retries=3, backoff_factor=0, backoff_jitter=0)
+        session = create_session(config)
+        client = APIClient(base_url=f"http://127.0.0.1:{flaky_server.server_port}", session=session)
+        check.equal(200, client.get_all_employees().status_code)
+        check.equal(3, flaky_server.calls)
+        check.equal(1, session_stats(session)["requests"])
+
+    def test_exhausted_retries_shall_return_last_response(self, flaky_server):
+        config = TransportConfig(max_retries=1, backoff_factor=0, backoff_jitter=0)
+        client = APIClient(base_url=f"http://127.0.0.1:{flaky_server.server_port}",
+                           session=create_session(config))
+        check.equal(503, client.get_all_employees().status_code)
+        check.equal(2, flaky_server.calls)
@@ -0,0 +1,106 @@
+"""
+Wall-clock benchmark of the browser capability profiles.
+
+Starts `--sessions` browsers per profile, loads a page in each and quits it,
+then reports startup, page load, quit and total times per profile as JSON.
+
+Usage (from tests/ui):
+    python -m benchmark.profiles --sessions 5 --output profiles.json
+    python -m benchmark.profiles --profiles headless,lean --url https://example.com
+"""
+import argparse
+import json
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+
+from selenium.webdriver.support.wait import WebDriverWait
+
+from drivers.pool import ChromeFactory
+from drivers.profiles import PROFILES, chrome_options
+from pages.login import LoginPage
+
+PHASES = ("startup_s", "load_s", "quit_s", "total_s")
+
+
+def _summary(values):
+    return {
+        "mean": round(statistics.mean(values), 3),
+        "median": round(statistics.median(values), 3),
+        "min": round(min(values), 3),
+        "max": round(max(values), 3),
+    }
+
+
+def measure_session(factory, url, timeout=30):
+    """Times one browser: start, load `url` until the document is complete, quit."""
+    started = time.perf_counter()
+    driver = factory()
+    ready = time.perf_counter()
+    try:
+        driver.get(url)
+        WebDriverWait(driver, timeout).until(
+            lambda d: d.execute_script("return document.readyState") == "complete")
+        loaded = time.perf_counter()
+    finally:
+        driver.quit()
+    finished = time.perf_counter()
+    return {"startup_s": ready - started, "load_s": loaded - ready, "quit_s": finished - loaded,
+            "total_s": finished - started}
+
+
+def benchmark_profile(profile, url, sessions):
+    """Runs `sessions` sessions of one profile back to back and summarizes each phase."""
+    factory = ChromeFactory(chrome_options(profile))
+    # The first call resolves chromedriver, keep it out of the measurements
+    measure_session(factory, "about:blank")
+    runs = [measure_session(factory, url) for _ in range(sessions)]
+    return {phase: _summary([run[phase] for run in runs]) for phase in PHASES}
+
+
+def run(profiles, url, sessions):
+    """Benchmarks every profile and returns the report as a dict."""
+    started_at = datetime.now(timezone.utc).isoformat()
+    results = {name: benchmark_profile(name, url, sessions) for name in profiles}
+    baseline = results[profiles[0]]["total_s"]["mean"]
+    for result in results.values():
+        # How many sessions of this profile fit in the time of one baseline session
+        result["speedup"] = round(baseline / result["total_s"]["mean"], 2)
+    return {
+        "started_at": started_at,
+        "url": url,
+        "sessions": sessions,
+        "baseline": profiles[0],
+        "profiles": results,
+    }
+
+
+def _parse_profiles(text):
+    names = [name.strip() for name in text.split(",") if name.strip()]
+    unknown = [name for name in names if name not in PROFILES]
+    if unknown or not names:
+        raise argparse.ArgumentTypeError(f"Profiles must be among {', '.join(PROFILES)}.")
+    return names
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare the wall-clock cost of browser profiles.")
+    parser.add_argument("--profiles", type=_parse_profiles, default=list(PROFILES),
+                        help="Comma separated profiles, the first one is the baseline.")
+    parser.add_argument("--sessions", type=int, default=3, help="Browser sessions per profile.")
+    parser.add_argument("--url", default=LoginPage._DEFAULT_URL, help="Page loaded by every session.")
+    parser.add_argument("--output", help="Write the JSON report to this file instead of stdout.")
+    args = parser.parse_args(argv)
+
+    document = json.dumps(run(args.profiles, args.url, args.sessions), indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(document)
+    else:
+        sys.stdout.write(document + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,101 @@
+import uuid
+import warnings
+
+import pytest
+
+from drivers.pool import DEFAULT_POOL_SIZE, ChromeFactory, DriverPool
+from drivers.profiles import DEFAULT_PROFILE, PROFILES, chrome_options
+from src.api.api_client import APIClient
+from src.api.cleanup import CleanupRegistry
+from src.api.namespace import DataNamespace
+
+pytest_plugins = ["plugins.parallel"]
+
+
+def pytest_addoption(parser):
+    parser.addoption("--browser-pool-size", type=int, default=DEFAULT_POOL_SIZE,
+                     help="Browser sessions kept warm and reused across tests.")
+    parser.addoption("--browser-profile", default=DEFAULT_PROFILE, choices=sorted(PROFILES),
+                     help="Chrome capability profile of every browser session, e.g. headless or lean.")
+
+
+@pytest.fixture(scope="session")
+def driver_pool(request):
+    """
+    Warm browser sessions shared by every test of the session, all started
+    with the --browser-profile capabilities. They are quit when the session ends.
+    Under pytest-xdist every worker has its own pool.
+    """
+    factory = ChromeFactory(chrome_options(request.config.getoption("--browser-profile")))
+    pool = DriverPool(size=request.config.getoption("--browser-pool-size"), factory=factory)
+    yield pool
+    pool.close()
+
+
+@pytest.fixture(scope="function")
+def driver(driver_pool):
+    """
+    A pooled WebDriver for one test.
+    Storage and cookies are cleared and the browser goes back to about:blank afterwards.
+    """
+    with driver_pool.lease() as driver:
+        yield driver
+
+
+@pytest.fixture(scope="session")
+def api_client():
+    """
+    APIClient of the account the UI logs in with.
+    Used to seed preconditions and to verify UI results without scraping the table.
+    """
+    return APIClient()
+
+
+@pytest.fixture(scope="session")
+def api_cleanup(api_client):
+    """
+    Deletes the employees seeded through the API, off the tests' critical path.
+    """
+    registry = CleanupRegistry(api_client)
+    yield registry
+    leaked = registry.close()
+    if leaked:
+        warnings.warn(pytest.PytestWarning(f"{len(leaked)} seeded employees could not be deleted: {leaked}"))
+
+
+@pytest.fixture(scope="session")
+def ui_namespace():
+    """Username namespace of the employees seeded by this worker."""
+    return DataNamespace()
+
+
+@pytest.fixture(scope="function")
+def seed_employees(api_client, api_cleanup, ui_namespace, worker_names):
+    """
+    Creates employees through the API in one bulk call, instead of the Add Employee modal.
+    Returns the created records; they are deleted in the background after the test.
+    First names default to worker_names, so the rows can be told apart from other workers'.
+    Seed before the dashboard loads, or call BenefitsPage.reload() afterwards.
+    """
+    created = []
+
+    def seed(count=1, first_name=None, last_name="last", dependants=0):
+        employees = [ui_namespace.employee(f"ui{uuid.uuid4().hex[:8]}", first_name or worker_names("first"),
+                                           last_name, dependants=dependants) for _ in range(count)]
+        result = api_client.create_employees(employees)
+        records = [response.json() for response in result.responses if response is not None and response.ok]
+        for record in records:
+            created.append(api_cleanup.register(record["id"]))
+        if not result.ok:
+            raise AssertionError(f"Could not seed employees: {result.failures}")
+        return records
+
+    yield seed
+    for employee_id in created:
+        api_cleanup.release(employee_id)
+
+
+@pytest.fixture(scope="function")
+def seeded_employee(seed_employees):
+    """One employee created through the API for the test to act on."""
+    return seed_employees()[0]
@@ -0,0 +1,158 @@
+import threading
+from contextlib import contextmanager
+
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.chrome.service import Service
+from webdriver_manager.chrome import ChromeDriverManager
+
+DEFAULT_POOL_SIZE = 1
+
+# Storage is per origin, so it has to be cleared before leaving the test's page
+CLEAR_STORAGE_SCRIPT = """
+try { window.localStorage.clear(); } catch (e) {}
+try { window.sessionStorage.clear(); } catch (e) {}
+"""
+
+
+class DriverPoolError(Exception):
+    """Raised when the pool cannot hand out a browser session."""
+
+
+class ChromeFactory:
+    """
+    Starts Chrome sessions, resolving the chromedriver binary only once.
+    """
+
+    def __init__(self, options=None):
+        self.options = options
+        self._service_path = None
+
+    def __call__(self):
+        if self._service_path is None:
+            self._service_path = ChromeDriverManager().install()
+        return webdriver.Chrome(service=Service(self._service_path), options=self.options)
+
+
+class DriverPool:
+    """
+    Pool of warm browser sessions reused across tests.
+
+    Sessions are started lazily, up to `size` at a time. Before a session is
+    handed out again it is reset: local and session storage and cookies are
+    cleared, pending browser logs are drained and the browser is parked on
+    about:blank. A session that fails the reset or the health check is quit
+    and replaced by a new one.
+
+    Usage:
+        pool = DriverPool(size=2)
+        with pool.lease() as driver:
+            driver.get(url)
+        pool.close()
+    """
+
+    def __init__(self, size=DEFAULT_POOL_SIZE, factory=None, timeout=120):
+        if size < 1:
+            raise ValueError("size must be greater than zero.")
+        self.size = size
+        self.factory = factory or ChromeFactory()
+        self.timeout = timeout
+        self._idle = []
+        self._started = 0
+        self._condition = threading.Condition()
+        self._closed = False
+
+    def _take(self):
+        """Returns an idle session, or None when a new one may be started."""
+        with self._condition:
+            if not self._condition.wait_for(
+                    lambda: self._closed or self._idle or self._started < self.size, timeout=self.timeout):
+                raise DriverPoolError(f"No browser session available after {self.timeout}s.")
+            if self._closed:
+                raise DriverPoolError("The driver pool is closed.")
+            if self._idle:
+                return self._idle.pop()
+            self._started += 1
+            return None
+
+    def acquire(self):
+        """Returns a healthy session for exclusive use."""
+        driver = self._take()
+        while driver is not None and not self._is_healthy(driver):
+            self._discard(driver)
+            driver = self._take()
+        if driver is None:
+            try:
+                driver = self.factory()
+            except Exception:
+                self._discard(None)
+                raise
+        return driver
+
+    def release(self, driver):
+        """Resets a session and puts it back, or replaces it if it is broken."""
+        if not self._reset(driver):
+            self._discard(driver)
+            return
+        with self._condition:
+            if self._closed:
+                self._started -= 1
+                _quit(driver)
+            else:
+                self._idle.append(driver)
+            self._condition.notify_all()
+
+    @contextmanager
+    def lease(self):
+        """Gives exclusive use of a session, reset and returned to the pool afterwards."""
+        driver = self.acquire()
+        try:
+            yield driver
+        finally:
+            self.release(driver)
+
+    def _is_healthy(self, driver):
+        try:
+            _ = driver.current_url
+            return True
+        except WebDriverException:
+            return False
+
+    def _reset(self, driver):
+        try:
+            driver.execute_script(CLEAR_STORAGE_SCRIPT)
+            driver.delete_all_cookies()
+            driver.get("about:blank")
+            try:
+                driver.get_log("browser")
+            except WebDriverException:
+                # Not every driver exposes browser logs
+                pass
+            return True
+        except WebDriverException:
+            return False
+
+    def _discard(self, driver):
+        """Quits a broken session and frees its slot for a new one."""
+        if driver is not None:
+            _quit(driver)
+        with self._condition:
+            self._started -= 1
+            self._condition.notify_all()
+
+    def close(self):
+        """Quits every idle session; leased ones are quit when they come back."""
+        with self._condition:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._started -= len(idle)
+            self._condition.notify_all()
+        for driver in idle:
+            _quit(driver)
+
+
+def _quit(driver):
+    try:
+        driver.quit()
+    except WebDriverException:
+        pass
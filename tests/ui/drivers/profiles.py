@@ -0,0 +1,69 @@
+from collections import namedtuple
+
+from selenium.webdriver.chrome.options import Options
+
+BrowserProfile = namedtuple("BrowserProfile", [
+    "name",
+    "headless",
+    "window_size",        # (width, height), None keeps the browser default
+    "images",             # load images
+    "remote_fonts",       # download web fonts
+    "extensions",         # allow extensions and component updates
+    "background_work",    # background networking, component updates and first run tasks
+])
+BrowserProfile.__doc__ = """
+Named set of Chrome capabilities applied to every pooled browser session.
+"""
+
+PROFILES = {
+    # A plain Chrome window, as started before profiles existed
+    "headed": BrowserProfile("headed", False, None, True, True, True, True),
+    "headless": BrowserProfile("headless", True, (1280, 800), True, True, False, True),
+    # Headless and only what the tests need: no images, fonts, extensions or background work,
+    # in the smallest window that still gets the desktop (>= 992px) layout of the page
+    "lean": BrowserProfile("lean", True, (1024, 768), False, False, False, False),
+}
+DEFAULT_PROFILE = "headed"
+
+# Background services a test session does not need. Chrome's throttling of hidden
+# windows and renderers is left on, it saves work when several browsers run at once
+BACKGROUND_SWITCHES = (
+    "--disable-background-networking",
+    "--disable-component-update",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--disable-features=Translate,MediaRouter,OptimizationHints",
+    "--metrics-recording-only",
+    "--no-first-run",
+)
+
+
+def get_profile(name):
+    try:
+        return PROFILES[name]
+    except KeyError:
+        raise ValueError(f"Unknown browser profile '{name}', expected one of {', '.join(PROFILES)}.")
+
+
+def chrome_options(profile):
+    """
+    Builds the ChromeOptions of a profile, given by name or as a BrowserProfile.
+    """
+    if isinstance(profile, str):
+        profile = get_profile(profile)
+    options = Options()
+    if profile.headless:
+        options.add_argument("--headless=new")
+    if profile.window_size:
+        options.add_argument("--window-size={},{}".format(*profile.window_size))
+    if not profile.images:
+        options.add_argument("--blink-settings=imagesEnabled=false")
+        options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+    if not profile.remote_fonts:
+        options.add_argument("--disable-remote-fonts")
+    if not profile.extensions:
+        options.add_argument("--disable-extensions")
+    if not profile.background_work:
+        for switch in BACKGROUND_SWITCHES:
+            options.add_argument(switch)
+    return options
@@ -0,0 +1,129 @@
+import time
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support.wait import WebDriverWait
+
+DEFAULT_TIMEOUT = 10
+# The page counts as settled once nothing changed for this long
+DEFAULT_QUIET_PERIOD = 0.2
+# An action that starts no request within this long was handled client side
+DEFAULT_REQUEST_GRACE = 0.5
+POLL_FREQUENCY = 0.05
+
+# Counts fetch/XHR requests and mutations of the watched element. Installing
+# twice is a no-op; a page load drops it and read() then returns null.
+INSTALL_SCRIPT = """
+var selector = arguments[0];
+if (window.__uiActivity) { return; }
+var state = {started: 0, pending: 0, version: 0, changedAt: performance.now()};
+function touched() { state.changedAt = performance.now(); }
+function begin() { state.started++; state.pending++; touched(); }
+function end() { state.pending = Math.max(state.pending - 1, 0); touched(); }
+
+if (window.fetch) {
+    var fetch = window.fetch;
+    window.fetch = function () {
+        begin();
+        return fetch.apply(this, arguments).finally(end);
+    };
+}
+var send = XMLHttpRequest.prototype.send;
+XMLHttpRequest.prototype.send = function () {
+    begin();
+    this.addEventListener('loadend', end);
+    return send.apply(this, arguments);
+};
+
+// A change inside the element, or the element itself (re)inserted or removed.
+// Mutations of its ancestors, e.g. a modal backdrop added to body, do not count.
+function inside(node) {
+    var element = node.nodeType === 1 ? node : node.parentElement;
+    return !!(element && element.closest(selector));
+}
+function holds(nodes) {
+    for (var i = 0; i < nodes.length; i++) {
+        var node = nodes[i];
+        if (node.nodeType === 1 && (node.matches(selector) || node.querySelector(selector))) { return true; }
+    }
+    return false;
+}
+function watched(mutation) {
+    return inside(mutation.target) || holds(mutation.addedNodes) || holds(mutation.removedNodes);
+}
+new MutationObserver(function (mutations) {
+    for (var i = 0; i < mutations.length; i++) {
+        if (watched(mutations[i])) { state.version++; touched(); return; }
+    }
+}).observe(document.documentElement, {childList: true, subtree: true, characterData: true});
+
+window.__uiActivity = {
+    read: function () {
+        return {started: state.started, pending: state.pending, version: state.version,
+                idle_ms: performance.now() - state.changedAt};
+    }
+};
+"""
+READ_SCRIPT = "return window.__uiActivity ? window.__uiActivity.read() : null;"
+
+
+class PageActivity:
+    """
+    Event driven waits for a page that re-renders an element after requests.
+
+    The page is instrumented with a MutationObserver on `selector` and with
+    counters around fetch and XMLHttpRequest. Take a snapshot() before an
+    action and call wait_settled() after it: the wait ends as soon as the
+    requests the action started have completed and the element stopped
+    changing for a quiet period, instead of after a fixed sleep.
+
+    Usage:
+        activity = PageActivity(driver, "#employeesTable")
+        before = activity.snapshot()
+        save_button.click()
+        activity.wait_settled(before, expect_change=True)
+    """
+
+    def __init__(self, driver, selector, timeout=DEFAULT_TIMEOUT, quiet_period=DEFAULT_QUIET_PERIOD,
+                 request_grace=DEFAULT_REQUEST_GRACE):
+        self.driver = driver
+        self.selector = selector
+        self.timeout = timeout
+        self.quiet_period = quiet_period
+        self.request_grace = request_grace
+
+    def _read(self):
+        state = self.driver.execute_script(READ_SCRIPT)
+        if state is None:
+            # New document: instrument it, changes from here on are counted
+            self.driver.execute_script(INSTALL_SCRIPT, self.selector)
+            state = self.driver.execute_script(READ_SCRIPT)
+        return state
+
+    def snapshot(self):
+        """Current counters; pass them to wait_settled() after the action."""
+        return self._read()
+
+    def wait_settled(self, before, expect_change=False, timeout=None):
+        """
+        Waits until the requests started after `before` completed and the element
+        stayed unchanged for the quiet period. With expect_change the element must
+        also have re-rendered at least once. Raises TimeoutException otherwise.
+        """
+        started_waiting = time.monotonic()
+
+        def settled(_):
+            state = self._read()
+            if state["started"] < before["started"] or state["version"] < before["version"]:
+                # The page was reloaded since the snapshot, counters restarted
+                return state["pending"] == 0 and state["idle_ms"] >= self.quiet_period * 1000
+            if state["started"] == before["started"] and \
+                    time.monotonic() - started_waiting < self.request_grace:
+                return False
+            if expect_change and state["version"] == before["version"]:
+                return False
+            return state["pending"] == 0 and state["idle_ms"] >= self.quiet_period * 1000
+
+        try:
+            WebDriverWait(self.driver, timeout or self.timeout, poll_frequency=POLL_FREQUENCY).until(settled)
+        except TimeoutException:
+            raise TimeoutException(f"'{self.selector}' did not settle within {timeout or self.timeout}s.")
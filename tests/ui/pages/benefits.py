@@ -1,5 +1,3 @@
-import time
-
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.support import expected_conditions as ec
@@ -7,6 +5,9 @@ from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from selenium.webdriver.support.expected_conditions import visibility_of_element_located
 from selenium.webdriver.support.wait import WebDriverWait
 
+from drivers.waits import PageActivity
+from pages.table import TableSnapshot
+
 
 class BenefitsPage:
     """
@@ -32,8 +33,6 @@ class BenefitsPage:
     MODAL_TITLE = (By.CSS_SELECTOR,
                    "div[id='employeeModal'] h5[class='modal-title']")
     EMPLOYEE_TABLE = (By.ID, "employeesTable")
-    EMPLOYEE_ROW_BY_NAME = (
-        By.XPATH, "//table[@id='employeesTable']//tr[td[text()='{}']]")
     EDIT_ACTION_BUTTON = (By.XPATH, ".//i[contains(@class, 'fa-edit')]")
     DELETE_ACTION_BUTTON = (By.XPATH, ".//i[contains(@class, 'fa-times')]")
     BENEFIT_COST_DISPLAY = (By.ID, "total-benefit-cost")
@@ -47,6 +46,7 @@ class BenefitsPage:
         """
         self.driver = driver
         self.wait = WebDriverWait(self.driver, 10)
+        self.table_activity = PageActivity(self.driver, "#employeesTable")
 
     def add_employee(self, first_name, last_name, dependants, verify=False):
         """
@@ -69,7 +69,7 @@ class BenefitsPage:
         # 1. The employee should save and appear in the table.
         # This part requires waiting for the row to appear. We'll use a dynamic locator.
         employee_row_locator = (
-            By.XPATH, f".//td[contains(text(), {first_name})]")
+            By.XPATH, f".//td[contains(text(), '{first_name}')]")
         try:
             _ = self.wait.until(
                 ec.presence_of_element_located(employee_row_locator))
@@ -88,21 +88,26 @@ class BenefitsPage:
 
     def save_add_form(self, wait_table_appears=True):
         # Click the "Save" button
+        before = self.table_activity.snapshot()
         self.driver.find_element(*self.SAVE_BUTTON).click()
-        if wait_table_appears:
-            second_row = (By.CSS_SELECTOR,
-                          "#employeesTable > tbody > tr:nth-child(2)")
-            self.wait.until(visibility_of_element_located(second_row))
-        time.sleep(3)  # Sleep added due to problem on loading table
+        self.wait_table_settled(before, wait_table_appears)
 
     def save_update_form(self, wait_table_appears=True):
         # Click the "Save" button
+        before = self.table_activity.snapshot()
         self.driver.find_element(*self.UPDATE_BUTTON).click()
+        self.wait_table_settled(before, wait_table_appears)
+
+    def wait_table_settled(self, before, wait_table_appears=True):
+        """
+        Waits until the requests sent since `before` completed and the table stopped
+        re-rendering, so the next step sees the fully loaded table.
+        """
         if wait_table_appears:
             second_row = (By.CSS_SELECTOR,
                           "#employeesTable > tbody > tr:nth-child(2)")
             self.wait.until(visibility_of_element_located(second_row))
-        time.sleep(3)  # Sleep added due to problem on loading table
+        self.table_activity.wait_settled(before)
 
     def fill_up_add_employee_form(self, dependants, first_name, last_name):
         self.driver.find_element(*self.FIRST_NAME_INPUT).send_keys(first_name)
@@ -140,7 +145,7 @@ class BenefitsPage:
         try:
             self.wait.until(ec.staleness_of(employee_row))
             employee_row_locator = (
-                By.XPATH, f".//td[contains(text(), {new_first})]")
+                By.XPATH, f".//td[contains(text(), '{new_first}')]")
             self.wait.until(
                 ec.presence_of_element_located(employee_row_locator))
         except TimeoutException:
@@ -166,17 +171,35 @@ class BenefitsPage:
         self.wait.until(ec.visibility_of_element_located(self.MODAL))
 
     def get_existing_employee_from_table(self, id):
-        # Find the row for the specified employee
-        employee_row_locator = (
-            By.XPATH, self.EMPLOYEE_ROW_BY_NAME[1].format(id))
+        # Find the row for the specified employee, one table read per poll
+        def find_row(driver):
+            snapshot = self.get_table_snapshot()
+            matches = snapshot.find(id)
+            return snapshot.element(matches[0]) if matches else False
+
         try:
-            employee_row = self.wait.until(
-                ec.presence_of_element_located(employee_row_locator))
+            employee_row = self.wait.until(find_row)
         except TimeoutException:
             raise NoSuchElementException(
                 f"Employee '{id}' not found in the table.")
         return employee_row
 
+    def reload(self, wait_for_id=None):
+        """
+        Reloads the dashboard once, e.g. after seeding employees through the API,
+        and waits for the table (and the row of wait_for_id, if given).
+        """
+        self.driver.refresh()
+        self.wait.until(ec.presence_of_element_located(self.EMPLOYEE_TABLE))
+        if wait_for_id is not None:
+            self.get_existing_employee_from_table(wait_for_id)
+
+    def get_table_snapshot(self) -> TableSnapshot:
+        """
+        Reads the whole employees table in a single WebDriver call.
+        """
+        return TableSnapshot.capture(self.driver, "#" + self.EMPLOYEE_TABLE[1])
+
     def delete_employee(self, id, verify=False):
         """
         Scenario 3: Deletes an employee from the benefits dashboard.
@@ -187,17 +210,20 @@ class BenefitsPage:
 
         employee_row = self.get_existing_employee_from_table(id)
         self.click_delete_button(employee_row)
+        before = self.table_activity.snapshot()
         self.confirm_deletion()
 
         if verify:
             self.validate_employee_deletion(employee_row, id)
-        time.sleep(3)
+        self.table_activity.wait_settled(before, expect_change=True)
 
     def confirm_deletion(self):
         self.driver.find_element(*self.DEL_CONFIRMATION_BUTTON).click()
 
     def cancel_deletion(self):
         self.driver.find_element(*self.DEL_CANCEL_BUTTON).click()
+        # The table is only untouched once the modal is gone
+        self.wait.until(ec.invisibility_of_element_located(self.DEL_MODAL))
 
     def validate_employee_deletion(self, employee_row, id):
         # Acceptance Criteria Validation
@@ -220,9 +246,21 @@ class BenefitsPage:
         """
         Gets the total number of rows in the table, including the header row.
         """
-        table_element = self.driver.find_element(*self.EMPLOYEE_TABLE)
-        rows = table_element.find_elements(By.TAG_NAME, "tr")
-        return len(rows)
+        return self.get_table_snapshot().total_rows
+
+    def count_employees(self, name) -> int:
+        """
+        Gets the number of rows having a cell with exactly this name.
+        With a name unique to the test, rows other tests add meanwhile are not counted.
+        """
+        return len(self.get_table_snapshot().find(name))
+
+    def get_employee_ids(self, names):
+        """
+        Gets the ids (first column) of the rows having a cell owned by names, a WorkerNames.
+        """
+        snapshot = self.get_table_snapshot()
+        return [snapshot.rows[index][0] for index in snapshot.matching(names.owns)]
 
     def get_title_form(self):
         element = self.driver.find_element(*self.MODAL_TITLE)
@@ -238,13 +276,10 @@ class BenefitsPage:
         """
         texts = []
         try:
-            rows = self.driver.find_elements(
-                By.XPATH, "//table[@id='employeesTable']//tr")
-
-            for row in rows:
-                cells = row.find_elements(By.XPATH, f"./*[{column_index + 1}]")
-                if cells:
-                    texts.append(cells[0].text)
+            snapshot = self.get_table_snapshot()
+            if column_index < len(snapshot.header):
+                texts.append(snapshot.header[column_index])
+            texts.extend(snapshot.column(column_index))
 
         except Exception as e:
             print(f"An error occurred while getting column texts: {e}")
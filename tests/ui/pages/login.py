@@ -1,10 +1,18 @@
 import os
 import json
+import time
+from contextlib import contextmanager
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as ec
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
 
 class LoginPage:
     """
@@ -15,6 +23,10 @@ class LoginPage:
     # The user can override these during initialization.
     _DEFAULT_URL = "https://wmxrwq14uc.execute-api.us-east-1.amazonaws.com/Prod/Account/Login"
     _DEFAULT_COOKIE_FILE = "cookies.json"
+    # Session cookies carry no expiry, trust a saved login for at most this long
+    _DEFAULT_COOKIE_MAX_AGE = 15 * 60
+    # Cookies this close to expiring are treated as expired
+    _EXPIRY_MARGIN = 60
 
     # Define locators for the login page elements.
     # It's a good practice to use By.ID as it's a stable and fast locator.
@@ -22,13 +34,60 @@ class LoginPage:
     PASSWORD_INPUT = (By.ID, "Password")
     SUBMIT_BUTTON = (By.XPATH, "//button[contains(text(), 'Log In')]")
 
-    def __init__(self, driver: WebDriver, url: str = _DEFAULT_URL, cookie_file: str = _DEFAULT_COOKIE_FILE):
+    def __init__(self, driver: WebDriver, url: str = _DEFAULT_URL, cookie_file: str = _DEFAULT_COOKIE_FILE,
+                 cookie_max_age: int = _DEFAULT_COOKIE_MAX_AGE):
         """
         Initializes the LoginPage object.
         """
         self.driver = driver
         self.url = url
         self.cookie_file = cookie_file
+        self.cookie_max_age = cookie_max_age
+
+    def ensure_logged_in(self, username, password):
+        """
+        Authenticates the session, reusing saved cookies when they are still valid.
+        Valid cookies are used without locking, the file is replaced atomically.
+        Only a login takes the lock, so parallel workers wait for a single login
+        instead of racing, and reuse the cookies it saved once they get the lock.
+        """
+        tried = self.read_cookies()
+        if tried is not None and self._apply_cookies(tried) and self.is_logged_in():
+            return
+        with self._cookie_lock():
+            # Another worker may have logged in while this one waited
+            data = self.read_cookies()
+            if data is not None and (tried is None or data.get("saved_at") != tried.get("saved_at")) \
+                    and self._apply_cookies(data) and self.is_logged_in():
+                return
+            self.login(username, password)
+            self.save_cookies()
+
+    def is_logged_in(self):
+        """
+        True unless the application sent the browser back to the login form.
+        """
+        return not self.driver.current_url.startswith(self.url)
+
+    @contextmanager
+    def _cookie_lock(self):
+        """
+        Exclusive lock on the cookie file shared by every worker on this machine.
+        """
+        with open(f"{self.cookie_file}.lock", "a+") as lock_file:
+            if fcntl:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            else:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                if fcntl:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+                else:
+                    lock_file.seek(0)
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
 
     def login(self, username, password):
         """
@@ -53,6 +112,7 @@ class LoginPage:
 
             # Optional: Add a wait for the URL to change to confirm successful login
             wait.until(ec.url_changes(self.url))
+            self._wait_page_loaded()
 
             print("Login successful.")
 
@@ -60,44 +120,85 @@ class LoginPage:
             print(f"An error occurred during login: {e}")
             raise
 
+    def _wait_page_loaded(self):
+        WebDriverWait(self.driver, 10).until(
+            lambda driver: driver.execute_script("return document.readyState") == "complete")
+
     def save_cookies(self):
         """
-        Captures all cookies from the current session and saves them to a file.
+        Captures all cookies from the current session and saves them to a file,
+        together with the page to return to and the time they expire.
         """
         try:
             cookies = self.driver.get_cookies()
-            with open(self.cookie_file, 'w') as f:
-                json.dump(cookies, f, indent=4)
+            saved_at = time.time()
+            expiries = [cookie["expiry"] for cookie in cookies if "expiry" in cookie]
+            data = {
+                "saved_at": saved_at,
+                "expires_at": min(expiries + [saved_at + self.cookie_max_age]),
+                "landing_url": self.driver.current_url,
+                "cookies": cookies,
+            }
+            # Write then rename, so a reader never sees a half written file
+            temp_file = f"{self.cookie_file}.{os.getpid()}.tmp"
+            with open(temp_file, 'w') as f:
+                json.dump(data, f, indent=4)
+            os.replace(temp_file, self.cookie_file)
             print(f"Cookies saved to {self.cookie_file}")
 
         except Exception as e:
             print(f"Failed to save cookies: {e}")
 
-    def load_cookies(self):
+    def read_cookies(self):
         """
-        Loads cookies from a file and adds them to the current session.
-        Note: You must navigate to a page on the same domain before adding cookies.
+        Returns the saved cookie data, or None when it is missing or expired.
+        Files holding a bare cookie list (no metadata) are treated as expired.
         """
         if not os.path.exists(self.cookie_file):
             print(f"Cookie file not found at {self.cookie_file}.")
-            return
-
+            return None
         try:
             with open(self.cookie_file, 'r') as f:
-                cookies = json.load(f)
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Failed to read cookies: {e}")
+            return None
+        if not isinstance(data, dict) or time.time() >= data.get("expires_at", 0) - self._EXPIRY_MARGIN:
+            print("Saved cookies expired.")
+            return None
+        return data
 
+    def load_cookies(self):
+        """
+        Loads unexpired cookies from a file into the current session and opens the
+        page the login landed on. Returns True when cookies were loaded.
+        """
+        data = self.read_cookies()
+        if data is None:
+            return False
+        return self._apply_cookies(data)
+
+    def _apply_cookies(self, data):
+        """
+        Adds the cookies of saved data to the browser and opens the landing page.
+        Note: You must navigate to a page on the same domain before adding cookies.
+        """
+        try:
             # Before adding cookies, you must be on a page of the correct domain
             self.driver.get(self.url)
 
-            for cookie in cookies:
+            for cookie in data["cookies"]:
                 # Some cookies have a 'sameSite' key that Selenium's `add_cookie` doesn't support
                 if 'sameSite' in cookie:
                     del cookie['sameSite']
                 self.driver.add_cookie(cookie)
 
-            # Refresh the page to apply the cookies and authenticate the session
-            self.driver.refresh()
-            print("Cookies loaded and page refreshed.")
+            # Open the landing page with the cookies applied to authenticate the session
+            self.driver.get(data.get("landing_url") or self.url)
+            self._wait_page_loaded()
+            print("Cookies loaded and landing page opened.")
+            return True
 
         except Exception as e:
             print(f"Failed to load cookies: {e}")
+            return False
@@ -0,0 +1,94 @@
+import re
+
+# Returns every row of the table as [row element, [cell texts], is header],
+# so the whole table costs one WebDriver round trip.
+CAPTURE_SCRIPT = """
+var table = document.querySelector(arguments[0]);
+if (!table) { return null; }
+var rows = [];
+for (var i = 0; i < table.rows.length; i++) {
+    var row = table.rows[i];
+    var texts = [];
+    for (var j = 0; j < row.cells.length; j++) {
+        texts.push((row.cells[j].innerText || row.cells[j].textContent || '').trim());
+    }
+    var header = row.parentElement.tagName === 'THEAD' || row.querySelector('td') === null;
+    rows.push([row, texts, header]);
+}
+return rows;
+"""
+
+_NUMBER = re.compile(r"-?\d+(?:\.\d+)?")
+
+
+class TableSnapshot:
+    """
+    Indexed, read-only copy of an HTML table taken with one execute_script call.
+
+    Cell texts are indexed by column (position or header text) and by value
+    when the snapshot is built, so row and column lookups never go back to
+    the browser. The row WebElements are kept for clicking row actions.
+    """
+
+    def __init__(self, rows):
+        self.header = []
+        self.rows = []
+        self._elements = []
+        self._header_rows = 0
+        for element, texts, is_header in rows:
+            if is_header:
+                self._header_rows += 1
+                self.header = self.header or list(texts)
+                continue
+            self.rows.append(list(texts))
+            self._elements.append(element)
+        self._columns = {name: index for index, name in enumerate(self.header)}
+        self._by_text = {}
+        for index, texts in enumerate(self.rows):
+            for text in set(texts):
+                self._by_text.setdefault(text, []).append(index)
+
+    @classmethod
+    def capture(cls, driver, selector="#employeesTable"):
+        """Reads the whole table in one round trip; an absent table is empty."""
+        return cls(driver.execute_script(CAPTURE_SCRIPT, selector) or [])
+
+    def __len__(self):
+        return len(self.rows)
+
+    @property
+    def total_rows(self):
+        """Rows including the header, i.e. every tr of the table."""
+        return len(self.rows) + self._header_rows
+
+    def column_index(self, column):
+        return self._columns[column] if isinstance(column, str) else column
+
+    def column(self, column):
+        """Texts of a column, by header text or position, for every body row."""
+        index = self.column_index(column)
+        return [texts[index] for texts in self.rows if index < len(texts)]
+
+    def row(self, index):
+        """A body row as a dict keyed by header text (by position without a header)."""
+        texts = self.rows[index]
+        names = self.header or range(len(texts))
+        return dict(zip(names, texts))
+
+    def find(self, text):
+        """Indexes of the body rows having a cell with exactly this text."""
+        return list(self._by_text.get(text, ()))
+
+    def matching(self, predicate):
+        """Indexes of the body rows having a cell for which predicate(text) is true."""
+        return sorted({index for text, indexes in self._by_text.items() if predicate(text) for index in indexes})
+
+    def element(self, index):
+        """The tr WebElement of a body row."""
+        return self._elements[index]
+
+    def number(self, index, column):
+        """A cell parsed as a number, currency signs and separators ignored."""
+        text = self.rows[index][self.column_index(column)].replace(",", "")
+        match = _NUMBER.search(text)
+        return float(match.group()) if match else None
@@ -0,0 +1,122 @@
+"""
+Pytest plugin running the UI suite in parallel with pytest-xdist.
+
+    pytest -n auto
+    pytest -n 4 --browser-profile lean
+
+Each worker is its own process, so it gets its own driver_pool and browsers;
+only the saved login cookies are shared, behind their file lock. Employees
+created through the UI are named by the worker_names fixture, so a test
+counts its own rows instead of the whole table and workers never see each
+other's changes.
+
+Unless --dist is given, -n runs with --dist loadgroup and every test gets an
+xdist_group from the session resources its fixtures start (browser, api).
+Tests needing none of them form one group; the others are cut in one
+contiguous group per worker for each resource set, so a worker only starts
+what its groups use and keeps reusing it, and every worker has work.
+"""
+import itertools
+import os
+import re
+
+import pytest
+
+# Fixtures that start an expensive per worker resource, by resource
+RESOURCES = {
+    "browser": ("driver", "driver_pool"),
+    "api": ("api_client", "seed_employees", "seeded_employee", "worker_names"),
+}
+LOCAL_GROUP = "local"
+
+# The employee form rejects digits and punctuation in names
+_DIGITS_AS_LETTERS = str.maketrans("0123456789", "abcdefghij")
+
+
+def _letters(text):
+    return re.sub(r"[^A-Za-z]", "", str(text).translate(_DIGITS_AS_LETTERS))
+
+
+class WorkerNames:
+    """
+    Employee names owned by one worker and session: "<prefix><base><n>".
+
+    The prefix comes from the DataNamespace of the worker, written with
+    letters only so the form accepts it, and every call returns a new name.
+    Tests look their rows up by these names, so rows added or removed by
+    other workers at the same time do not change their assertions.
+    """
+
+    def __init__(self, namespace):
+        self.prefix = _letters(namespace.worker_id + namespace.token)
+        self._counter = itertools.count()
+
+    def __call__(self, base=""):
+        return f"{self.prefix}{_letters(base)}{_letters(next(self._counter))}"
+
+    def owns(self, name):
+        return isinstance(name, str) and name.startswith(self.prefix)
+
+    def filter(self, employees):
+        """Keeps the employee dicts with a first or last name of this worker."""
+        return [employee for employee in employees
+                if self.owns(employee.get("firstName")) or self.owns(employee.get("lastName"))]
+
+
+def worker_count():
+    """Number of xdist workers of the run, 1 outside of xdist."""
+    return int(os.environ.get("PYTEST_XDIST_WORKER_COUNT", 1))
+
+
+def fixture_signature(fixturenames):
+    """Name of the resource set a test needs, e.g. "browser+api", or "local"."""
+    needs = [resource for resource, fixtures in RESOURCES.items()
+             if any(fixture in fixturenames for fixture in fixtures)]
+    return "+".join(needs) or LOCAL_GROUP
+
+
+def assign_groups(items, workers):
+    """
+    Marks every item without an explicit xdist_group with "<signature>-<chunk>",
+    keeping the collection order inside a chunk.
+    """
+    by_signature = {}
+    for item in items:
+        if item.get_closest_marker("xdist_group") is None:
+            by_signature.setdefault(fixture_signature(item.fixturenames), []).append(item)
+    for signature, group in by_signature.items():
+        chunks = 1 if signature == LOCAL_GROUP else min(workers, len(group))
+        for index, item in enumerate(group):
+            item.add_marker(pytest.mark.xdist_group(f"{signature}-{index * chunks // len(group)}"))
+
+
+@pytest.fixture(scope="session")
+def worker_names(ui_namespace, api_client, api_cleanup):
+    """
+    Names of the employees this worker creates through the UI.
+    Employees left with one of them are deleted when the session ends.
+    """
+    names = WorkerNames(ui_namespace)
+    yield names
+    response = api_client.get_all_employees(use_cache=False)
+    if response.ok:
+        for employee in names.filter(response.json()):
+            api_cleanup.release(api_cleanup.register(employee["id"]))
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_cmdline_main(config):
+    # Runs before pytest-xdist turns the default "no" into "load"
+    if config.getoption("numprocesses", None) and config.getoption("dist", "no") == "no":
+        config.option.dist = "loadgroup"
+        # Workers parse the command line again and pytest-xdist sets their
+        # loadgroup option from the --dist they see, so they need it as well
+        os.environ["PYTEST_ADDOPTS"] = f"{os.environ.get('PYTEST_ADDOPTS', '')} --dist=loadgroup".strip()
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(config, items):
+    # Before pytest-xdist appends the group names to the node ids
+    workers = worker_count()
+    if workers > 1 and getattr(config.option, "loadgroup", False):
+        assign_groups(items, workers)
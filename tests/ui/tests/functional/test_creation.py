@@ -1,9 +1,4 @@
-import time
-
 import pytest
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
 
 from pages.login import LoginPage
 from pages.benefits import BenefitsPage
@@ -12,52 +7,35 @@ from pages.benefits import BenefitsPage
 class TestCreation:
 
     @pytest.fixture
-    def setup_and_teardown(self):
-        """
-        Pytest fixture to set up and tear down the WebDriver.
-        It returns a WebDriver instance for the test to use.
-        """
-        driver = None
-        try:
-            service = Service(ChromeDriverManager().install())
-            driver = webdriver.Chrome(service=service)
-            yield driver
-        finally:
-            if driver:
-                driver.quit()
-
-    @pytest.fixture
-    def logged_in_session(self, setup_and_teardown):
+    def logged_in_session(self, driver):
         """
-        Pytest fixture to perform login and save cookies for later use.
-        It depends on the setup_and_teardown fixture.
+        Pytest fixture to authenticate the session, reusing saved cookies when valid.
+        It depends on the driver fixture, which leases a pooled browser.
         """
-        driver = setup_and_teardown
         login_page = LoginPage(driver)
 
-        # Perform login and save the cookies
-        print("\n[Fixture] Logging in and saving cookies...")
-        login_page.login("TestUser788", "L?}'5miB/n]9")
-        login_page.save_cookies()
-        time.sleep(3)  # Wait for page to fully load
+        # Log in through the form only when there are no valid saved cookies
+        print("\n[Fixture] Logging in...")
+        login_page.ensure_logged_in("TestUser788", "L?}'5miB/n]9")
 
         # This fixture yields the driver, keeping the session active for the test
         yield driver
 
-    def test_single_creation_shall_create_one_element(self, logged_in_session):
+    def test_single_creation_shall_create_one_element(self, logged_in_session, worker_names):
         driver = logged_in_session
         benefits_p = BenefitsPage(driver)
-        prev_rows = benefits_p.get_number_of_rows()
-        benefits_p.add_employee("first", "last", "0", verify=True)
-        assert (prev_rows + 1) == benefits_p.get_number_of_rows()
+        # Only rows with this worker's name are counted, other workers may add rows meanwhile
+        first_name = worker_names("first")
+        benefits_p.add_employee(first_name, "last", "0", verify=True)
+        assert 1 == benefits_p.count_employees(first_name)
 
-    def test_duplicate_creation_shall_create_two_elements(self, logged_in_session):
+    def test_duplicate_creation_shall_create_two_elements(self, logged_in_session, worker_names):
         driver = logged_in_session
         benefits_p = BenefitsPage(driver)
-        prev_rows = benefits_p.get_number_of_rows()
-        benefits_p.add_employee("first", "last", "0", verify=True)
-        benefits_p.add_employee("first", "last", "0", verify=True)
-        assert (prev_rows + 2) == benefits_p.get_number_of_rows()
+        first_name = worker_names("first")
+        benefits_p.add_employee(first_name, "last", "0", verify=True)
+        benefits_p.add_employee(first_name, "last", "0", verify=True)
+        assert 2 == benefits_p.count_employees(first_name)
 
     def test_creation_header_content_shall_be_properly_set(self, logged_in_session):
         driver = logged_in_session
@@ -80,17 +58,17 @@ class TestCreation:
         ("!!!! 1111"),
         ("         invalid"),
     ])
-    def test_creation_invalid_first_name_shall_not_create(self, logged_in_session, invalid_name):
+    def test_creation_invalid_first_name_shall_not_create(self, logged_in_session, worker_names, invalid_name):
         driver = logged_in_session
 
         benefits_p = BenefitsPage(driver)
 
-        prev_rows = benefits_p.get_number_of_rows()
+        last_name = worker_names("lname")
         benefits_p.click_add_employee()
-        benefits_p.fill_up_add_employee_form(0, invalid_name, "lname")
+        benefits_p.fill_up_add_employee_form(0, invalid_name, last_name)
         benefits_p.save_add_form(True)
 
-        assert prev_rows == benefits_p.get_number_of_rows()
+        assert 0 == benefits_p.count_employees(last_name)
 
     @pytest.mark.parametrize("oor_ch", [
         "",
@@ -113,17 +91,17 @@ class TestCreation:
         ("!!!! 1111"),
         ("         invalid"),
     ])
-    def test_creation_invalid_last_name_shall_not_create(self, logged_in_session, invalid_name):
+    def test_creation_invalid_last_name_shall_not_create(self, logged_in_session, worker_names, invalid_name):
         driver = logged_in_session
 
         benefits_p = BenefitsPage(driver)
 
-        prev_rows = benefits_p.get_number_of_rows()
+        last_name = worker_names("lname")
         benefits_p.click_add_employee()
-        benefits_p.fill_up_add_employee_form(0, invalid_name, "lname")
+        benefits_p.fill_up_add_employee_form(0, invalid_name, last_name)
         benefits_p.save_add_form(True)
 
-        assert prev_rows == benefits_p.get_number_of_rows()
+        assert 0 == benefits_p.count_employees(last_name)
 
     @pytest.mark.parametrize("oor_ch", [
         "",
@@ -148,17 +126,17 @@ class TestCreation:
         ("0xa"),
         ("1asd2"),
     ])
-    def test_creation_invalid_dependants_shall_not_create(self, logged_in_session, invalid_deps):
+    def test_creation_invalid_dependants_shall_not_create(self, logged_in_session, worker_names, invalid_deps):
         driver = logged_in_session
 
         benefits_p = BenefitsPage(driver)
 
-        prev_rows = benefits_p.get_number_of_rows()
+        first_name = worker_names("fname")
         benefits_p.click_add_employee()
-        benefits_p.fill_up_add_employee_form(invalid_deps, "fname", "lname")
+        benefits_p.fill_up_add_employee_form(invalid_deps, first_name, "lname")
         benefits_p.save_add_form(True)
 
-        assert prev_rows == benefits_p.get_number_of_rows()
+        assert 0 == benefits_p.count_employees(first_name)
 
     @pytest.mark.parametrize("oor_ch", [
         -1,
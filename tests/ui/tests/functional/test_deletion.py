@@ -1,9 +1,4 @@
-import time
-
 import pytest
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
 
 from pages.benefits import BenefitsPage
 from pages.login import LoginPage
@@ -11,67 +6,47 @@ from pages.login import LoginPage
 
 class TestDeletion:
 
-    @pytest.fixture
-    def setup_and_teardown(self):
-        """
-        Pytest fixture to set up and tear down the WebDriver.
-        It returns a WebDriver instance for the test to use.
-        """
-        driver = None
-        try:
-            service = Service(ChromeDriverManager().install())
-            driver = webdriver.Chrome(service=service)
-            yield driver
-        finally:
-            if driver:
-                driver.quit()
-
     @pytest.fixture(scope="function")
-    def logged_in_session(self, setup_and_teardown):
+    def logged_in_session(self, driver, seeded_employee):
         """
-        Pytest fixture to perform login and save cookies for later use.
-        It depends on the setup_and_teardown fixture.
+        Pytest fixture to authenticate the session, reusing saved cookies when valid.
+        The employee under test is seeded through the API before the dashboard loads.
         """
-        driver = setup_and_teardown
         login_page = LoginPage(driver)
 
-        login_page.login("TestUser788", "L?}'5miB/n]9")
-        login_page.save_cookies()
-        time.sleep(3)  # Wait for page to fully load
+        login_page.ensure_logged_in("TestUser788", "L?}'5miB/n]9")
         benefits_p = BenefitsPage(driver)
-        benefits_p.add_employee("first", "last", "0", verify=True)
-        time.sleep(3)
+        benefits_p.get_existing_employee_from_table(seeded_employee["id"])
         # This fixture yields the driver, keeping the session active for the test
         yield driver
 
-    def test_single_deletion_shall_remove_one_element(self, logged_in_session):
+    def test_single_deletion_shall_remove_one_element(self, logged_in_session, seeded_employee, api_client):
         driver = logged_in_session
         benefits_p = BenefitsPage(driver)
-        employees_ids = benefits_p.get_column_texts(0)[1:]
-        to_remove_id = employees_ids[-1]
+        to_remove_id = seeded_employee["id"]
         benefits_p.delete_employee(to_remove_id, verify=True)
-        updated_employees_ids = benefits_p.get_column_texts(0)[1:]
-        assert to_remove_id not in updated_employees_ids
+        assert not benefits_p.get_table_snapshot().find(to_remove_id)
+        assert 404 == api_client.get_employee_by_id(to_remove_id, use_cache=False).status_code
 
-    def test_cancel_deletion_shall_keep_all_elements(self, logged_in_session):
+    def test_cancel_deletion_shall_keep_all_elements(self, logged_in_session, seeded_employee, worker_names):
         driver = logged_in_session
         benefits_p = BenefitsPage(driver)
-        employees_ids = benefits_p.get_column_texts(0)[1:]
-        to_remove_id = employees_ids[-1]
+        # Only this worker's rows, the ones other workers own may change meanwhile
+        employees_ids = benefits_p.get_employee_ids(worker_names)
+        to_remove_id = seeded_employee["id"]
         employee_row = benefits_p.get_existing_employee_from_table(
             to_remove_id)
         benefits_p.click_delete_button(employee_row)
         benefits_p.cancel_deletion()
-        time.sleep(5)
-        updated_employees_ids = benefits_p.get_column_texts(0)[1:]
+        updated_employees_ids = benefits_p.get_employee_ids(worker_names)
+        assert to_remove_id in employees_ids
         assert len(employees_ids) == len(updated_employees_ids)
         assert set(employees_ids) == set(updated_employees_ids)
 
-    def test_creation_header_content_shall_be_properly_set(self, logged_in_session):
+    def test_creation_header_content_shall_be_properly_set(self, logged_in_session, seeded_employee):
         driver = logged_in_session
         benefits_p = BenefitsPage(driver)
-        employees_ids = benefits_p.get_column_texts(0)[1:]
-        to_remove_id = employees_ids[-1]
+        to_remove_id = seeded_employee["id"]
         employee_row = benefits_p.get_existing_employee_from_table(
             to_remove_id)
         benefits_p.click_delete_button(employee_row)
@@ -1,9 +1,4 @@
-import time
-
 import pytest
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
 
 from pages.benefits import BenefitsPage
 from pages.login import LoginPage
@@ -12,51 +7,32 @@ from pages.login import LoginPage
 class TestUpdate:
 
     @pytest.fixture
-    def setup_and_teardown(self):
-        """
-        Pytest fixture to set up and tear down the WebDriver.
-        It returns a WebDriver instance for the test to use.
-        """
-        driver = None
-        try:
-            service = Service(ChromeDriverManager().install())
-            driver = webdriver.Chrome(service=service)
-            yield driver
-        finally:
-            if driver:
-                driver.quit()
-
-    @pytest.fixture
-    def logged_in_session(self, setup_and_teardown):
+    def logged_in_session(self, driver, seeded_employee):
         """
-        Pytest fixture to perform login and save cookies for later use.
-        It depends on the setup_and_teardown fixture.
+        Pytest fixture to authenticate the session, reusing saved cookies when valid.
+        The employee under test is seeded through the API before the dashboard loads.
         """
-        driver = setup_and_teardown
         login_page = LoginPage(driver)
 
-        login_page.login("TestUser788", "L?}'5miB/n]9")
-        login_page.save_cookies()
-        time.sleep(3)  # Wait for page to fully load
+        login_page.ensure_logged_in("TestUser788", "L?}'5miB/n]9")
         benefits_p = BenefitsPage(driver)
-        benefits_p.add_employee("first", "last", "0", verify=True)
-        time.sleep(3)
+        benefits_p.get_existing_employee_from_table(seeded_employee["id"])
         # This fixture yields the driver, keeping the session active for the test
         yield driver
 
-    def test_single_update_shall_update_one_element(self, logged_in_session):
+    def test_single_update_shall_update_one_element(self, logged_in_session, seeded_employee, api_client):
         driver = logged_in_session
         benefits_p = BenefitsPage(driver)
-        employees_ids = benefits_p.get_column_texts(0)[1:]
-        to_update_id = employees_ids[-1]
+        to_update_id = seeded_employee["id"]
         benefits_p.edit_employee(
             to_update_id, "newfname", "newlname", 1, validate=True)
+        stored = api_client.get_employee_by_id(to_update_id, use_cache=False).json()
+        assert ("newfname", "newlname", 1) == (stored["firstName"], stored["lastName"], stored["dependants"])
 
-    def test_creation_header_content_shall_be_properly_set(self, logged_in_session):
+    def test_creation_header_content_shall_be_properly_set(self, logged_in_session, seeded_employee):
         driver = logged_in_session
         benefits_p = BenefitsPage(driver)
-        employees_ids = benefits_p.get_column_texts(0)[1:]
-        to_update_id = employees_ids[-1]
+        to_update_id = seeded_employee["id"]
         employee_row = benefits_p.get_existing_employee_from_table(
             to_update_id)
         benefits_p.click_edit_button(employee_row)
@@ -1,9 +1,4 @@
-import time
-
 import pytest
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
 
 from pages.benefits import BenefitsPage
 from pages.login import LoginPage
@@ -12,32 +7,14 @@ from pages.login import LoginPage
 class TestNonFunctional:
 
     @pytest.fixture
-    def setup_and_teardown(self):
-        """
-        Pytest fixture to set up and tear down the WebDriver.
-        It returns a WebDriver instance for the test to use.
-        """
-        driver = None
-        try:
-            service = Service(ChromeDriverManager().install())
-            driver = webdriver.Chrome(service=service)
-            yield driver
-        finally:
-            if driver:
-                driver.quit()
-
-    @pytest.fixture
-    def logged_in_session(self, setup_and_teardown):
+    def logged_in_session(self, driver):
         """
-        Pytest fixture to perform login and save cookies for later use.
-        It depends on the setup_and_teardown fixture.
+        Pytest fixture to authenticate the session, reusing saved cookies when valid.
+        It depends on the driver fixture, which leases a pooled browser.
         """
-        driver = setup_and_teardown
         login_page = LoginPage(driver)
 
-        login_page.login("TestUser788", "L?}'5miB/n]9")
-        login_page.save_cookies()
-        time.sleep(3)  # Wait for page to fully load
+        login_page.ensure_logged_in("TestUser788", "L?}'5miB/n]9")
 
         # This fixture yields the driver, keeping the session active for the test
         yield driver
@@ -0,0 +1,90 @@
+import pytest
+from selenium.common.exceptions import WebDriverException
+
+from drivers.pool import DriverPool, DriverPoolError
+
+
+class FakeDriver:
+    """Records the calls the pool makes; `broken` makes every call fail."""
+
+    def __init__(self):
+        self.calls = []
+        self.broken = False
+        self.quit_called = False
+
+    def _call(self, name):
+        if self.broken:
+            raise WebDriverException("session deleted")
+        self.calls.append(name)
+
+    @property
+    def current_url(self):
+        self._call("current_url")
+        return "about:blank"
+
+    def execute_script(self, script):
+        self._call("execute_script")
+
+    def delete_all_cookies(self):
+        self._call("delete_all_cookies")
+
+    def get(self, url):
+        self._call(f"get {url}")
+
+    def get_log(self, kind):
+        self._call(f"get_log {kind}")
+        return []
+
+    def quit(self):
+        self.quit_called = True
+
+
+class TestDriverPool:
+
+    @pytest.fixture
+    def started(self):
+        return []
+
+    @pytest.fixture
+    def pool(self, started):
+        def factory():
+            started.append(FakeDriver())
+            return started[-1]
+
+        pool = DriverPool(size=2, factory=factory, timeout=0.1)
+        yield pool
+        pool.close()
+
+    def test_sessions_shall_be_reused_after_reset(self, pool, started):
+        with pool.lease() as first:
+            pass
+        with pool.lease() as second:
+            pass
+        assert first is second
+        assert len(started) == 1
+        assert ["execute_script", "delete_all_cookies", "get about:blank",
+                "get_log browser"] == first.calls[:4]
+
+    def test_pool_size_shall_bound_sessions(self, pool, started):
+        with pool.lease(), pool.lease():
+            with pytest.raises(DriverPoolError):
+                pool.acquire()
+        assert len(started) == 2
+
+    def test_unhealthy_session_shall_be_replaced(self, pool, started):
+        with pool.lease() as first:
+            pass
+        first.broken = True
+        with pool.lease() as second:
+            pass
+        assert second is not first
+        assert first.quit_called
+        assert len(started) == 2
+
+    def test_close_shall_quit_every_session(self, pool, started):
+        with pool.lease():
+            pass
+        pool.close()
+        assert all(driver.quit_called for driver in started)
+        with pytest.raises(DriverPoolError):
+            pool.acquire()
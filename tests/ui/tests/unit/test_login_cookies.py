@@ -0,0 +1,119 @@
+import json
+import time
+from contextlib import contextmanager
+
+import pytest
+
+from pages.login import LoginPage
+
+LOGIN_URL = "https://example.test/Prod/Account/Login"
+LANDING_URL = "https://example.test/Prod/Benefits"
+
+
+class FakeDriver:
+    """Keeps cookies and the current URL; unauthenticated visits land on the login form."""
+
+    def __init__(self, cookies=None):
+        self.cookies = []
+        self.server_cookies = cookies or []
+        self.current_url = "about:blank"
+        self.visits = []
+
+    def get(self, url):
+        self.visits.append(url)
+        authenticated = any(c["name"] == "session" for c in self.cookies)
+        self.current_url = url if authenticated or url == LOGIN_URL else LOGIN_URL + "?ReturnUrl=x"
+
+    def add_cookie(self, cookie):
+        self.cookies.append(cookie)
+
+    def get_cookies(self):
+        return list(self.server_cookies)
+
+    def execute_script(self, script):
+        return "complete"
+
+
+class TestLoginCookies:
+
+    @pytest.fixture
+    def cookie_file(self, tmp_path):
+        return str(tmp_path / "cookies.json")
+
+    def login_page(self, driver, cookie_file, logins):
+        page = LoginPage(driver, url=LOGIN_URL, cookie_file=cookie_file)
+
+        def login(username, password):
+            logins.append(username)
+            driver.cookies = list(driver.server_cookies)
+            driver.current_url = LANDING_URL
+
+        page.login = login
+        return page
+
+    def test_login_form_shall_run_only_once(self, cookie_file):
+        logins = []
+        session = [{"name": "session", "value": "abc", "sameSite": "Lax"}]
+        first = self.login_page(FakeDriver(session), cookie_file, logins)
+        first.ensure_logged_in("user", "password")
+        second_driver = FakeDriver(session)
+        self.login_page(second_driver, cookie_file, logins).ensure_logged_in("user", "password")
+        assert logins == ["user"]
+        assert second_driver.current_url == LANDING_URL
+        assert "sameSite" not in second_driver.cookies[0]
+
+    def test_saved_cookies_shall_carry_expiry_metadata(self, cookie_file):
+        expiry = int(time.time()) + 300
+        driver = FakeDriver([{"name": "session", "value": "abc", "expiry": expiry}])
+        self.login_page(driver, cookie_file, []).ensure_logged_in("user", "password")
+        with open(cookie_file) as f:
+            data = json.load(f)
+        assert data["expires_at"] == expiry
+        assert data["landing_url"] == LANDING_URL
+
+    def test_expired_cookies_shall_log_in_again(self, cookie_file):
+        logins = []
+        expired = [{"name": "session", "value": "abc", "expiry": int(time.time()) + 30}]
+        self.login_page(FakeDriver(expired), cookie_file, logins).ensure_logged_in("user", "password")
+        self.login_page(FakeDriver(expired), cookie_file, logins).ensure_logged_in("user", "password")
+        assert logins == ["user", "user"]
+
+    def test_rejected_cookies_shall_log_in_again(self, cookie_file):
+        logins = []
+        self.login_page(FakeDriver([{"name": "session", "value": "abc"}]), cookie_file, logins) \
+            .ensure_logged_in("user", "password")
+        # The server no longer knows the session: the landing page redirects to the form
+        rejected = FakeDriver([{"name": "other", "value": "abc"}])
+        page = self.login_page(rejected, cookie_file, logins)
+        rejected.get = lambda url: setattr(rejected, "current_url", LOGIN_URL)
+        page.ensure_logged_in("user", "password")
+        assert logins == ["user", "user"]
+
+    def test_valid_cookies_shall_not_take_the_lock(self, cookie_file):
+        logins = []
+        session = [{"name": "session", "value": "abc"}]
+        self.login_page(FakeDriver(session), cookie_file, logins).ensure_logged_in("user", "password")
+        page = self.login_page(FakeDriver(session), cookie_file, logins)
+        page._cookie_lock = lambda: pytest.fail("the lock was taken")
+        page.ensure_logged_in("user", "password")
+        assert logins == ["user"]
+
+    def test_waiting_worker_shall_reuse_the_login_it_waited_for(self, cookie_file):
+        logins = []
+        session = [{"name": "session", "value": "abc"}]
+        other_worker = self.login_page(FakeDriver(session), cookie_file, [])
+        page = self.login_page(FakeDriver(session), cookie_file, logins)
+        lock = page._cookie_lock
+
+        @contextmanager
+        def lock_after_other_login():
+            # The other worker logged in while this one waited for the lock
+            other_worker.login("other", "password")
+            other_worker.save_cookies()
+            with lock():
+                yield
+
+        page._cookie_lock = lock_after_other_login
+        page.ensure_logged_in("user", "password")
+        assert logins == []
+        assert page.driver.current_url == LANDING_URL
@@ -0,0 +1,53 @@
+import pytest
+from selenium.common.exceptions import TimeoutException
+
+from drivers.waits import INSTALL_SCRIPT, READ_SCRIPT, PageActivity
+
+
+class FakeDriver:
+    """Serves scripted activity states, one per read; the last one repeats."""
+
+    def __init__(self, states):
+        self.states = list(states)
+        self.installs = 0
+
+    def execute_script(self, script, *args):
+        if script == INSTALL_SCRIPT:
+            self.installs += 1
+            return None
+        assert script == READ_SCRIPT
+        return self.states.pop(0) if len(self.states) > 1 else self.states[0]
+
+
+def state(started=0, pending=0, version=0, idle_ms=1000):
+    return {"started": started, "pending": pending, "version": version, "idle_ms": idle_ms}
+
+
+class TestPageActivity:
+
+    def activity(self, driver, **kwargs):
+        kwargs.setdefault("timeout", 1)
+        return PageActivity(driver, "#employeesTable", quiet_period=0.2, request_grace=0.3, **kwargs)
+
+    def test_wait_shall_end_when_requests_and_table_settle(self):
+        driver = FakeDriver([state(), state(1, 1, 0, 0), state(1, 0, 2, 50), state(1, 0, 3, 250)])
+        activity = self.activity(driver)
+        before = activity.snapshot()
+        activity.wait_settled(before, expect_change=True)
+        assert driver.states == [state(1, 0, 3, 250)]
+
+    def test_page_without_instrumentation_shall_be_instrumented(self):
+        driver = FakeDriver([None, state()])
+        self.activity(driver).snapshot()
+        assert driver.installs == 1
+
+    def test_missing_rerender_shall_time_out(self):
+        driver = FakeDriver([state(), state(1, 0, 0, 1000)])
+        activity = self.activity(driver, timeout=0.3)
+        with pytest.raises(TimeoutException):
+            activity.wait_settled(activity.snapshot(), expect_change=True)
+
+    def test_action_without_request_shall_settle_after_grace(self):
+        driver = FakeDriver([state()])
+        activity = self.activity(driver)
+        activity.wait_settled(activity.snapshot())
@@ -0,0 +1,59 @@
+import pytest
+
+from plugins.parallel import LOCAL_GROUP, WorkerNames, assign_groups, fixture_signature
+from src.api.namespace import DataNamespace
+
+
+class FakeItem:
+    def __init__(self, *fixturenames, group=None):
+        self.fixturenames = list(fixturenames)
+        self.markers = [pytest.mark.xdist_group(group).mark] if group else []
+
+    def get_closest_marker(self, name):
+        return next((mark for mark in self.markers if mark.name == name), None)
+
+    def add_marker(self, marker):
+        self.markers.append(marker.mark)
+
+    @property
+    def group(self):
+        return self.get_closest_marker("xdist_group").args[0]
+
+
+class TestWorkerNames:
+
+    def test_names_shall_be_letters_unique_and_owned(self):
+        names = WorkerNames(DataNamespace("gw1", "a0f9e2"))
+        first, second = names("first"), names("first")
+        assert "gwbaafjec" == names.prefix
+        assert first != second
+        assert first.isalpha() and second.isalpha()
+        assert names.owns(first)
+        assert not WorkerNames(DataNamespace("gw2", "a0f9e2")).owns(first)
+
+    def test_filter_shall_keep_own_employees(self):
+        names = WorkerNames(DataNamespace("gw0", "abcdef"))
+        own = {"firstName": "first", "lastName": names("last")}
+        other = {"firstName": "first", "lastName": "last"}
+        assert [own] == names.filter([own, other, {}])
+
+
+class TestScheduling:
+
+    def test_signature_shall_name_the_resources_needed(self):
+        assert "browser+api" == fixture_signature(["request", "driver", "seeded_employee"])
+        assert "browser" == fixture_signature(["driver"])
+        assert LOCAL_GROUP == fixture_signature(["tmp_path"])
+
+    def test_groups_shall_split_each_signature_per_worker(self):
+        browser = [FakeItem("driver") for _ in range(4)]
+        seeded = [FakeItem("driver", "seeded_employee") for _ in range(3)]
+        local = [FakeItem("tmp_path") for _ in range(5)]
+        pinned = FakeItem("driver", group="serial")
+
+        assign_groups(browser + seeded + local + [pinned], workers=2)
+
+        assert ["browser-0", "browser-0", "browser-1", "browser-1"] == [item.group for item in browser]
+        assert ["browser+api-0", "browser+api-0", "browser+api-1"] == [item.group for item in seeded]
+        assert {"local-0"} == {item.group for item in local}
+        assert "serial" == pinned.group
@@ -0,0 +1,32 @@
+import pytest
+
+from drivers.profiles import BACKGROUND_SWITCHES, PROFILES, chrome_options
+
+
+class TestProfiles:
+
+    def test_headed_profile_shall_keep_chrome_defaults(self):
+        options = chrome_options("headed")
+        assert [] == options.arguments
+        assert {} == options.experimental_options
+
+    def test_lean_profile_shall_disable_everything_optional(self):
+        options = chrome_options(PROFILES["lean"])
+        for argument in ("--headless=new", "--window-size=1024,768", "--blink-settings=imagesEnabled=false",
+                         "--disable-remote-fonts", "--disable-extensions") + BACKGROUND_SWITCHES:
+            assert argument in options.arguments
+        # Hidden renderers stay throttled, they would do more work otherwise
+        for argument in ("--disable-renderer-backgrounding", "--disable-backgrounding-occluded-windows",
+                         "--disable-background-timer-throttling"):
+            assert argument not in options.arguments
+        assert 2 == options.experimental_options["prefs"]["profile.managed_default_content_settings.images"]
+
+    def test_headless_profile_shall_still_load_assets(self):
+        options = chrome_options("headless")
+        assert "--headless=new" in options.arguments
+        assert "--blink-settings=imagesEnabled=false" not in options.arguments
+        assert "--disable-remote-fonts" not in options.arguments
+
+    def test_unknown_profile_shall_raise(self):
+        with pytest.raises(ValueError):
+            chrome_options("turbo")
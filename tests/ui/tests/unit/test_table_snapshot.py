@@ -0,0 +1,53 @@
+from pages.table import CAPTURE_SCRIPT, TableSnapshot
+
+HEADER = ["Id", "Last Name", "First Name", "Dependents", "Salary", "Gross Pay", "Benefits Cost",
+          "Net Pay", "Actions"]
+
+
+def employee_row(employee_id, first, dependants, cost):
+    return [f"tr-{employee_id}", [employee_id, "last", first, str(dependants), "52000.00", "2000.00",
+                                  cost, "1961.54", ""], False]
+
+
+class FakeDriver:
+    def __init__(self, rows):
+        self.rows = rows
+        self.calls = []
+
+    def execute_script(self, script, *args):
+        self.calls.append((script, args))
+        return self.rows
+
+
+class TestTableSnapshot:
+
+    def capture(self):
+        driver = FakeDriver([["tr-head", HEADER, True],
+                             employee_row("a1", "ann", 0, "38.46"),
+                             employee_row("b2", "bob", 2, "$1,076.92"),
+                             employee_row("c3", "ann", 1, "57.69")])
+        return driver, TableSnapshot.capture(driver)
+
+    def test_whole_table_shall_be_read_in_one_call(self):
+        driver, snapshot = self.capture()
+        assert [(CAPTURE_SCRIPT, ("#employeesTable",))] == driver.calls
+        assert 3 == len(snapshot)
+        assert 4 == snapshot.total_rows
+        assert HEADER == snapshot.header
+
+    def test_lookups_shall_use_indexes(self):
+        _, snapshot = self.capture()
+        assert ["a1", "b2", "c3"] == snapshot.column(0)
+        assert ["ann", "bob", "ann"] == snapshot.column("First Name")
+        assert [0, 2] == snapshot.find("ann")
+        assert [] == snapshot.find("missing")
+        assert [1, 2] == snapshot.matching(lambda text: text.startswith(("b", "c")))
+        assert "tr-b2" == snapshot.element(snapshot.find("b2")[0])
+        assert "2" == snapshot.row(1)["Dependents"]
+        assert 1076.92 == snapshot.number(1, "Benefits Cost")
+
+    def test_missing_table_shall_be_empty(self):
+        snapshot = TableSnapshot.capture(FakeDriver(None))
+        assert 0 == len(snapshot)
+        assert 0 == snapshot.total_rows
+        assert [] == snapshot.column(0)